@@ -0,0 +1,98 @@
+"""Import and startup time, measured in fresh interpreters, failing when it regresses
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --output import.json
+    python benchmarks/bench_import.py --baseline import.json --threshold 0.25
+    python benchmarks/bench_import.py --max-ms 'import pubg_client=200'
+
+Each statement runs ``--runs`` times in a new interpreter and the fastest run is kept, so the interpreter start up
+itself is not counted. The exit status is 1 when a statement is slower than its limit, or slower than the baseline
+by more than ``--threshold``. Without ``--max-ms`` the ``LIMITS`` below apply (``--no-limits`` turns them off): they
+sit just above the time measured on a development machine, so even the lightest heavy dependency imported eagerly
+(``pendulum``, about 50 ms) goes over; ``aiohttp``, ``numpy`` or the endpoint modules go far over. On a slower
+machine, pass limits measured there with ``--max-ms`` or compare against a ``--baseline``.
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+STATEMENTS = [
+    'import pubg_client',
+    'from pubg_client import Client; Client()',
+    'from pubg_client import Client; Client().api',
+    'from pubg_client import AsyncClient',
+]
+
+LIMITS = {
+    'import pubg_client': 180.0,
+    'from pubg_client import Client; Client()': 180.0,
+    'from pubg_client import Client; Client().api': 195.0,
+    'from pubg_client import AsyncClient': 380.0,
+}
+"""The default limits in milliseconds, for about 150-165 ms measured for ``import pubg_client`` (mostly ``requests``)
+and ``Client()``, 10 ms more for the endpoints and 170 ms more for ``aiohttp``"""
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(statement, runs):
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', TIMER.format(statement=statement)], check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--output', help='Write the results to this json file')
+    parser.add_argument('--baseline', help='Compare against the results in this json file')
+    parser.add_argument('--threshold', type=float, default=0.25, help='The slowdown that counts as a regression')
+    parser.add_argument('--max-ms', action='append', default=[], metavar='STATEMENT=MS',
+                        help='An absolute limit for a statement (repeatable), replacing the default limits')
+    parser.add_argument('--no-limits', action='store_true', help='Only compare against --baseline')
+    args = parser.parse_args()
+
+    limits = dict((statement, float(ms)) for statement, ms in (limit.rsplit('=', 1) for limit in args.max_ms))
+    if not limits and not args.no_limits:
+        limits = dict(LIMITS)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+    results, failures = {}, []
+    for statement in STATEMENTS:
+        ms = results[statement] = measure(statement, args.runs)
+        line = '{:48} {:8.1f} ms'.format(statement, ms)
+
+        if statement in baseline:
+            change = ms / baseline[statement] - 1
+            line += ' {:+7.1%}'.format(change)
+            if change > args.threshold:
+                failures.append(statement)
+                line += '  REGRESSION'
+        if statement in limits and ms > limits[statement]:
+            failures.append(statement)
+            line += '  OVER {:.1f} ms'.format(limits[statement])
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=2)
+
+    if failures:
+        print('\n{} regression(s): {}'.format(len(failures), ', '.join(sorted(set(failures)))))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
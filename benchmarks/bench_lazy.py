@@ -0,0 +1,37 @@
+"""Load time of a list of matches when only a couple of fields are read, with plain and lazy models
+
+    python benchmarks/bench_lazy.py --matches 500
+"""
+import argparse
+import time
+
+from pubg_client._jsonapi import Document
+from pubg_client.models import Match, lazy
+from pubg_client.testing.payloads import match_document
+
+
+def load_and_touch(model, payloads):
+    start = time.perf_counter()
+    for payload in payloads:
+        match = model.load(payload)
+        match.id, match.game_mode
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--matches', type=int, default=500)
+    args = parser.parse_args()
+
+    payloads = [Document(match_document('match-{}'.format(i), seed=i)).resolve() for i in range(args.matches)]
+
+    before = load_and_touch(Match, payloads)
+    after = load_and_touch(lazy(Match), payloads)
+
+    print('plain models: {:8.1f} ms'.format(before * 1000))
+    print('lazy models:  {:8.1f} ms'.format(after * 1000))
+    print('speedup:      {:8.1f}x'.format(before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Throughput and latency percentiles of a Client against the local mock api, per concurrency level
+
+    python benchmarks/bench_load.py
+    python benchmarks/bench_load.py --latency 0.05 --jitter 0.02 --concurrency 1 4 16 64 --pool-maxsize 64
+    python benchmarks/bench_load.py --error-rate 0.05 --retry --rate-limit 600 --output load.json
+
+Every concurrency level makes ``--calls`` requests for ``--endpoint`` over one client, so the pooled keep-alive
+connections, the retries and the rate limiting are exercised over real sockets.
+"""
+import argparse
+import json
+
+from pubg_client import Client, RateLimiter, RetryPolicy
+from pubg_client.testing import MockServer, run_load
+
+ENDPOINTS = {
+    'status': lambda server: lambda client, i: client.api.status(),
+    'match': lambda server: lambda client, i: client.api.match(server.match_ids[i % len(server.match_ids)]),
+    'matches': lambda server: lambda client, i: client.api.matches(),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--endpoint', choices=sorted(ENDPOINTS), default='match')
+    parser.add_argument('--calls', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--pool-maxsize', type=int, default=16)
+    parser.add_argument('--latency', type=float, default=0.01, help='Server latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.005, help='Extra random server latency in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=int, help='Server requests per minute, answered with 429 past it')
+    parser.add_argument('--client-rate-limit', action='store_true', help='Pace the client with a RateLimiter')
+    parser.add_argument('--retry', action='store_true', help='Retry failed requests with the default RetryPolicy')
+    parser.add_argument('--no-gzip', action='store_true')
+    parser.add_argument('--output', help='Write the reports to this json file')
+    args = parser.parse_args()
+
+    results = {}
+    with MockServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, rate_limit=args.rate_limit,
+                    gzip=not args.no_gzip) as server:
+        for concurrency in args.concurrency:
+            # Every level starts with the full server rate limit, so the reports are comparable
+            server.reset_rate_limit()
+            rate_limiter = RateLimiter(limit=args.rate_limit, period=60.0) if args.client_rate_limit and args.rate_limit else None
+            client = Client(base_url=server.url, pool_maxsize=args.pool_maxsize, rate_limiter=rate_limiter,
+                            retry_policy=RetryPolicy() if args.retry else None)
+            with client:
+                report = run_load(client, ENDPOINTS[args.endpoint](server), calls=args.calls, concurrency=concurrency)
+            results[concurrency] = report.as_dict()
+            print(report.summary())
+        results['server'] = dict((str(status), count) for status, count in server.requests.items())
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
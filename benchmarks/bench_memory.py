@@ -0,0 +1,41 @@
+"""Bytes per loaded match with the plain and the compact (``__slots__``) model classes
+
+    python benchmarks/bench_memory.py --matches 200
+"""
+import argparse
+import gc
+import tracemalloc
+
+from pubg_client._jsonapi import Document
+from pubg_client.models import Match, compact
+from pubg_client.testing.payloads import match_document
+
+
+def bytes_per_match(model, payloads):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    matches = [model.load(payload) for payload in payloads]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del matches
+    return (after - before) / len(payloads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--matches', type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = [Document(match_document('match-{}'.format(i), seed=i)).resolve() for i in range(args.matches)]
+
+    before = bytes_per_match(Match, payloads)
+    after = bytes_per_match(compact(Match), payloads)
+
+    print('plain models:   {:12,.0f} bytes/match'.format(before))
+    print('compact models: {:12,.0f} bytes/match'.format(after))
+    print('saved:          {:12.1%}'.format(1 - after / before))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Throughput of process-pool batch deserialization (``load_many``) per worker count and chunk size
+
+    python benchmarks/bench_parallel.py
+    python benchmarks/bench_parallel.py --bodies 2000 --workers 0 1 2 4 8 --chunksize 8 32
+
+Worker count 0 loads the bodies in this process, as the baseline. Every combination is timed ``--repeat`` times
+(with a warmed up pool, so the process start up is not counted) and the fastest run is kept.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+from pubg_client import load_many
+from pubg_client.models import Match
+from pubg_client.testing.payloads import match_document
+
+
+def bodies(n):
+    return [json.dumps(match_document('match-{}'.format(i), seed=i)).encode('utf-8') for i in range(n)]
+
+
+def measure(raw, workers, chunksize, export, repeat):
+    def run(executor):
+        start = time.perf_counter()
+        for _ in load_many(raw, Match, chunksize=chunksize, max_workers=workers, export=export, executor=executor):
+            pass
+        return time.perf_counter() - start
+
+    if not workers:
+        return min(run(None) for _ in range(repeat))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(abs, range(workers * 4)))
+        return min(run(executor) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bodies', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2, 4, os.cpu_count()])
+    parser.add_argument('--chunksize', type=int, nargs='+', default=[4, 16, 64])
+    parser.add_argument('--export', action='store_true', help='Return exported dictionaries instead of models')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    raw = bodies(args.bodies)
+    print('{} bodies, {:.1f} MB, {} cores'.format(len(raw), sum(map(len, raw)) / 1e6, os.cpu_count()))
+    print('{:>8} {:>10} {:>12} {:>8}'.format('workers', 'chunksize', 'bodies/s', 'speedup'))
+
+    baseline = None
+    for workers in sorted(set(args.workers)):
+        for chunksize in args.chunksize if workers else args.chunksize[:1]:
+            rate = len(raw) / measure(raw, workers, chunksize, args.export, args.repeat)
+            baseline = baseline or rate
+            print('{:>8} {:>10} {:>12.0f} {:>7.2f}x'.format(workers, chunksize, rate, rate / baseline))
+
+
+if __name__ == '__main__':
+    main()
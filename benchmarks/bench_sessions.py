@@ -0,0 +1,73 @@
+"""Requests per second with a new session per request versus the pooled client sessions
+
+Runs against a local keep-alive HTTP server, so the numbers measure connection handling rather than the network::
+
+    python benchmarks/bench_sessions.py --requests 500
+"""
+import argparse
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from pubg_client import Client
+
+STATUS = b'{"data":{"type":"status","id":"pubg-api","attributes":{"releasedAt":"2018-03-12T14:08:16Z","version":"master"}}}'
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/vnd.api+json')
+        self.send_header('Content-Length', str(len(STATUS)))
+        self.end_headers()
+        self.wfile.write(STATUS)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class UnpooledClient(Client):
+    """The previous behaviour: a brand new session (and connection) for every request"""
+
+    def make_request(self, request, retry_policy=None):
+        return self.session_factory().send(request.prepare())
+
+
+def run(client, n_requests):
+    start = time.perf_counter()
+    for _ in range(n_requests):
+        client.api.status()
+    return n_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    server = Server(('127.0.0.1', 0), StatusHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+    try:
+        before = run(UnpooledClient(base_url=base_url, raw=True, autocall=True), args.requests)
+        with Client(base_url=base_url, raw=True, autocall=True) as client:
+            after = run(client, args.requests)
+    finally:
+        server.shutdown()
+
+    print('new session per request: {:10.1f} req/s'.format(before))
+    print('pooled sessions:         {:10.1f} req/s'.format(after))
+    print('speedup:                 {:10.2f}x'.format(after / before))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Timestamp parsing: ``pendulum.parse`` against the fixed format ``Timestamp`` converter
+
+    python benchmarks/bench_timestamp.py --values 20000
+"""
+import argparse
+import random
+import timeit
+
+import pendulum
+
+from pubg_client.models._base import Timestamp
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--values', type=int, default=20000)
+    parser.add_argument('--distinct', type=int, default=None, help='Draw the values from this many distinct timestamps')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    distinct = args.distinct or args.values
+    pool = ['2018-03-{:02d}T{:02d}:{:02d}:{:02d}Z'.format(rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59))
+            for _ in range(distinct)]
+    values = [rng.choice(pool) for _ in range(args.values)]
+
+    cases = [
+        ('pendulum.parse', pendulum.parse),
+        ('Timestamp()', Timestamp()),
+        ('Timestamp(maxsize=1024)', Timestamp(maxsize=1024)),
+    ]
+    baseline = None
+    for name, parse in cases:
+        seconds = min(timeit.repeat(lambda: [parse(value) for value in values], number=1, repeat=3))
+        baseline = baseline or seconds
+        print('{:24} {:8.2f} us/value {:8.1f}x'.format(name, seconds / len(values) * 1e6, baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
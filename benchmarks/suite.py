@@ -0,0 +1,169 @@
+"""Benchmark suite for the request, deserialization and export hot paths, against a mocked transport
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline results.json --threshold 0.10
+
+Every case is timed ``--repeat`` times and the fastest run is kept. With ``--baseline``, the cases that got slower
+than the stored results by more than ``--threshold`` are listed and the exit status is 1.
+"""
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+
+import pubg_client
+from pubg_client import Client, ModelEncoder, _json, export_ndjson
+from pubg_client._jsonapi import Document
+from pubg_client._response import make_response
+from pubg_client.models import Match, Roster
+from pubg_client.models._base import PassThrough
+from pubg_client.models.telemetry import load_event
+from pubg_client.testing.payloads import match_document, telemetry_events
+
+
+class MockAdapter(BaseAdapter):
+    """A transport that answers every request with the same canned body, without touching the network"""
+
+    def __init__(self, content):
+        super().__init__()
+        self.content = content
+
+    def send(self, request, **kwargs):
+        response = make_response(self.content, headers={'Content-Type': 'application/vnd.api+json'}, url=request.url)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class MockedClient(Client):
+    """A client whose sessions answer every request with the same canned body"""
+
+    def __init__(self, content, **kwargs):
+        self.content = content
+        super().__init__(**kwargs)
+
+    def create_session(self):
+        session = super().create_session()
+        session.mount('https://', MockAdapter(self.content))
+        return session
+
+
+def cases(args):
+    """The benchmark cases, as ``(name, items, function)``; ``items`` is what a run processes, for per item timings"""
+    documents = [match_document('match-{}'.format(i), seed=i) for i in range(args.matches)]
+    resolved = [Document(document).resolve() for document in documents]
+    matches = [Match.load(payload) for payload in resolved]
+    rosters = [roster for payload in resolved for roster in payload['rosters']]
+    events = telemetry_events(args.events)
+    passthrough = PassThrough(name='TelemetryEvent')
+    body = json.dumps(documents[0]).encode('utf-8')
+
+    client = MockedClient(body)
+    request = client.prepare_request('GET', 'https://api.playbattlegrounds.com/shards/pc-na/matches/match-0').prepared_request
+    api = MockedClient(body).api
+
+    return [
+        ('match.resolve', len(documents), lambda: [Document(document).resolve() for document in documents]),
+        ('match.load', len(resolved), lambda: [Match.load(payload) for payload in resolved]),
+        ('roster.load', len(rosters), lambda: [Roster.load(payload) for payload in rosters]),
+        ('passthrough.load', len(events), lambda: [passthrough.load(event) for event in events]),
+        ('telemetry.load_event', len(events), lambda: [load_event(event) for event in events]),
+        ('match.export', len(matches), lambda: [match.export() for match in matches]),
+        ('encode.model_encoder', len(matches), lambda: [json.dumps(match, cls=ModelEncoder) for match in matches]),
+        ('encode.dumps', len(matches), lambda: [ModelEncoder.dumps(match) for match in matches]),
+        ('encode.ndjson', len(matches), lambda: export_ndjson(matches, io.BytesIO())),
+        ('request.make_request', args.requests, lambda: [client.make_request(request) for _ in range(args.requests)]),
+        ('request.endpoint', args.requests, lambda: [api.match('match-0')() for _ in range(args.requests)]),
+    ]
+
+
+def run(args):
+    results = {}
+    for name, items, function in cases(args):
+        if args.filter and not any(pattern in name for pattern in args.filter):
+            continue
+
+        function()  # warm up
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+
+        results[name] = {
+            'items': items,
+            'min': min(timings),
+            'median': statistics.median(timings),
+            'per_item_us': min(timings) / items * 1e6,
+        }
+        print('{:24} {:10.2f} ms {:10.2f} us/item'.format(name, min(timings) * 1000, results[name]['per_item_us']))
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+
+    :return: The names of the cases that are slower than the baseline by more than the threshold
+    """
+    regressions = []
+    print('\n{:24} {:>12} {:>12} {:>8}'.format('case', 'baseline us', 'current us', 'change'))
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]['per_item_us'], result['per_item_us']
+        change = after / before - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print('{:24} {:12.2f} {:12.2f} {:+7.1%}{}'.format(name, before, after, change, flag))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--matches', type=int, default=100)
+    parser.add_argument('--events', type=int, default=20000)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--filter', action='append', help='Only run the cases whose name contains this (repeatable)')
+    parser.add_argument('--output', help='Write the results to this json file')
+    parser.add_argument('--baseline', help='Compare against the results in this json file')
+    parser.add_argument('--threshold', type=float, default=0.10, help='The slowdown that counts as a regression')
+    args = parser.parse_args()
+
+    results = run(args)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'meta': {
+                    'python': platform.python_version(),
+                    'implementation': platform.python_implementation(),
+                    'pubg_client': pubg_client.__version__,
+                    'requests': requests.__version__,
+                    'json_backend': _json.backend.name,
+                    'args': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+                },
+                'results': results,
+            }, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print('\n{} regression(s): {}'.format(len(regressions), ', '.join(regressions)))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -18,7 +18,19 @@ install_requires = [
     'pendulum',
 ]
 
-testing_requires = [
+async_requires = [
+    'aiohttp',
+]
+
+columnar_requires = [
+    'numpy',
+]
+
+fast_requires = [
+    'orjson',
+]
+
+testing_requires = async_requires + columnar_requires + fast_requires + [
     'pytest',
     'pytest-cov',
     'pytest-html',
@@ -54,6 +66,9 @@ setup(
     },
     install_requires=install_requires,
     extras_require={
+        'async': async_requires,
+        'columnar': columnar_requires,
+        'fast': fast_requires,
         'testing': testing_requires,
         'dev': dev_requires,
         'docs': docs_require,
@@ -1,22 +1,44 @@
 """Pubg Client package docstring"""
+import importlib
+import sys
 
-# This import is needed to for registration of endpoints onto the client.api attribute
-import pubg_client.endpoints as endpoints
-import pubg_client.models as models
-
+from . import endpoints, models
+from ._api import API
 from ._client import Client, SHARDS
 from .models._base import ModelEncoder
-from ._api import API
 
 __version__ = '0.1.4'
 
 __all__ = [
     # Classes
     'Client',
+    'AsyncClient',
     'API',
+    'RateLimiter',
+    'SharedRateLimiter',
+    'DiskCache',
+    'TTLCache',
+    'TelemetryStore',
+    'NDJSONWriter',
+    'MetricsCollector',
+    'RequestEvent',
+    'RetryPolicy',
+    'CircuitBreakers',
+    'CircuitOpenError',
+    'FanOut',
+    'ShardResult',
+    'SingleFlight',
+    'AsyncSingleFlight',
+    'MatchSync',
+    'SyncStore',
+    'SyncResult',
 
     # Helpers
     'ModelEncoder',
+    'iter_events',
+    'set_json_backend',
+    'export_ndjson',
+    'load_many',
 
     # Constants
     'SHARDS',
@@ -26,3 +48,51 @@ __all__ = [
     'models',
 
 ]
+
+# The core names above are imported eagerly. The others are imported on first access (PEP 562), so that aiohttp,
+# numpy and the rest of the optional machinery are only loaded by the first thing that needs them.
+_modules = {
+    'AsyncClient': '._async',
+    'RateLimiter': '._ratelimit',
+    'SharedRateLimiter': '._ratelimit',
+    'DiskCache': '._cache',
+    'TTLCache': '._cache',
+    'TelemetryStore': '._columnar',
+    'NDJSONWriter': '._export',
+    'export_ndjson': '._export',
+    'load_many': '._parallel',
+    'MatchSync': '._sync',
+    'SyncStore': '._sync',
+    'SyncResult': '._sync',
+    'MetricsCollector': '._metrics',
+    'RequestEvent': '._hooks',
+    'RetryPolicy': '._retry',
+    'CircuitBreakers': '._retry',
+    'CircuitOpenError': '._retry',
+    'FanOut': '._fanout',
+    'ShardResult': '._fanout',
+    'SingleFlight': '._singleflight',
+    'AsyncSingleFlight': '._singleflight',
+    'iter_events': '._telemetry',
+    'set_json_backend': '._json',
+}
+
+
+def __getattr__(name):
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    value = getattr(importlib.import_module(_modules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ needs Python 3.7, so older interpreters import every name up front
+    for _name in _modules:
+        __getattr__(_name)
+    del _name
@@ -1,3 +1,13 @@
+import importlib
+
+
+def load_endpoints():
+    """Imports the endpoint modules, which register their endpoints on :class:`API` (once, on first use of an api)"""
+    endpoints = importlib.import_module('pubg_client.endpoints')
+    for module in endpoints.MODULES:
+        importlib.import_module('.' + module, endpoints.__name__)
+
+
 class API:
     """The api namespace"""
 
@@ -8,6 +18,7 @@ class API:
         :param raw:
         :param autocall:
         """
+        load_endpoints()
         self.client = client
         self.raw = raw
         self.autocall = autocall
@@ -21,7 +32,7 @@ class API:
         :param endpoint:
         :return:
         """
-        setattr(cls, name, endpoint(deserializer))
+        setattr(cls, name, endpoint(deserializer, name=name))
 
     @classmethod
     def register(cls, name, deserializer):
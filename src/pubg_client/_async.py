@@ -0,0 +1,316 @@
+"""Asyncio Client Module"""
+import asyncio
+import time
+
+from ._api import API
+from ._client import _DEFAULT, Client, PUBGRequest
+from ._hooks import shard_of
+from ._retry import transient_errors
+from ._response import make_response
+from ._singleflight import AsyncSingleFlight
+from .endpoints._base import Endpoint
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncAPI(API):
+    """The api namespace of an :class:`AsyncClient`
+
+    Every endpoint registered with :meth:`API.register` is available here too; calling one returns an awaitable
+    :class:`AsyncPUBGRequest` (or, with ``autocall``, a coroutine that can be awaited directly).
+    """
+
+
+class AsyncClient(Client):
+    """An asyncio client backed by a pooled ``aiohttp`` session
+
+    .. code-block:: python
+
+        async with AsyncClient(token=token, autocall=True) as client:
+            status = await client.api.status()
+    """
+
+    api_class = AsyncAPI
+    """The api namespace class"""
+
+    def __init__(self, max_concurrency=10, offload_threshold=64 * 1024, executor=None, **kwargs):
+        """
+
+        :param max_concurrency: The maximum number of requests in flight at once
+        :param offload_threshold: Bodies of at least this many bytes are deserialized in ``executor``, off the loop
+        :param executor: The executor used for large bodies, None for the loop's default executor
+        :param kwargs: Passed on to :class:`Client`
+        """
+        super().__init__(**kwargs)
+        self.max_concurrency = max_concurrency
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+
+        self._session = None
+        self._semaphore = None
+
+    @property
+    def session(self):
+        """The ``aiohttp.ClientSession`` shared by every request, created on first use inside the event loop
+
+        :return:
+        """
+        if self._session is None or self._session.closed:
+            self._session = self.create_session()
+        return self._session
+
+    def create_session(self):
+        """
+
+        :return:
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncClient requires aiohttp, install pubg-client[async]')
+
+        connector = aiohttp.TCPConnector(limit=self.pool_connections * self.pool_maxsize, limit_per_host=self.pool_maxsize)
+        return aiohttp.ClientSession(connector=connector)
+
+    def create_single_flight(self):
+        """
+
+        :return:
+        """
+        return AsyncSingleFlight()
+
+    def validate_coalesce(self, coalesce):
+        """
+
+        :param coalesce:
+        :return: The :class:`AsyncSingleFlight` to coalesce calls with, or None
+        """
+        if coalesce is True:
+            return self.create_single_flight()
+        if coalesce is False or coalesce is None:
+            return None
+        if isinstance(coalesce, AsyncSingleFlight):
+            return coalesce
+        raise TypeError('coalesce must be True or an AsyncSingleFlight, not {!r}'.format(coalesce))
+
+    @property
+    def semaphore(self):
+        """
+
+        :return:
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def close(self):
+        """Closes the session and its pooled connections
+
+        :return:
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        raise TypeError("AsyncClient closes asynchronously, use 'async with'")
+
+    def check_blocking(self, feature):
+        """Rejects the blocking helpers (``Match.many``, ``paginate``, ``fan_out`` and ``telemetry``), which would
+        stall the event loop
+
+        :param feature:
+        :return:
+        """
+        raise TypeError('{} blocks, so it is not available on AsyncClient; await the calls (e.g. with '
+                        'asyncio.gather) or use a Client'.format(feature))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def prepare_request(self, method, url, gzip=True, **kwargs):
+        """
+
+        :param method:
+        :param url:
+        :param gzip:
+        :param kwargs:
+        :return:
+        """
+        request = super().prepare_request(method, url, gzip=gzip, **kwargs)
+        return AsyncPUBGRequest(request.prepared_request, self)
+
+    async def make_request(self, request, retry_policy=_DEFAULT):
+        """Sends a request like :meth:`Client.make_request`, waiting between retries without blocking the event loop
+
+        :param request:
+        :param retry_policy: The :class:`RetryPolicy` to use instead of the client's (None to not retry)
+        :return: A ``requests.Response`` holding the downloaded body
+        """
+        policy = self.retry_policy if retry_policy is _DEFAULT else retry_policy
+        breaker = self.circuit_breakers.get(shard_of(request.url)) if self.circuit_breakers is not None else None
+        attempt = 0
+
+        while True:
+            attempt += 1
+            permit = breaker.allow() if breaker is not None else None
+
+            try:
+                response = await self.send_request(request)
+            except transient_errors() as exc:
+                if breaker is not None:
+                    breaker.record(permit, error=exc)
+                if policy is not None and policy.should_retry(request.method, attempt, error=exc):
+                    await asyncio.sleep(policy.delay(attempt))
+                    continue
+                raise
+            except BaseException as exc:
+                # Whatever else ends the request (a cancellation, a payload error) must still end a half-open
+                # breaker's trial
+                if breaker is not None:
+                    breaker.record(permit, error=exc)
+                raise
+
+            if breaker is not None:
+                breaker.record(permit, response=response)
+            if policy is not None and policy.should_retry(request.method, attempt, response=response):
+                await asyncio.sleep(policy.delay(attempt, response))
+                continue
+            return response
+
+    async def send_request(self, request):
+        """Sends a request once, inside the rate limit and the concurrency limit
+
+        :param request:
+        :return: A ``requests.Response`` holding the downloaded body
+        """
+        start = time.perf_counter()
+        sent = start
+        prepared = request.prepare()
+
+        try:
+            async with self.semaphore:
+                if self.rate_limiter is not None:
+                    await self.acquire_rate_limit()
+                sent = time.perf_counter()
+
+                async with self.session.request(prepared.method, prepared.url, headers=dict(prepared.headers), data=prepared.body) as resp:
+                    content = await resp.read()
+                    response = make_response(content, resp.status, resp.headers, str(resp.url), resp.reason)
+
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(response.headers)
+        except Exception as exc:
+            self.fire_request_event('make_request', request, start, network=time.perf_counter() - sent, error=exc)
+            raise
+
+        self.fire_request_event('make_request', request, start, response=response, network=time.perf_counter() - sent)
+        return response
+
+    async def acquire_rate_limit(self):
+        """Waits for the rate limiter without blocking the event loop
+
+        :return:
+        """
+        while True:
+            wait = self.rate_limiter.try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    async def process_response(self, endpoint, response):
+        """Runs the endpoint's deserialization, in the executor if the body is large
+
+        :param endpoint:
+        :param response:
+        :return:
+        """
+        if len(response.content) >= self.offload_threshold:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self.executor, endpoint.process_response, response)
+        return endpoint.process_response(response)
+
+
+class AsyncPUBGRequest(PUBGRequest):
+    """A lazy request object that is sent by awaiting it"""
+
+    def __init__(self, prepared_request, client_or_endpoint):
+        """
+
+        :param prepared_request:
+        :param client_or_endpoint:
+        """
+        super().__init__(prepared_request, client_or_endpoint)
+        self.client = client_or_endpoint
+
+    def __call__(self, client_or_endpoint=None):
+        """
+
+        :param client_or_endpoint:
+        :return: A coroutine
+        """
+        client_or_endpoint = client_or_endpoint if client_or_endpoint is not None else self.client_or_endpoint
+        return self._send(client_or_endpoint)
+
+    def __await__(self):
+        return self().__await__()
+
+    async def _send(self, client_or_endpoint):
+        if isinstance(client_or_endpoint, AsyncClient):
+            return await client_or_endpoint.make_request(self.prepared_request)
+        elif isinstance(client_or_endpoint, Endpoint):
+            return await self._send_endpoint(client_or_endpoint)
+        else:
+            raise TypeError("AsyncPUBGRequest doesn't know how to use <{}> to make a request!".format(str(client_or_endpoint)))
+
+    async def _send_endpoint(self, endpoint):
+        start = time.perf_counter()
+        trace = {}
+        try:
+            single_flight = self.client.single_flight
+            if single_flight is not None and self.prepared_request.method == 'GET':
+                key = endpoint.request_key(self.prepared_request)
+                result, shared = await single_flight.do(key, lambda: self._dispatch(endpoint, trace))
+                if shared:
+                    trace['cache'] = 'coalesced'
+            else:
+                result = await self._dispatch(endpoint, trace)
+        except Exception as exc:
+            self.client.fire_request_event('endpoint_request', self.prepared_request, start, endpoint=endpoint.name, error=exc, **trace)
+            raise
+
+        self.client.fire_request_event('endpoint_request', self.prepared_request, start, endpoint=endpoint.name, **trace)
+        return result
+
+    async def _dispatch(self, endpoint, trace):
+        # Runs the endpoint's steps (and so its cache logic) with the asyncio send and process
+        steps = endpoint.dispatch_steps(self.prepared_request, trace)
+        result = None
+        while True:
+            try:
+                action, value = steps.send(result)
+            except StopIteration as stop:
+                return stop.value
+            if action == 'send':
+                result = await self._fetch(endpoint, value, trace)
+            else:
+                result = await self._process(endpoint, value, trace)
+
+    async def _fetch(self, endpoint, prepared_request, trace):
+        start = time.perf_counter()
+        try:
+            return await self.client.make_request(prepared_request, self.client.retry_policy_for(endpoint.name))
+        finally:
+            trace['network'] = trace.get('network', 0.0) + time.perf_counter() - start
+
+    async def _process(self, endpoint, response, trace):
+        trace.update(status_code=response.status_code, bytes=len(response.content))
+        processing = time.perf_counter()
+        try:
+            return await self.client.process_response(endpoint, response)
+        finally:
+            trace['deserialize'] = time.perf_counter() - processing
@@ -0,0 +1,96 @@
+"""Batch Module"""
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Batch:
+    """Runs ``fn`` for every item on a bounded thread pool and iterates over the results
+
+    Only ``max_workers * 2`` items are in flight at any time, so arbitrarily long (or lazy) iterables can be used.
+    Items whose call raised are left out of the results and recorded in :attr:`errors` instead, so one failure does
+    not abort the batch.
+    """
+
+    def __init__(self, fn, items, max_workers=8, ordered=False):
+        """
+
+        :param fn: A callable taking one item
+        :param items: An iterable of items
+        :param max_workers: The number of worker threads
+        :param ordered: Yield results in input order rather than as they complete
+        """
+        self.fn = fn
+        self.items = items
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.errors = {}
+        """A mapping of item to the exception its call raised"""
+
+    def __iter__(self):
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        in_flight = set()
+        try:
+            if self.ordered:
+                yield from self._ordered(pool, in_flight)
+            else:
+                yield from self._as_completed(pool, in_flight)
+        finally:
+            # When iteration stops early the queued calls are dropped rather than run
+            for future in in_flight:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    def _submit(self, pool, items, in_flight):
+        for item in items:
+            future = pool.submit(self.fn, item)
+            in_flight.add(future)
+            return item, future
+        return None
+
+    def _result(self, item, future, in_flight):
+        in_flight.discard(future)
+        try:
+            return True, future.result()
+        except Exception as e:
+            self.errors[item] = e
+            return False, None
+
+    def _ordered(self, pool, in_flight):
+        items = iter(self.items)
+        pending = deque()
+        while True:
+            while len(pending) < self.max_workers * 2:
+                submitted = self._submit(pool, items, in_flight)
+                if submitted is None:
+                    break
+                pending.append(submitted)
+
+            if not pending:
+                return
+
+            ok, result = self._result(*pending.popleft(), in_flight)
+            if ok:
+                yield result
+
+    def _as_completed(self, pool, in_flight):
+        items = iter(self.items)
+        pending = {}
+        while True:
+            while len(pending) < self.max_workers * 2:
+                submitted = self._submit(pool, items, in_flight)
+                if submitted is None:
+                    break
+                item, future = submitted
+                pending[future] = item
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ok, result = self._result(pending.pop(future), future, in_flight)
+                if ok:
+                    yield result
+
+    def __repr__(self):
+        return '{0.__class__.__name__}(fn={0.fn!r}, max_workers={0.max_workers}, ordered={0.ordered})'.format(self)
@@ -0,0 +1,297 @@
+"""Cache Module"""
+import gzip
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict, namedtuple
+from urllib.parse import quote
+
+
+class DiskCache:
+    """A size bounded, on disk cache of response bodies for resources that never change (e.g. finished matches)
+
+    Bodies are stored gzip compressed, one file per key, and written atomically (to a temporary file that is then
+    renamed) so several processes can share one directory. Reading an entry refreshes its modification time; when
+    the directory grows past ``max_bytes`` the least recently used entries are removed until it is back under
+    ``max_bytes * low_water``, so the directory is scanned once per batch of evictions rather than on every write.
+    """
+
+    suffix = '.json.gz'
+
+    def __init__(self, directory, max_bytes=1024 ** 3, compresslevel=6, low_water=0.9):
+        """
+
+        :param directory: The cache directory, created if it does not exist
+        :param max_bytes: The byte budget for the (compressed) entries
+        :param compresslevel: The gzip compression level
+        :param low_water: The share of ``max_bytes`` an eviction frees the cache down to
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self.compresslevel = compresslevel
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._size = None
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        """The file an entry is stored in
+
+        :param key: A tuple of strings, e.g. ``(shard, match_id)``
+        :return:
+        """
+        *dirs, name = [quote(str(part), safe='') for part in key]
+        return os.path.join(self.directory, *dirs, name + self.suffix)
+
+    def get(self, key):
+        """
+
+        :param key:
+        :return: The body, or None on a miss
+        """
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                compressed = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            content = gzip.decompress(compressed)
+        except (OSError, EOFError, zlib.error):
+            # A corrupt or truncated entry is a miss, and is removed so the next response replaces it
+            self._discard(path, len(compressed))
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def set(self, key, content):
+        """
+
+        :param key:
+        :param content: The body, as bytes
+        :return:
+        """
+        path = self.path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        compressed = gzip.compress(content, compresslevel=self.compresslevel)
+        try:
+            replaced = os.stat(path).st_size
+        except OSError:
+            replaced = 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, _, size in self._entries())
+            else:
+                self._size += len(compressed) - replaced
+
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _discard(self, path, size):
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size -= size
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(self.suffix):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entry[2] for entry in entries)
+        target = self.max_bytes * self.low_water
+
+        for path, _, entry_size in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+            self.evictions += 1
+
+        self._size = size
+
+    def clear(self):
+        """Removes every entry
+
+        :return:
+        """
+        with self._lock:
+            for path, _, _ in list(self._entries()):
+                os.remove(path)
+            self._size = 0
+
+    def stats(self):
+        """
+
+        :return: The hit, miss and eviction counters
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __repr__(self):
+        return '{0.__class__.__name__}(directory={0.directory!r}, max_bytes={0.max_bytes})'.format(self)
+
+
+class CacheEntry(namedtuple('CacheEntry', ['value', 'etag', 'last_modified', 'expires'])):
+    """A :class:`TTLCache` entry"""
+
+    __slots__ = ()
+
+    @property
+    def fresh(self):
+        """
+
+        :return:
+        """
+        return time.monotonic() < self.expires
+
+
+class TTLCache:
+    """An in memory LRU cache of deserialized results for endpoints whose resources change (status, matches)
+
+    A result is served straight from memory until its ttl runs out. After that the request is sent again with
+    ``If-None-Match``/``If-Modified-Since`` validators, and a ``304 Not Modified`` re-uses the already deserialized
+    result instead of downloading and parsing the body again.
+    """
+
+    def __init__(self, maxsize=256, ttl=30, ttls=None):
+        """
+
+        :param maxsize: The maximum number of entries
+        :param ttl: The default time to live in seconds
+        :param ttls: Per endpoint times to live, e.g. ``{'status': 5, 'matches': 60}``
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = ttls if ttls is not None else {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def ttl_for(self, name):
+        """
+
+        :param name: The endpoint name
+        :return:
+        """
+        return self.ttls.get(name, self.ttl)
+
+    def get(self, key):
+        """
+
+        :param key:
+        :return: The :class:`CacheEntry`, fresh or not, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def set(self, key, value, ttl, etag=None, last_modified=None):
+        """
+
+        :param key:
+        :param value:
+        :param ttl:
+        :param etag:
+        :param last_modified:
+        :return:
+        """
+        with self._lock:
+            self._entries[key] = CacheEntry(value, etag, last_modified, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key, ttl):
+        """Marks an entry as confirmed unchanged by the server
+
+        :param key:
+        :param ttl:
+        :return:
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = entry._replace(expires=time.monotonic() + ttl)
+            self.revalidations += 1
+
+    def clear(self):
+        """
+
+        :return:
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+
+        :return: The hit, miss and revalidation counters
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+            }
+
+    def __repr__(self):
+        return '{0.__class__.__name__}(maxsize={0.maxsize}, ttl={0.ttl}, ttls={0.ttls!r})'.format(self)
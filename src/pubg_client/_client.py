@@ -1,8 +1,22 @@
 """Client Module"""
+import copy
+import threading
+import time
+from contextlib import contextmanager
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from ._api import API
+from ._fanout import FanOut
+from ._hooks import Hooks, shard_of
+from ._lazy import LazyModule
+from ._pagination import Paginator
+from ._response import PUBGResponse
+from ._singleflight import AsyncSingleFlight, SingleFlight
+from ._telemetry import iter_events
 from .endpoints._base import Endpoint
+from .models._variants import MODES as MODEL_MODES
 
 SHARDS = {
     'xbox-as': 'xbox-Asia',
@@ -20,11 +34,95 @@ SHARDS = {
 }
 """Shards"""
 
+_DEFAULT = object()
+
+futures = LazyModule('concurrent.futures')
+
+
+class SessionPool:
+    """The ``requests`` sessions of a client, shared by all its threads
+
+    ``requests.Session`` is not thread safe, so a session serves one request at a time: it is taken from the pool
+    for the request and put back afterwards, with its connections kept alive for the next request, whichever thread
+    makes it. Short lived threads (a thread pool per call) therefore reuse the same sessions. At most ``max_idle``
+    sessions are kept between requests; the others are closed when they are put back.
+    """
+
+    def __init__(self, factory, max_idle=10):
+        """
+
+        :param factory: A callable creating a session
+        :param max_idle: The maximum number of sessions kept for later requests
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self._idle = []
+        self._sessions = set()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes an idle session, or creates one
+
+        :return:
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        session = self.factory()
+        with self._lock:
+            self._sessions.add(session)
+        return session
+
+    def release(self, session):
+        """Puts a session taken with :meth:`acquire` back
+
+        :param session:
+        :return:
+        """
+        with self._lock:
+            if session in self._sessions and len(self._idle) < self.max_idle:
+                self._idle.append(session)
+                return
+            self._sessions.discard(session)
+        session.close()
+
+    @contextmanager
+    def session(self):
+        """Holds a session for the duration of a ``with`` block
+
+        :return:
+        """
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def close(self):
+        """Closes every session, idle or not
+
+        :return:
+        """
+        with self._lock:
+            sessions, self._sessions, self._idle = self._sessions, set(), []
+        for session in sessions:
+            session.close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
 
 class Client:
     """The client class"""
 
-    def __init__(self, base_url='https://api.playbattlegrounds.com', token=None, shard='pc-na', raw=False, autocall=False):
+    api_class = API
+    """The api namespace class"""
+
+    def __init__(self, base_url='https://api.playbattlegrounds.com', token=None, shard='pc-na', raw=False, autocall=False,
+                 pool_connections=10, pool_maxsize=10, rate_limiter=None, disk_cache=None,
+                 ttl_cache=None, model_mode=None, retry_policy=None, retry_policies=None, circuit_breakers=None,
+                 coalesce=False):
         """
 
         :param base_url:
@@ -32,6 +130,17 @@ class Client:
         :param shard:
         :param raw:
         :param autocall:
+        :param pool_connections: The number of hosts to keep connection pools for
+        :param pool_maxsize: The maximum number of keep-alive connections kept per host, and of idle sessions
+        :param rate_limiter: A :class:`RateLimiter` (shareable between clients with the same token) or None
+        :param disk_cache: A :class:`DiskCache` for immutable resources (matches) or None
+        :param ttl_cache: A :class:`TTLCache` for the other endpoints (status, matches) or None
+        :param model_mode: How models are represented in memory: None for plain classes, ``'compact'`` or ``'lazy'``
+        :param retry_policy: The :class:`RetryPolicy` of every request, or None to never retry
+        :param retry_policies: :class:`RetryPolicy` overrides by endpoint name (None values disable retries)
+        :param circuit_breakers: :class:`CircuitBreakers` that fail fast while a shard is unhealthy, or None
+        :param coalesce: Share one request (and result) between concurrent identical endpoint calls: True, or a
+            :class:`SingleFlight` to share between clients
         """
         self.base_url = base_url
         self.token = token if token is not None else ''
@@ -39,8 +148,81 @@ class Client:
         self.raw = raw
         self.session_factory = requests.Session
         self.autocall = autocall
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.rate_limiter = rate_limiter
+        self.disk_cache = disk_cache
+        self.ttl_cache = ttl_cache
+        self.model_mode = self.validate_model_mode(model_mode)
+        self.retry_policy = retry_policy
+        self.retry_policies = dict(retry_policies or {})
+        self.circuit_breakers = circuit_breakers
+        self.single_flight = self.validate_coalesce(coalesce)
 
-    def prepare_request(self, method, url, gzip=False, **kwargs):
+        self.hooks = Hooks()
+
+        self._api = None
+        self._api_lock = threading.Lock()
+
+        self.sessions = SessionPool(self.create_session, max_idle=pool_maxsize)
+        """The pooled sessions, shared with the clients copied by :meth:`for_shard`"""
+
+        self._thread_pools = {}
+        self._thread_pools_lock = threading.Lock()
+
+    def create_session(self):
+        """
+
+        :return:
+        """
+        session = self.session_factory()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def create_single_flight(self):
+        """
+
+        :return:
+        """
+        return SingleFlight()
+
+    def thread_pool(self, max_workers):
+        """The client's long lived thread pool of ``max_workers`` threads, started on first use
+
+        Repeated fan-outs run on the same threads rather than starting a pool per call. The pools are shared with
+        the clients copied by :meth:`for_shard` and shut down by :meth:`close`.
+
+        :param max_workers:
+        :return: A ``ThreadPoolExecutor``
+        """
+        with self._thread_pools_lock:
+            pool = self._thread_pools.get(max_workers)
+            if pool is None:
+                pool = self._thread_pools[max_workers] = futures.ThreadPoolExecutor(max_workers=max_workers)
+            return pool
+
+    def close(self):
+        """Closes every session (and the pooled connections) opened by this client, and its thread pools
+
+        :return:
+        """
+        with self._thread_pools_lock:
+            pools = list(self._thread_pools.values())
+            self._thread_pools.clear()
+        for pool in pools:
+            # Calls abandoned by a fan-out timeout are not waited for
+            pool.shutdown(wait=False)
+        self.sessions.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def prepare_request(self, method, url, gzip=True, **kwargs):
         """
 
         :param method:
@@ -49,6 +231,7 @@ class Client:
         :param kwargs:
         :return:
         """
+        start = time.perf_counter()
 
         header = {
             "Authorization": self.token,
@@ -58,16 +241,126 @@ class Client:
         if gzip:
             header["Accept-Encoding"] = "gzip"
 
-        return PUBGRequest(requests.Request(method, url, headers=header, **kwargs), self)
+        request = PUBGRequest(requests.Request(method, url, headers=header, **kwargs), self)
+        self.fire_request_event('prepare_request', request.prepared_request, start)
+        return request
+
+    def make_request(self, request, retry_policy=_DEFAULT):
+        """Sends a request, retrying it according to the retry policy and failing fast while its shard's circuit
+        breaker is open
 
-    def make_request(self, request):
+        :param request:
+        :param retry_policy: The :class:`RetryPolicy` to use instead of the client's (None to not retry)
+        :return:
         """
+        policy = self.retry_policy if retry_policy is _DEFAULT else retry_policy
+        breaker = self.circuit_breakers.get(shard_of(request.url)) if self.circuit_breakers is not None else None
+        attempt = 0
+
+        while True:
+            attempt += 1
+            permit = breaker.allow() if breaker is not None else None
+
+            try:
+                response = self.send_request(request)
+            except requests.exceptions.RequestException as exc:
+                if breaker is not None:
+                    breaker.record(permit, error=exc)
+                if policy is not None and policy.should_retry(request.method, attempt, error=exc):
+                    policy.sleep(policy.delay(attempt))
+                    continue
+                raise
+            except BaseException as exc:
+                # Whatever else ends the request (a hook, the rate limiter) must still end a half-open breaker's trial
+                if breaker is not None:
+                    breaker.record(permit, error=exc)
+                raise
+
+            if breaker is not None:
+                breaker.record(permit, response=response)
+            if policy is not None and policy.should_retry(request.method, attempt, response=response):
+                policy.sleep(policy.delay(attempt, response))
+                response.close()
+                continue
+            return response
+
+    def send_request(self, request):
+        """Sends a request once, inside the rate limit
 
         :param request:
         :return:
         """
-        s = self.session_factory()
-        return s.send(request.prepare())
+        start = time.perf_counter()
+        sent = start
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+                sent = time.perf_counter()
+
+            with self.sessions.session() as session:
+                response = PUBGResponse.adopt(session.send(request.prepare()))
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response.headers)
+        except Exception as exc:
+            self.fire_request_event('make_request', request, start, network=time.perf_counter() - sent, error=exc)
+            raise
+
+        self.fire_request_event('make_request', request, start, response=response, network=time.perf_counter() - sent)
+        return response
+
+    def retry_policy_for(self, name):
+        """
+
+        :param name: An endpoint name
+        :return: The endpoint's :class:`RetryPolicy`, or None
+        """
+        return self.retry_policies.get(name, self.retry_policy)
+
+    def on(self, event, callback=None):
+        """Registers a callback for an instrumentation event
+
+        .. code-block:: python
+
+            @client.on('endpoint_request')
+            def log(event):
+                print(event.endpoint, event.status_code, event.network, event.deserialize, event.cache)
+
+        :param event: ``'prepare_request'``, ``'make_request'`` (every request sent) or ``'endpoint_request'`` (every
+            endpoint call, including cache hits)
+        :param callback: Called with a :class:`RequestEvent`; omit it to use ``on`` as a decorator
+        :return: The callback
+        """
+        if callback is None:
+            return lambda callback: self.hooks.on(event, callback)
+        return self.hooks.on(event, callback)
+
+    def off(self, event, callback):
+        """Removes a callback registered with :meth:`on`
+
+        :param event:
+        :param callback:
+        :return:
+        """
+        self.hooks.off(event, callback)
+
+    def fire_request_event(self, event, request, start, response=None, **fields):
+        """Calls the callbacks of an event about a request, if there are any
+
+        :param event:
+        :param request: The ``requests.Request``
+        :param start: The ``time.perf_counter()`` the step started at
+        :param response: The response, if one was received
+        :param fields: Further fields of the :class:`RequestEvent`
+        :return:
+        """
+        if not self.hooks.active(event):
+            return
+        if response is not None:
+            fields.setdefault('status_code', response.status_code)
+            fields.setdefault('bytes', len(response.content))
+        self.hooks.fire(event, method=request.method, url=request.url, shard=shard_of(request.url),
+                        elapsed=time.perf_counter() - start, **fields)
 
     def request(self, method, url, **kwargs):
         """
@@ -77,8 +370,7 @@ class Client:
         :param kwargs:
         :return:
         """
-        req = self.prepare_request(method, url, **kwargs)
-        return self.make_request(req)
+        return self.prepare_request(method, url, **kwargs)(self)
 
     def next_page(self, response):
         """
@@ -94,7 +386,7 @@ class Client:
         :param response:
         :return:
         """
-        return self.request('GET', response.json()['links']['last'])
+        return self.request('GET', response.json()['links']['prev'])
 
     def current_page(self, response):
         """
@@ -104,6 +396,74 @@ class Client:
         """
         return self.request('GET', response.json()['links']['self'])
 
+    def telemetry(self, asset, event_types=None, raw=False, chunk_size=64 * 1024):
+        """Streams the telemetry of a match, parsing events as they download
+
+        .. code-block:: python
+
+            for kill in client.telemetry(match.assets[0], event_types={'LogPlayerKill'}):
+                print(kill.attacker['name'], kill.victim['name'])
+
+        :param asset: An :class:`Asset` (from ``match.assets``), or the telemetry url
+        :param event_types: A collection of event types (``_T``) to keep, or None for every event
+        :param raw: Yield the decoded dictionaries rather than event models
+        :param chunk_size:
+        :return: A generator of events
+        """
+        self.check_blocking('telemetry')
+        return self._telemetry(getattr(asset, 'url', asset), event_types, raw, chunk_size)
+
+    def _telemetry(self, url, event_types, raw, chunk_size):
+        # The session is held until the download ends, since the connection streams the body
+        with self.sessions.session() as session:
+            response = session.get(url, headers={'Accept-Encoding': 'gzip'}, stream=True)
+            try:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield from iter_events(response.raw, event_types=event_types, raw=raw, chunk_size=chunk_size)
+            finally:
+                response.close()
+
+    def for_shard(self, shard):
+        """A copy of the client bound to another shard
+
+        The copy shares everything else with the client: its pooled sessions, rate limiter, caches, retry policies,
+        circuit breakers and hooks.
+
+        :param shard:
+        :return:
+        """
+        client = copy.copy(self)
+        client.shard = self.validate_shard(shard)
+        # The api namespace (and its bound endpoints) belong to the original client
+        client._api = None
+        return client
+
+    def fan_out(self, fn, shards=None, max_workers=None, timeout=None):
+        """Runs a call against several shards concurrently
+
+        .. code-block:: python
+
+            for outcome in client.fan_out(lambda client: client.api.matches(), timeout=10):
+                print(outcome.shard, outcome.elapsed, outcome.error)
+
+            statuses = client.fan_out(lambda client: client.api.status()).merge()
+
+        :param fn: A callable taking the client bound to a shard; a :class:`PUBGRequest` it returns is sent
+        :param shards: An iterable of shards, defaults to every shard in :data:`SHARDS`
+        :param max_workers: The number of concurrent calls, defaults to one per shard
+        :param timeout: The number of seconds to wait for all the shards, or None
+        :return: A :class:`FanOut` iterating over the :class:`ShardResult` of every shard as it completes
+        """
+        self.check_blocking('fan_out')
+
+        def call(client):
+            result = fn(client)
+            return result() if isinstance(result, PUBGRequest) else result
+
+        shards = list(shards) if shards is not None else list(SHARDS)
+        return FanOut(self, call, shards, max_workers=max_workers, timeout=timeout)
+
     def get_token(self, token=None):
         """
 
@@ -127,6 +487,13 @@ class Client:
         self.validate_shard(shard)
         return shard
 
+    def check_blocking(self, feature):
+        """Called by the helpers that block (on worker threads, or on a streamed download) before they start
+
+        :param feature: The helper's name, for the error of a client that cannot block
+        :return:
+        """
+
     def validate_shard(self, shard):
         """
 
@@ -138,13 +505,45 @@ class Client:
         else:
             raise ValueError('shard not found! {shard}'.format(shard=shard))
 
+    def validate_coalesce(self, coalesce):
+        """
+
+        :param coalesce:
+        :return: The :class:`SingleFlight` to coalesce calls with, or None
+        """
+        if coalesce is True:
+            return self.create_single_flight()
+        if coalesce is False or coalesce is None:
+            return None
+        if isinstance(coalesce, SingleFlight) and not isinstance(coalesce, AsyncSingleFlight):
+            return coalesce
+        raise TypeError('coalesce must be True or a SingleFlight, not {!r}'.format(coalesce))
+
+    def validate_model_mode(self, model_mode):
+        """
+
+        :param model_mode:
+        :return:
+        """
+        if model_mode in MODEL_MODES:
+            return model_mode
+        else:
+            raise ValueError('model mode not found! {model_mode}'.format(model_mode=model_mode))
+
     @property
     def api(self):
-        """
+        """The api namespace, built once per client (and rebuilt if ``raw`` or ``autocall`` change)
 
         :return:
         """
-        return API(client=self, raw=self.raw, autocall=self.autocall)
+        api = self._api
+        if api is None or api.raw != self.raw or api.autocall != self.autocall:
+            # Built under a lock, so threads racing on first use share one namespace (and its bound endpoints)
+            with self._api_lock:
+                api = self._api
+                if api is None or api.raw != self.raw or api.autocall != self.autocall:
+                    api = self._api = self.api_class(client=self, raw=self.raw, autocall=self.autocall)
+        return api
 
 
 class PUBGRequest:
@@ -196,6 +595,7 @@ class PUBGRequest:
         :return:
         """
         self._add_page_offset(self.prepared_request, offset)
+        return self
 
     @staticmethod
     def _add_page_limit(request, limit):
@@ -251,6 +651,19 @@ class PUBGRequest:
         }
         request.params.update(params)
 
+    def paginate(self, max_pages=None, max_items=None, prefetch=True):
+        """Iterates over the items of this page and the following ones, see :meth:`Endpoint.paginate`
+
+        :param max_pages:
+        :param max_items:
+        :param prefetch:
+        :return: A :class:`Paginator`
+        """
+        if not isinstance(self.client_or_endpoint, Endpoint):
+            raise TypeError('only endpoint requests can be paginated')
+        self.client_or_endpoint.client.check_blocking('paginate')
+        return Paginator(self, self.client_or_endpoint, max_pages=max_pages, max_items=max_items, prefetch=prefetch)
+
     def __call__(self, client_or_endpoint=None):
         """
 
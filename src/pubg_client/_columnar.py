@@ -0,0 +1,223 @@
+"""Columnar Telemetry Module"""
+import os
+import tempfile
+from urllib.parse import quote, unquote
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+TIMESTAMP_FIELD = '_D'
+
+
+def flatten(event, prefix=''):
+    """Flattens nested objects into dotted keys, e.g. ``{'victim': {'name': 'x'}}`` to ``{'victim.name': 'x'}``
+
+    Lists are dropped, as they do not fit in a column.
+
+    :param event:
+    :param prefix:
+    :return:
+    """
+    flat = {}
+    for key, value in event.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix=prefix + key + '.'))
+        elif not isinstance(value, list):
+            flat[prefix + key] = value
+    return flat
+
+
+def to_column(name, values):
+    """Converts a list of json scalars (with None for missing values) into a typed numpy array
+
+    Booleans, integers, floats and strings become ``?``, ``i8``, ``f8`` and fixed width unicode columns, and columns
+    mixing booleans and integers become ``i8`` (1 and 0 for booleans). Boolean and integer columns with missing values
+    become floats (nan where missing), and the ``_D`` timestamps become ``datetime64[ms]``.
+
+    :param name:
+    :param values:
+    :return:
+    """
+    present = [value for value in values if value is not None]
+    types = {type(value) for value in present}
+
+    if name == TIMESTAMP_FIELD and types <= {str}:
+        return np.array([value.rstrip('Z') if value is not None else 'NaT' for value in values], dtype='datetime64[ms]')
+    elif types == {bool} and len(present) == len(values):
+        return np.array(values, dtype='?')
+    elif types == {bool}:
+        return np.array([float(value) if value is not None else np.nan for value in values], dtype='f8')
+    elif types and types <= {bool, int} and len(present) == len(values):
+        return np.array(values, dtype='i8')
+    elif types and types <= {bool, int, float}:
+        return np.array([value if value is not None else np.nan for value in values], dtype='f8')
+    else:
+        strings = [str(value) if value is not None else '' for value in values]
+        width = max([len(string) for string in strings] + [1])
+        return np.array(strings, dtype='U{}'.format(width))
+
+
+class _ColumnBuilder:
+    """Accumulates the events of one type column by column"""
+
+    def __init__(self):
+        self.columns = {}
+        self.count = 0
+
+    def append(self, event):
+        flat = flatten(event)
+        for key in flat.keys() - self.columns.keys():
+            self.columns[key] = [None] * self.count
+        for key, column in self.columns.items():
+            column.append(flat.get(key))
+        self.count += 1
+
+    def build(self):
+        arrays = [(name, to_column(name, values)) for name, values in sorted(self.columns.items())]
+        table = np.empty(self.count, dtype=[(name, array.dtype) for name, array in arrays])
+        for name, array in arrays:
+            table[name] = array
+        return table
+
+
+class TelemetryStore:
+    """Telemetry stored as one numpy structured array per match and event type, read back memory mapped
+
+    Each event type becomes a table with one column per (flattened) field, saved as an ``.npy`` file under
+    ``directory/match_id/``. Opening a table maps the file rather than reading it, so reopening a match is
+    near instant and the data is never copied until it is used.
+
+    .. code-block:: python
+
+        store = TelemetryStore('telemetry')
+        store.write_match(client, match, event_types={'LogPlayerKill'})
+
+        distances = store.column('LogPlayerKill', 'distance')
+        print(distances.mean())
+    """
+
+    suffix = '.npy'
+
+    def __init__(self, directory):
+        """
+
+        :param directory: The store directory, created if it does not exist
+        """
+        if np is None:
+            raise ImportError('TelemetryStore requires numpy, install pubg-client[columnar]')
+
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, match_id, event_type=None):
+        """
+
+        :param match_id:
+        :param event_type:
+        :return:
+        """
+        match_path = os.path.join(self.directory, quote(match_id, safe=''))
+        if event_type is None:
+            return match_path
+        return os.path.join(match_path, quote(event_type, safe='') + self.suffix)
+
+    def write(self, match_id, events):
+        """Converts a match's telemetry into columnar tables
+
+        :param match_id:
+        :param events: An iterable of raw event dictionaries (see ``iter_events(..., raw=True)``)
+        :return: The event types written
+        """
+        builders = {}
+        for event in events:
+            event_type = event.get('_T', 'Unknown')
+            if event_type not in builders:
+                builders[event_type] = _ColumnBuilder()
+            builders[event_type].append(event)
+
+        match_path = self.path(match_id)
+        os.makedirs(match_path, exist_ok=True)
+        for event_type, builder in builders.items():
+            fd, tmp_path = tempfile.mkstemp(dir=match_path, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, builder.build())
+                os.replace(tmp_path, self.path(match_id, event_type))
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        return sorted(builders)
+
+    def write_match(self, client, match, event_types=None):
+        """Downloads the telemetry of a match (found through ``match.assets``) and stores it
+
+        :param client: A :class:`Client`
+        :param match: A :class:`Match` model
+        :param event_types: A collection of event types to keep, or None for every event
+        :return: The event types written
+        """
+        if not match.assets:
+            raise ValueError('match {} has no telemetry asset'.format(match.id))
+
+        events = client.telemetry(match.assets[0], event_types=event_types, raw=True)
+        return self.write(match.id, events)
+
+    def match_ids(self):
+        """
+
+        :return: The ids of the stored matches
+        """
+        return sorted(unquote(name) for name in os.listdir(self.directory) if os.path.isdir(os.path.join(self.directory, name)))
+
+    def event_types(self, match_id):
+        """
+
+        :param match_id:
+        :return: The event types stored for a match
+        """
+        return sorted(
+            unquote(name[:-len(self.suffix)])
+            for name in os.listdir(self.path(match_id))
+            if name.endswith(self.suffix)
+        )
+
+    def open(self, match_id, event_type):
+        """Memory maps one table
+
+        :param match_id:
+        :param event_type:
+        :return: A read only numpy structured array
+        """
+        return np.load(self.path(match_id, event_type), mmap_mode='r')
+
+    def scan(self, event_type, match_ids=None):
+        """Memory maps the table of an event type for many matches
+
+        :param event_type:
+        :param match_ids: The matches to read, or None for every match
+        :return: A generator of ``(match_id, table)``, skipping matches without such events
+        """
+        match_ids = match_ids if match_ids is not None else self.match_ids()
+        for match_id in match_ids:
+            if os.path.exists(self.path(match_id, event_type)):
+                yield match_id, self.open(match_id, event_type)
+
+    def column(self, event_type, field, match_ids=None):
+        """Concatenates one column across matches, ready for vectorized queries
+
+        :param event_type:
+        :param field: The dotted field name, e.g. ``'victim.name'``
+        :param match_ids: The matches to read, or None for every match
+        :return: A numpy array
+        """
+        columns = [table[field] for _, table in self.scan(event_type, match_ids) if field in table.dtype.names]
+        if not columns:
+            return np.array([])
+        return np.concatenate(columns)
+
+    def __repr__(self):
+        return '{0.__class__.__name__}(directory={0.directory!r})'.format(self)
@@ -0,0 +1,154 @@
+"""Export Module"""
+import gzip
+import io
+from json.encoder import encode_basestring
+
+from . import _json
+from ._lazy import LazyModule
+from .models._base import Model, encode
+
+pendulum = LazyModule('pendulum')
+
+
+class _Token(str):
+    """Literal json text waiting on the encoding stack (as opposed to a str value to encode)"""
+
+
+def iter_encode(obj):
+    """Encodes a model as json text, piece by piece
+
+    The models (and lists of models) are walked along their ``key_map`` with an explicit stack rather than exported
+    to a nested dictionary first, so only the current model's fields are held besides the output. Everything else
+    (scalars, plain dictionaries and lists) is encoded whole by the package's json backend. The pieces join into the
+    same document as ``ModelEncoder.dumps``.
+
+    :param obj: A model, a list of models, or any value the json backend can encode
+    :return: A generator of str pieces
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+
+        if type(value) is _Token:
+            yield value
+        elif value is None:
+            yield 'null'
+        elif isinstance(value, str):
+            yield encode_basestring(value)
+        elif isinstance(value, Model):
+            keys = list(value.key_map)
+            stack.append(_Token('}'))
+            for i in range(len(keys) - 1, -1, -1):
+                stack.append(getattr(value, keys[i], None))
+                stack.append(_Token((',' if i else '') + encode_basestring(keys[i]) + ':'))
+            stack.append(_Token('{'))
+        elif isinstance(value, list) and any(isinstance(item, Model) for item in value):
+            stack.append(_Token(']'))
+            for i in range(len(value) - 1, -1, -1):
+                stack.append(value[i])
+                if i:
+                    stack.append(_Token(','))
+            stack.append(_Token('['))
+        elif isinstance(value, pendulum.Pendulum):
+            yield encode_basestring(value.isoformat())
+        else:
+            yield _json.dumps(value, default=encode)
+
+
+class NDJSONWriter:
+    """Writes models to a file as newline delimited json, one model per line
+
+    .. code-block:: python
+
+        with open('matches.ndjson.gz', 'wb') as f, NDJSONWriter(f, compress=True) as writer:
+            for match in client.api.match.many(ids):
+                writer.write(match)
+
+    Each model is encoded with :func:`iter_encode` into a bounded buffer, so memory use does not grow with the number
+    of models written (as long as they are produced lazily).
+    """
+
+    def __init__(self, fileobj, compress=False, compresslevel=6, buffer_size=64 * 1024):
+        """
+
+        :param fileobj: A binary (or, without ``compress``, text) file-like object
+        :param compress: Gzip the output
+        :param compresslevel:
+        :param buffer_size: The number of characters buffered between writes
+        """
+        self.text = isinstance(fileobj, io.TextIOBase)
+        if self.text and compress:
+            raise ValueError('compressed output needs a binary file object')
+
+        self.fileobj = fileobj
+        self.stream = gzip.GzipFile(fileobj=fileobj, mode='wb', compresslevel=compresslevel) if compress else fileobj
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, model):
+        """
+
+        :param model:
+        :return:
+        """
+        for piece in iter_encode(model):
+            self._buffer.append(piece)
+            self._buffered += len(piece)
+            if self._buffered >= self.buffer_size:
+                self.flush()
+
+        self._buffer.append('\n')
+        self._buffered += 1
+        self.count += 1
+
+    def write_all(self, models):
+        """
+
+        :param models: An iterable of models
+        :return: The number of models written
+        """
+        count = self.count
+        for model in models:
+            self.write(model)
+        return self.count - count
+
+    def flush(self):
+        """Writes the buffered text through to the file
+
+        :return:
+        """
+        if self._buffer:
+            text = ''.join(self._buffer)
+            self.stream.write(text if self.text else text.encode('utf-8'))
+            self._buffer = []
+            self._buffered = 0
+
+    def close(self):
+        """Flushes the buffer and finishes the gzip stream (the file object itself is left open)
+
+        :return:
+        """
+        self.flush()
+        if self.stream is not self.fileobj:
+            self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def export_ndjson(models, fileobj, compress=False, compresslevel=6):
+    """Writes models to a file as newline delimited json, see :class:`NDJSONWriter`
+
+    :param models: An iterable of models
+    :param fileobj:
+    :param compress:
+    :param compresslevel:
+    :return: The number of models written
+    """
+    with NDJSONWriter(fileobj, compress=compress, compresslevel=compresslevel) as writer:
+        return writer.write_all(models)
@@ -0,0 +1,105 @@
+"""Fan-out Module"""
+import time
+from collections import namedtuple
+
+from ._lazy import LazyModule
+
+futures = LazyModule('concurrent.futures')
+
+ShardResult = namedtuple('ShardResult', ['shard', 'result', 'error', 'elapsed'])
+"""The outcome of a call on one shard: its result (or None), the exception it raised (or None) and its wall time"""
+
+
+class FanOut:
+    """Runs a call against several shards concurrently and iterates over the outcomes as they complete
+
+    Every shard gets a copy of the client bound to it (see :meth:`Client.for_shard`), so all the calls share the
+    client's pooled connections, rate limiter and caches, and run on the client's long lived thread pool (see
+    :meth:`Client.thread_pool`). A slow or failing shard does not hold back the others: its error is reported in its
+    :class:`ShardResult`, and with a ``timeout`` the shards that have not answered in time are reported with a
+    ``TimeoutError``.
+    """
+
+    def __init__(self, client, fn, shards, max_workers=None, timeout=None):
+        """
+
+        :param client:
+        :param fn: A callable taking the shard bound client
+        :param shards: An iterable of shards
+        :param max_workers: The number of worker threads, defaults to one per shard
+        :param timeout: The number of seconds to wait for all the shards, or None
+        """
+        self.client = client
+        self.clients = {shard: client.for_shard(shard) for shard in shards}
+        self.fn = fn
+        self.max_workers = max_workers if max_workers is not None else max(len(self.clients), 1)
+        self.timeout = timeout
+        self.results = {}
+        """The results of the shards that succeeded, by shard"""
+        self.errors = {}
+        """The exceptions of the shards that failed, by shard"""
+        self.latencies = {}
+        """The wall time of every shard, by shard"""
+
+    def _call(self, shard):
+        start = time.perf_counter()
+        try:
+            return ShardResult(shard, self.fn(self.clients[shard]), None, time.perf_counter() - start)
+        except Exception as e:
+            return ShardResult(shard, None, e, time.perf_counter() - start)
+
+    def _record(self, outcome):
+        self.latencies[outcome.shard] = outcome.elapsed
+        if outcome.error is None:
+            self.results[outcome.shard] = outcome.result
+        else:
+            self.errors[outcome.shard] = outcome.error
+        return outcome
+
+    def __iter__(self):
+        start = time.perf_counter()
+        pool = self.client.thread_pool(self.max_workers)
+        pending = {pool.submit(self._call, shard): shard for shard in self.clients}
+        try:
+            for future in futures.as_completed(pending, timeout=self.timeout):
+                yield self._record(future.result())
+        except futures.TimeoutError:
+            for future, shard in pending.items():
+                if shard in self.latencies:
+                    continue
+                if future.done():
+                    yield self._record(future.result())
+                    continue
+                future.cancel()
+                error = futures.TimeoutError('shard {} did not answer within {}s'.format(shard, self.timeout))
+                yield self._record(ShardResult(shard, None, error, time.perf_counter() - start))
+        finally:
+            # Stragglers past the timeout are abandoned rather than waited for, and shards not started are dropped
+            for future in pending:
+                future.cancel()
+
+    def collect(self):
+        """Waits for every shard
+
+        :return: The :class:`ShardResult` of every shard, in the order the shards were given
+        """
+        outcomes = {outcome.shard: outcome for outcome in self}
+        return [outcomes[shard] for shard in self.clients]
+
+    def merge(self):
+        """Waits for every shard and merges the successful results, tagging each with its shard
+
+        List results (and collections exposing their items as ``matches``) contribute one pair per item.
+
+        :return: A list of ``(shard, item)`` pairs, in the order the shards were given
+        """
+        merged = []
+        for outcome in self.collect():
+            if outcome.error is not None:
+                continue
+            items = getattr(outcome.result, 'matches', outcome.result)
+            if isinstance(items, list):
+                merged.extend((outcome.shard, item) for item in items)
+            else:
+                merged.append((outcome.shard, outcome.result))
+        return merged
@@ -0,0 +1,107 @@
+"""Hooks Module"""
+import threading
+from collections import namedtuple
+
+EVENTS = ('prepare_request', 'make_request', 'endpoint_request')
+"""The events a client fires, see :meth:`Client.on`"""
+
+RequestEvent = namedtuple('RequestEvent', [
+    'event', 'method', 'url', 'shard', 'endpoint', 'status_code', 'bytes', 'elapsed', 'network', 'deserialize',
+    'cache', 'error',
+])
+RequestEvent.__new__.__defaults__ = (None,) * (len(RequestEvent._fields) - 3)
+RequestEvent.__doc__ = """What a hook is called with
+
+* ``event``: One of :data:`EVENTS`
+* ``method``, ``url``: The request
+* ``shard``: The shard in the url, or None
+* ``endpoint``: The name of the endpoint (``endpoint_request`` only)
+* ``status_code``, ``bytes``: The response status and body size, None if no response was received
+* ``elapsed``: The wall time of the whole step, in seconds
+* ``network``: The time spent sending the request and reading the response
+* ``deserialize``: The time spent decoding and loading the models (``endpoint_request`` only)
+* ``cache``: ``'hit'``, ``'miss'`` or ``'revalidated'`` when a cache was consulted, ``'coalesced'`` when the result was
+  shared with a concurrent identical call, otherwise None
+* ``error``: The exception the step raised, or None
+"""
+
+
+def shard_of(url):
+    """
+
+    :param url:
+    :return: The shard of a ``/shards/{shard}/...`` url, or None
+    """
+    if url is None or '/shards/' not in url:
+        return None
+    return url.partition('/shards/')[2].split('/', 1)[0].split('?', 1)[0]
+
+
+class Hooks:
+    """The callbacks registered on a client, by event
+
+    Firing an event without callbacks costs a dictionary lookup, so uninstrumented clients stay fast. Callbacks run
+    synchronously in the thread that made the request; exceptions they raise propagate to the caller.
+    """
+
+    def __init__(self):
+        self._callbacks = {event: () for event in EVENTS}
+        self._lock = threading.Lock()
+
+    def on(self, event, callback):
+        """
+
+        :param event: One of :data:`EVENTS`
+        :param callback: Called with a :class:`RequestEvent`
+        :return: The callback
+        """
+        self.validate_event(event)
+        with self._lock:
+            # Replaced rather than appended to, so firing never needs the lock
+            self._callbacks[event] = self._callbacks[event] + (callback,)
+        return callback
+
+    def off(self, event, callback):
+        """
+
+        :param event:
+        :param callback:
+        :return:
+        """
+        self.validate_event(event)
+        with self._lock:
+            self._callbacks[event] = tuple(cb for cb in self._callbacks[event] if cb != callback)
+
+    def active(self, event):
+        """
+
+        :param event:
+        :return: Whether the event has callbacks
+        """
+        return bool(self._callbacks[event])
+
+    def fire(self, event, **fields):
+        """
+
+        :param event:
+        :param fields: The fields of the :class:`RequestEvent`
+        :return:
+        """
+        callbacks = self._callbacks[event]
+        if not callbacks:
+            return
+        payload = RequestEvent(event=event, **fields)
+        for callback in callbacks:
+            callback(payload)
+
+    @staticmethod
+    def validate_event(event):
+        """
+
+        :param event:
+        :return:
+        """
+        if event in EVENTS:
+            return event
+        else:
+            raise ValueError('event not found! {event}'.format(event=event))
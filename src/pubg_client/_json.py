@@ -0,0 +1,87 @@
+"""JSON Module
+
+Every response body and telemetry event is decoded (and every model dumped) through the backend selected here:
+``orjson`` when it is installed (``pip install pubg-client[fast]``), the standard library otherwise.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class StdlibBackend:
+    """The standard library ``json`` module"""
+
+    name = 'json'
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(obj, default=None):
+        return json.dumps(obj, default=default, separators=(',', ':'), ensure_ascii=False)
+
+
+class OrjsonBackend:
+    """``orjson``, which decodes bytes directly and encodes several times faster"""
+
+    name = 'orjson'
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(obj, default=None):
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+BACKENDS = {
+    'json': StdlibBackend,
+    'orjson': OrjsonBackend,
+}
+"""Backends by name"""
+
+backend = OrjsonBackend if orjson is not None else StdlibBackend
+
+
+def set_json_backend(name_or_backend):
+    """Selects the json backend of the whole package
+
+    :param name_or_backend: A name from :data:`BACKENDS`, or an object with ``loads(data)`` and
+        ``dumps(obj, default=None)``
+    :return: The previous backend
+    """
+    global backend
+
+    if isinstance(name_or_backend, str):
+        if name_or_backend not in BACKENDS:
+            raise ValueError('json backend not found! {name}'.format(name=name_or_backend))
+        if name_or_backend == 'orjson' and orjson is None:
+            raise ImportError('the orjson backend requires orjson, pip install pubg-client[fast]')
+        name_or_backend = BACKENDS[name_or_backend]
+
+    previous, backend = backend, name_or_backend
+    return previous
+
+
+def loads(data):
+    """
+
+    :param data: A str or bytes document
+    :return:
+    """
+    return backend.loads(data)
+
+
+def dumps(obj, default=None):
+    """
+
+    :param obj:
+    :param default: Called with objects the backend cannot encode itself
+    :return: A compact str document
+    """
+    return backend.dumps(obj, default=default)
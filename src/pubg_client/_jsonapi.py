@@ -0,0 +1,78 @@
+"""JSON:API Module"""
+from collections import namedtuple
+
+Reference = namedtuple('Reference', ['type', 'id'])
+"""A relationship whose resource is not in the document's ``included`` array"""
+
+
+class Document:
+    """Resolves the relationships of a JSON:API document against its ``included`` resources
+
+    ``included`` is indexed once by ``(type, id)``, and every resource is flattened once (its attributes and resolved
+    relationships merged next to its ``id`` and ``type``) and then shared, so resolving a match with hundreds of
+    rosters and participants stays linear in the size of the document. References that cannot be resolved are kept
+    as :class:`Reference` tuples instead of failing.
+    """
+
+    def __init__(self, document):
+        """
+
+        :param document: The decoded response body
+        """
+        self.document = document
+        self.index = {
+            (resource['type'], resource['id']): resource
+            for resource in document.get('included', ())
+        }
+        self._flattened = {}
+
+    def resolve(self):
+        """
+
+        :return: The flattened primary data (a dictionary, or a list of them)
+        """
+        data = self.document.get('data', {})
+        if isinstance(data, list):
+            return [self.flatten(resource) for resource in data]
+        return self.flatten(data)
+
+    def flatten(self, resource):
+        """
+
+        :param resource: A resource object
+        :return: A dictionary of the resource's id, type, attributes and resolved relationships
+        """
+        key = (resource.get('type'), resource.get('id'))
+        if key in self._flattened:
+            return self._flattened[key]
+
+        flat = {'id': resource.get('id'), 'type': resource.get('type')}
+        # Registered before the relationships are followed, so cyclic references terminate
+        self._flattened[key] = flat
+        flat.update(resource.get('attributes') or {})
+
+        for name, relationship in (resource.get('relationships') or {}).items():
+            data = relationship.get('data')
+            if isinstance(data, list):
+                flat[name] = [self.lookup(identifier) for identifier in data]
+            elif data is not None:
+                flat[name] = self.lookup(data)
+            else:
+                flat[name] = None
+
+        return flat
+
+    def lookup(self, identifier):
+        """
+
+        :param identifier: A resource identifier, ``{'type': ..., 'id': ...}``
+        :return: The flattened resource, or a :class:`Reference` if it is not included
+        """
+        key = (identifier['type'], identifier['id'])
+        if key in self._flattened:
+            return self._flattened[key]
+
+        resource = self.index.get(key)
+        if resource is None:
+            return Reference(*key)
+        return self.flatten(resource)
@@ -0,0 +1,28 @@
+"""Lazy import helpers"""
+import importlib
+
+
+class LazyModule:
+    """Stands in for a module that is only imported when one of its attributes is first used
+
+    .. code-block:: python
+
+        pendulum = LazyModule('pendulum')
+
+    Attributes are copied onto the stand-in as they are resolved, so later lookups cost no more than on the module.
+    """
+
+    def __init__(self, name):
+        """
+
+        :param name: The absolute module name
+        """
+        self.__name__ = name
+
+    def __getattr__(self, attr):
+        value = getattr(importlib.import_module(self.__name__), attr)
+        setattr(self, attr, value)
+        return value
+
+    def __repr__(self):
+        return '<LazyModule {}>'.format(self.__name__)
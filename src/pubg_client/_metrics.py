@@ -0,0 +1,241 @@
+"""Metrics Module"""
+import bisect
+import copy
+import threading
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Latency histogram bucket bounds, in seconds"""
+
+
+class Histogram:
+    """A cumulative histogram with fixed buckets, as Prometheus keeps them"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+
+        :param buckets: The upper bounds of the buckets, ascending (``+Inf`` is added)
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """
+
+        :param value:
+        :return:
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Estimates a quantile by linear interpolation inside its bucket (like Prometheus' ``histogram_quantile``)
+
+        :param q: Between 0 and 1
+        :return: The estimate, or None without observations
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if cumulative + count >= rank and count:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def cumulative(self):
+        """
+
+        :return: ``(upper bound, count of observations <= bound)`` pairs, ending with ``+Inf``
+        """
+        bounds = [_format_value(bound) for bound in self.buckets] + ['+Inf']
+        total, pairs = 0, []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class MetricsCollector:
+    """Aggregates a client's instrumentation events into counters and latency histograms
+
+    .. code-block:: python
+
+        metrics = MetricsCollector().attach(client)
+        ...
+        print(metrics.quantile('endpoint_seconds', 0.99, endpoint='match'))
+        print(metrics.prometheus())
+
+    Endpoint calls are counted by endpoint, shard and cache result, and their wall, network and deserialization
+    times go to histograms per endpoint; every request sent is counted by shard and status, with its latency and
+    body size.
+    """
+
+    namespace = 'pubg_client'
+    """The prefix of the exported metric names"""
+
+    metrics = {
+        'endpoint_requests_total': ('counter', 'Endpoint calls'),
+        'endpoint_seconds': ('histogram', 'Endpoint call wall time'),
+        'endpoint_network_seconds': ('histogram', 'Endpoint call time spent on the network'),
+        'endpoint_deserialize_seconds': ('histogram', 'Endpoint call time spent decoding and loading models'),
+        'http_requests_total': ('counter', 'Requests sent'),
+        'http_request_seconds': ('histogram', 'Request latency'),
+        'http_response_bytes_total': ('counter', 'Response body bytes received'),
+    }
+    """The metrics collected, by name: ``(type, help)``"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+
+        :param buckets: The latency histogram buckets
+        """
+        self.buckets = buckets
+        self._values = {name: {} for name in self.metrics}
+        self._lock = threading.Lock()
+
+    def attach(self, client):
+        """Starts collecting the events of a client (several clients can share a collector)
+
+        :param client:
+        :return: The collector
+        """
+        client.on('make_request', self.record)
+        client.on('endpoint_request', self.record)
+        return self
+
+    def detach(self, client):
+        """
+
+        :param client:
+        :return:
+        """
+        client.off('make_request', self.record)
+        client.off('endpoint_request', self.record)
+
+    def record(self, event):
+        """
+
+        :param event: A :class:`RequestEvent`
+        :return:
+        """
+        status = str(event.status_code) if event.status_code is not None else 'error'
+        with self._lock:
+            if event.event == 'endpoint_request':
+                labels = (('endpoint', event.endpoint), ('shard', event.shard or ''), ('cache', event.cache or 'none'),
+                          ('status', status))
+                self._inc('endpoint_requests_total', labels)
+
+                by_endpoint = (('endpoint', event.endpoint),)
+                self._observe('endpoint_seconds', by_endpoint, event.elapsed)
+                if event.network is not None:
+                    self._observe('endpoint_network_seconds', by_endpoint, event.network)
+                if event.deserialize is not None:
+                    self._observe('endpoint_deserialize_seconds', by_endpoint, event.deserialize)
+            elif event.event == 'make_request':
+                labels = (('shard', event.shard or ''), ('status', status))
+                self._inc('http_requests_total', labels)
+                self._observe('http_request_seconds', (('shard', event.shard or ''),), event.network)
+                if event.bytes is not None:
+                    self._inc('http_response_bytes_total', (('shard', event.shard or ''),), event.bytes)
+
+    __call__ = record
+
+    def _inc(self, name, labels, value=1):
+        values = self._values[name]
+        values[labels] = values.get(labels, 0) + value
+
+    def _observe(self, name, labels, value):
+        values = self._values[name]
+        if labels not in values:
+            values[labels] = Histogram(self.buckets)
+        values[labels].observe(value)
+
+    def value(self, name, **labels):
+        """The value of a counter, summed over the labels not given
+
+        :param name:
+        :param labels:
+        :return:
+        """
+        with self._lock:
+            return sum(
+                value for key, value in self._values[name].items()
+                if all(dict(key).get(label) == wanted for label, wanted in labels.items())
+            )
+
+    def histogram(self, name, **labels):
+        """
+
+        :param name:
+        :param labels: All the labels of the histogram, e.g. ``endpoint='match'``
+        :return: A copy of the :class:`Histogram`, or None
+        """
+        with self._lock:
+            histogram = self._histogram(name, labels)
+            return copy.deepcopy(histogram)
+
+    def _histogram(self, name, labels):
+        return self._values[name].get(tuple(sorted(labels.items())))
+
+    def quantile(self, name, q, **labels):
+        """
+
+        :param name:
+        :param q:
+        :param labels:
+        :return: The estimated quantile of a histogram, or None
+        """
+        with self._lock:
+            histogram = self._histogram(name, labels)
+            return histogram.quantile(q) if histogram is not None else None
+
+    def reset(self):
+        """
+
+        :return:
+        """
+        with self._lock:
+            self._values = {name: {} for name in self.metrics}
+
+    def prometheus(self):
+        """
+
+        :return: The metrics in the Prometheus text exposition format
+        """
+        lines = []
+        with self._lock:
+            for name, (kind, description) in self.metrics.items():
+                full_name = '{}_{}'.format(self.namespace, name)
+                lines.append('# HELP {} {}'.format(full_name, description))
+                lines.append('# TYPE {} {}'.format(full_name, kind))
+                for labels, value in sorted(self._values[name].items()):
+                    if kind == 'counter':
+                        lines.append('{}{} {}'.format(full_name, _format_labels(labels), _format_value(value)))
+                        continue
+                    for bound, count in value.cumulative():
+                        lines.append('{}_bucket{} {}'.format(full_name, _format_labels(labels + (('le', bound),)), count))
+                    lines.append('{}_sum{} {}'.format(full_name, _format_labels(labels), _format_value(value.sum)))
+                    lines.append('{}_count{} {}'.format(full_name, _format_labels(labels), value.count))
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(key, _escape(value)) for key, value in labels) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -0,0 +1,109 @@
+"""Pagination Module"""
+from ._lazy import LazyModule
+
+futures = LazyModule('concurrent.futures')
+
+
+class Paginator:
+    """Iterates over the items of a collection endpoint, following ``links.next`` from page to page
+
+    Each page is decoded once, and while the caller works through a page the next one is already being fetched in
+    a background thread.
+
+    .. code-block:: python
+
+        for match in client.api.matches.paginate(max_items=500):
+            ...
+    """
+
+    def __init__(self, request, endpoint, max_pages=None, max_items=None, prefetch=True):
+        """
+
+        :param request: The :class:`PUBGRequest` for the first page
+        :param endpoint: The endpoint that deserializes the items
+        :param max_pages: Stop after this many pages
+        :param max_items: Stop after this many items
+        :param prefetch: Fetch the next page in the background
+        """
+        self.request = request
+        self.endpoint = endpoint
+        self.document_endpoint = endpoint.document_endpoint()
+        self.max_pages = max_pages
+        self.max_items = max_items
+        self.prefetch = prefetch
+
+    def fetch(self, prepared_request):
+        """Requests a page through the endpoint, with its hooks, caches, single-flight and retry policy
+
+        :param prepared_request:
+        :return: The decoded page
+        """
+        return self.document_endpoint.request(prepared_request)
+
+    def next_request(self, document):
+        """
+
+        :param document: The decoded page
+        :return: The request for the following page, or None on the last page
+        """
+        url = (document.get('links') or {}).get('next')
+        if not url:
+            return None
+        return self.endpoint.client.prepare_request('GET', url).prepared_request
+
+    def documents(self, max_items=None):
+        """
+
+        :param max_items: Stop once the pages hold this many items, without fetching (or prefetching) another page
+        :return: A generator of the decoded pages
+        """
+        executor = futures.ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            document = self.fetch(self.request.prepared_request)
+            pages = 1
+            items = 0
+            while True:
+                items += len(document.get('data') or [])
+                next_request = self.next_request(document)
+                if self.max_pages is not None and pages >= self.max_pages:
+                    next_request = None
+                if max_items is not None and items >= max_items:
+                    next_request = None
+
+                pending = None
+                if next_request is not None and executor is not None:
+                    pending = executor.submit(self.fetch, next_request)
+
+                yield document
+
+                if next_request is None:
+                    return
+                document = pending.result() if pending is not None else self.fetch(next_request)
+                pages += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def pages(self):
+        """
+
+        :return: A generator of the deserialized items of each page, as lists
+        """
+        remaining = self.max_items
+        for document in self.documents(self.max_items):
+            items = self.endpoint.items(document)
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+
+            yield items
+
+            if remaining is not None and remaining <= 0:
+                return
+
+    def __iter__(self):
+        for items in self.pages():
+            yield from items
+
+    def __repr__(self):
+        return '{0.__class__.__name__}(request={0.request!r}, max_pages={0.max_pages}, max_items={0.max_items})'.format(self)
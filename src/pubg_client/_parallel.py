@@ -0,0 +1,87 @@
+"""Parallel Deserialization Module"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from . import _json
+from ._jsonapi import Document
+from .models._base import ModelEncoder
+
+
+def load_chunk(bodies, model, resolve_included=True, export=False):
+    """Decodes and loads a chunk of response bodies (in a worker process)
+
+    :param bodies: A list of response bodies (bytes or str)
+    :param model: The model class (or deserializer) of the bodies' primary data
+    :param resolve_included: Resolve the relationships against the ``included`` resources first
+    :param export: Return plain json data (dictionaries and lists) rather than models
+    :return: A list of models, or of dictionaries
+    """
+    loaded = []
+    for body in bodies:
+        document = _json.loads(body)
+        payload = Document(document).resolve() if resolve_included else document.get('data', {})
+        obj = model.load(payload)
+        loaded.append(_json.loads(ModelEncoder.dumps(obj)) if export else obj)
+    return loaded
+
+
+def _chunks(items, chunksize):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def load_many(bodies, model, chunksize=16, max_workers=None, export=False, resolve_included=True, executor=None):
+    """Loads many response bodies on a process pool, so the (pure python) deserialization uses every core
+
+    .. code-block:: python
+
+        bodies = (disk_cache.get(key) for key in keys)
+        for match in load_many(bodies, models.Match, chunksize=32):
+            ...
+
+    The bodies are sent to the workers in chunks of ``chunksize``, with at most ``max_workers * 2`` chunks in flight,
+    so the bodies can be a lazy iterable of any length. Results are yielded in the order of the bodies. Models are
+    pickled back to this process; ``export`` returns plain dictionaries instead, which are cheaper to send back when
+    the models are only going to be written out. An exception raised while loading a body is raised here.
+
+    :param bodies: An iterable of response bodies (bytes or str)
+    :param model: The model class of the bodies' primary data, e.g. :class:`models.Match`
+    :param chunksize: The number of bodies sent to a worker at once
+    :param max_workers: The number of processes (defaults to the number of cores); 0 loads in this process
+    :param export: Yield plain json data (dictionaries and lists) rather than models
+    :param resolve_included: Resolve the relationships against the ``included`` resources first
+    :param executor: A ``ProcessPoolExecutor`` to use (and leave running) instead of starting one; ``max_workers``
+        should then be its number of processes
+    :return: A generator of models, or of dictionaries
+    """
+    if max_workers == 0 and executor is None:
+        for chunk in _chunks(bodies, chunksize):
+            yield from load_chunk(chunk, model, resolve_included, export)
+        return
+
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+    window = (max_workers or os.cpu_count() or 1) * 2
+    chunks = _chunks(bodies, chunksize)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < window:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                pending.append(pool.submit(load_chunk, chunk, model, resolve_included, export))
+
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True)
@@ -0,0 +1,204 @@
+"""Rate limiting module"""
+import json
+import os
+import threading
+import time
+
+
+class RateLimiter:
+    """A token bucket that keeps callers inside the api key's request budget
+
+    The bucket refills continuously at ``limit / period`` until the api tells us better: after every response
+    :meth:`update` reads the ``X-RateLimit-*`` headers, clamps the bucket to what the server says is remaining and
+    stops refilling until the advertised reset time, when it is topped back up to the limit. A single limiter can be
+    shared by any number of threads (and clients using the same api key).
+    """
+
+    def __init__(self, limit=10, period=60.0, clock=time.time, sleep=time.sleep):
+        """
+
+        :param limit: The number of requests allowed per period, until the api reports its own limit
+        :param period: The length of the window in seconds
+        :param clock:
+        :param sleep:
+        """
+        self.limit = limit
+        self.period = period
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._state = self.initial_state()
+
+    def initial_state(self):
+        """
+
+        :return:
+        """
+        return {
+            'limit': self.limit,
+            'tokens': float(self.limit),
+            'updated': self.clock(),
+            'reset': None,
+        }
+
+    def load_state(self):
+        """
+
+        :return:
+        """
+        return self._state
+
+    def save_state(self, state):
+        """
+
+        :param state:
+        :return:
+        """
+        self._state = state
+
+    def locked(self):
+        """The lock guarding the state
+
+        :return:
+        """
+        return self._lock
+
+    def _refill(self, state, now):
+        if state['reset'] is not None:
+            if now >= state['reset']:
+                state['tokens'] = float(state['limit'])
+                state['reset'] = None
+        else:
+            rate = state['limit'] / self.period
+            state['tokens'] = min(float(state['limit']), state['tokens'] + (now - state['updated']) * rate)
+        state['updated'] = now
+
+    def try_acquire(self):
+        """Takes a token if one is available
+
+        :return: 0 if a token was taken, otherwise the number of seconds to wait before trying again
+        """
+        with self.locked():
+            state = self.load_state()
+            now = self.clock()
+            self._refill(state, now)
+
+            if state['tokens'] >= 1:
+                state['tokens'] -= 1
+                wait = 0
+            elif state['reset'] is not None:
+                wait = max(state['reset'] - now, 0.001)
+            else:
+                wait = (1 - state['tokens']) * self.period / state['limit']
+
+            self.save_state(state)
+            return wait
+
+    def acquire(self):
+        """Blocks until the request budget allows another request
+
+        :return: The number of seconds spent waiting
+        """
+        waited = 0
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return waited
+            self.sleep(wait)
+            waited += wait
+
+    def update(self, headers):
+        """Synchronises the bucket with the ``X-RateLimit-*`` headers of a response
+
+        :param headers:
+        :return:
+        """
+        try:
+            limit = int(headers['X-RateLimit-Limit'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = float(headers['X-RateLimit-Reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self.locked():
+            state = self.load_state()
+            self._refill(state, self.clock())
+            state['limit'] = limit
+            state['tokens'] = max(min(state['tokens'], float(remaining)), 0.0)
+            state['reset'] = reset
+            self.save_state(state)
+
+    def __repr__(self):
+        return '{0.__class__.__name__}(limit={0.limit}, period={0.period})'.format(self)
+
+
+class SharedRateLimiter(RateLimiter):
+    """A :class:`RateLimiter` whose bucket lives in a file, so several processes using one api key share one budget
+
+    The state file is guarded with ``fcntl.flock`` (POSIX only).
+    """
+
+    def __init__(self, path, limit=10, period=60.0, clock=time.time, sleep=time.sleep):
+        """
+
+        :param path: The state file, created if it does not exist
+        :param limit:
+        :param period:
+        :param clock:
+        :param sleep:
+        """
+        self.path = path
+        super().__init__(limit=limit, period=period, clock=clock, sleep=sleep)
+
+    def locked(self):
+        return _FileLock(self.path, self._lock)
+
+    def load_state(self):
+        with open(self.path, 'r') as f:
+            content = f.read()
+        if not content:
+            return self.initial_state()
+        return json.loads(content)
+
+    def save_state(self, state):
+        tmp_path = '{}.{}.tmp'.format(self.path, os.getpid())
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def __repr__(self):
+        return '{0.__class__.__name__}(path={0.path!r}, limit={0.limit}, period={0.period})'.format(self)
+
+
+class _FileLock:
+    """An exclusive lock on ``path`` + ``.lock`` that also serialises the threads of this process"""
+
+    def __init__(self, path, thread_lock):
+        self.path = path
+        self.thread_lock = thread_lock
+        self.fd = None
+
+    def __enter__(self):
+        import fcntl
+
+        self.thread_lock.acquire()
+        try:
+            self.fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        except Exception:
+            self.thread_lock.release()
+            raise
+
+        if not os.path.exists(self.path):
+            open(self.path, 'a').close()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        import fcntl
+
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+        finally:
+            self.fd = None
+            self.thread_lock.release()
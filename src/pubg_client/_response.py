@@ -0,0 +1,64 @@
+"""Response helpers"""
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from . import _json
+
+
+class PUBGResponse(Response):
+    """A ``requests.Response`` that decodes its body once, with the package's json backend
+
+    The endpoints, the paginator and ``Client.next_page`` and friends all read the same decoded document.
+    """
+
+    _json = None
+
+    @classmethod
+    def adopt(cls, response):
+        """Turns a response from a ``requests`` transport into a :class:`PUBGResponse` in place
+
+        :param response:
+        :return:
+        """
+        # Only behaviour is added, so switching the class keeps every attribute the transport has set.
+        if not isinstance(response, cls):
+            response.__class__ = cls
+        return response
+
+    def json(self, **kwargs):
+        """
+
+        :param kwargs: Passed to ``requests`` (bypassing the cache)
+        :return: The decoded body
+        """
+        if kwargs:
+            return super().json(**kwargs)
+        if self._json is None:
+            try:
+                self._json = _json.loads(self.content)
+            except ValueError:
+                # Let requests raise its own decode error
+                return super().json()
+        return self._json
+
+
+def make_response(content, status_code=200, headers=None, url=None, reason=None):
+    """Builds a :class:`PUBGResponse` around an already downloaded body
+
+    Used wherever a body arrives some other way than a ``requests`` transport, so the endpoints can handle it exactly
+    like a live response.
+
+    :param content: The body, as bytes
+    :param status_code:
+    :param headers:
+    :param url:
+    :param reason:
+    :return:
+    """
+    response = PUBGResponse()
+    response._content = content
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = url
+    response.reason = reason
+    return response
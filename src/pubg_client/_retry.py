@@ -0,0 +1,298 @@
+"""Retry Module"""
+import email.utils
+import random
+import sys
+import threading
+import time
+from collections import namedtuple
+
+import requests
+
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, TimeoutError)
+"""The exceptions that are worth retrying (plus ``aiohttp``'s connection errors, see :func:`transient_errors`)"""
+
+
+def transient_errors():
+    """
+
+    :return: :data:`TRANSIENT_ERRORS`, with the ``asyncio`` and ``aiohttp`` ones if those are in use
+    """
+    errors = TRANSIENT_ERRORS
+    # Only modules that are already imported can have raised, so nothing is imported here
+    if 'asyncio' in sys.modules:
+        errors += (sys.modules['asyncio'].TimeoutError,)
+    if 'aiohttp' in sys.modules:
+        errors += (sys.modules['aiohttp'].ClientConnectionError,)
+    return errors
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+Permit = namedtuple('Permit', ['generation', 'trial'])
+"""What :meth:`CircuitBreaker.allow` lets a request through with, to be handed back to :meth:`CircuitBreaker.record`"""
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request while the circuit breaker of its shard is open"""
+
+    def __init__(self, key, retry_in, *args, **kwargs):
+        """
+
+        :param key: The shard (or other key) of the open breaker
+        :param retry_in: The number of seconds until a request is let through again
+        """
+        super().__init__('circuit open for {key}, retry in {retry_in:.1f}s'.format(key=key, retry_in=retry_in), *args, **kwargs)
+        self.key = key
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """Retries idempotent requests that failed transiently, with exponential backoff and full jitter
+
+    A request is retried when it raised a connection error or timeout, or came back with one of ``statuses``, as long
+    as its method is in ``methods`` and fewer than ``max_attempts`` attempts were made. The n-th retry waits a random
+    time up to ``backoff * 2 ** (n - 1)`` (at most ``max_backoff``); a ``Retry-After`` header is honoured instead
+    when present (at most ``max_retry_after``).
+    """
+
+    def __init__(self, max_attempts=4, backoff=0.5, max_backoff=30.0, statuses=(429, 500, 502, 503, 504),
+                 methods=('GET', 'HEAD'), max_retry_after=120.0, jitter=True, sleep=time.sleep, random=random.random):
+        """
+
+        :param max_attempts: The number of attempts, including the first
+        :param backoff: The base of the exponential backoff, in seconds
+        :param max_backoff:
+        :param statuses: The status codes that are retried
+        :param methods: The (idempotent) methods that are retried
+        :param max_retry_after: The longest ``Retry-After`` that is waited for
+        :param jitter: Wait a random time up to the backoff rather than the full backoff
+        :param sleep:
+        :param random:
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(methods)
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.sleep = sleep
+        self.random = random
+        self.retries = 0
+        self.gave_up = 0
+        self._lock = threading.Lock()
+
+    def should_retry(self, method, attempt, response=None, error=None):
+        """
+
+        :param method:
+        :param attempt: The number of attempts made so far
+        :param response: The response of the last attempt, if any
+        :param error: The exception the last attempt raised, if any
+        :return:
+        """
+        if error is not None:
+            transient = isinstance(error, transient_errors())
+        else:
+            transient = response is not None and response.status_code in self.statuses
+
+        if not transient or method not in self.methods:
+            return False
+
+        with self._lock:
+            if attempt >= self.max_attempts:
+                self.gave_up += 1
+                return False
+            self.retries += 1
+            return True
+
+    def delay(self, attempt, response=None):
+        """
+
+        :param attempt: The number of attempts made so far
+        :param response: The response of the last attempt, if any
+        :return: The number of seconds to wait before the next attempt
+        """
+        retry_after = self.retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+
+        backoff = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return backoff * self.random() if self.jitter else backoff
+
+    @staticmethod
+    def retry_after(response):
+        """
+
+        :param response:
+        :return: The ``Retry-After`` of a response in seconds, or None
+        """
+        value = response.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, date.timestamp() - time.time())
+
+    def stats(self):
+        """
+
+        :return:
+        """
+        return {'retries': self.retries, 'gave_up': self.gave_up}
+
+
+class CircuitBreaker:
+    """Fails fast while a shard is unhealthy
+
+    After ``failure_threshold`` consecutive failures (connection errors and 5xx responses) the breaker opens and every
+    request raises :class:`CircuitOpenError` without being sent. Once ``recovery_timeout`` has passed a single trial
+    request is let through (half open): its success closes the breaker, its failure opens it again.
+
+    Every request is let through with a :class:`Permit` that is handed back with its outcome. While the breaker is
+    open or half open only the trial's outcome counts, and requests let through before the breaker last opened are
+    ignored when they finish, so a slow request can neither take the trial's place nor extend the cool-down.
+    """
+
+    def __init__(self, key=None, failure_threshold=5, recovery_timeout=30.0, clock=time.monotonic):
+        """
+
+        :param key: What the breaker guards, e.g. a shard
+        :param failure_threshold:
+        :param recovery_timeout: The number of seconds the breaker stays open
+        :param clock:
+        """
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._state = CLOSED
+        self._opened_at = None
+        self._generation = 0
+        self._trial = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """``'closed'``, ``'open'`` or ``'half-open'``"""
+        with self._lock:
+            if self._state == OPEN and self.clock() - self._opened_at >= self.recovery_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self):
+        """Lets a request through, or raises :class:`CircuitOpenError`
+
+        :return: The request's :class:`Permit`, for :meth:`record`
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return Permit(self._generation, False)
+
+            retry_in = self._opened_at + self.recovery_timeout - self.clock()
+            if retry_in <= 0 and self._trial is None:
+                self._generation += 1
+                self._trial = Permit(self._generation, True)
+                self._state = HALF_OPEN
+                return self._trial
+
+            self.rejected += 1
+            raise CircuitOpenError(self.key, max(retry_in, 0.0))
+
+    def record(self, permit, response=None, error=None):
+        """Records the outcome of a request that was let through
+
+        :param permit: The :class:`Permit` :meth:`allow` returned for the request
+        :param response:
+        :param error:
+        :return:
+        """
+        failed = error is not None or (response is not None and response.status_code >= 500)
+        with self._lock:
+            if permit is self._trial:
+                self._trial = None
+                if failed:
+                    self._open()
+                else:
+                    self.failures = 0
+                    self._state = CLOSED
+                return
+
+            if self._state != CLOSED or permit.generation != self._generation:
+                return
+
+            if not failed:
+                self.failures = 0
+                return
+
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.opened += 1
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self._generation += 1
+
+    def stats(self):
+        """
+
+        :return:
+        """
+        return {'state': self.state, 'failures': self.failures, 'opened': self.opened, 'rejected': self.rejected}
+
+
+class CircuitBreakers:
+    """A :class:`CircuitBreaker` per shard, created on first use
+
+    .. code-block:: python
+
+        client = Client(retry_policy=RetryPolicy(), circuit_breakers=CircuitBreakers(failure_threshold=10))
+        ...
+        print(client.circuit_breakers.stats())
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0, clock=time.monotonic):
+        """
+
+        :param failure_threshold:
+        :param recovery_timeout:
+        :param clock:
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+
+        :param key: A shard, or None for the requests outside a shard (e.g. status)
+        :return: The key's :class:`CircuitBreaker`
+        """
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(key, self.failure_threshold, self.recovery_timeout, self.clock)
+            return self._breakers[key]
+
+    def stats(self):
+        """
+
+        :return: The stats of every breaker, by key
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.stats() for key, breaker in breakers.items()}
@@ -0,0 +1,103 @@
+"""Single-flight Module"""
+import threading
+
+from ._lazy import LazyModule
+
+asyncio = LazyModule('asyncio')
+
+
+class _Call:
+    """A call in flight, which the callers asking for the same key wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one
+
+    While a call for a key is running, every other caller asking for that key waits for it and shares its result (or
+    its exception) instead of making its own. Nothing is kept once the call has returned, so this is not a cache: a
+    later call for the key runs again.
+
+    .. code-block:: python
+
+        client = Client(coalesce=True)
+        ...
+        print(client.single_flight.stats())
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+
+        :param key: A hashable key, e.g. :meth:`Endpoint.request_key`
+        :param fn: A callable without arguments
+        :return: ``(result, shared)``, where ``shared`` tells whether the result came from another caller's call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self):
+        """
+
+        :return:
+        """
+        return {'calls': self.calls, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
+
+
+class AsyncSingleFlight(SingleFlight):
+    """The asyncio version of :class:`SingleFlight`, for the calls of one event loop"""
+
+    async def do(self, key, fn):
+        """
+
+        :param key:
+        :param fn: A callable without arguments returning an awaitable
+        :return: ``(result, shared)``
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # Shielded, so a cancelled follower does not cancel the call for the others
+            return await asyncio.shield(future), True
+
+        future = self._calls[key] = asyncio.ensure_future(fn())
+        self.calls += 1
+        try:
+            return await asyncio.shield(future), False
+        finally:
+            if future.done():
+                del self._calls[key]
+            else:
+                future.add_done_callback(lambda _: self._calls.pop(key, None))
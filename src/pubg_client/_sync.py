@@ -0,0 +1,269 @@
+"""Sync Module"""
+import re
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from datetime import timezone
+
+from .models._base import Timestamp
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+_API_TIMESTAMP = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z\Z')
+
+Watermark = namedtuple('Watermark', ['shard', 'created_at', 'seen'])
+"""How far a shard has been synced: the newest ``createdAt`` committed (or None) and the ids committed at it"""
+
+SyncResult = namedtuple('SyncResult', ['shard', 'pages', 'fetched', 'new', 'watermark'])
+"""The outcome of a sync run on one shard: the pages and matches fetched, the new matches and the final watermark"""
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS watermarks (
+    shard TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seen (
+    shard TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (shard, match_id)
+);
+'''
+
+
+class SyncStore:
+    """Keeps the sync watermark of every shard in a SQLite database
+
+    A page is committed in one transaction: its ids, the advanced watermark and (optionally) whatever the caller
+    writes to :attr:`connection` while handling it. Ids older than the watermark are pruned, as the next run never
+    asks for them again, so the store does not grow with the history.
+    """
+
+    def __init__(self, path=':memory:'):
+        """
+
+        :param path: The database file, or ``':memory:'``
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        """The SQLite connection, usable by page handlers to store the matches in the same transaction"""
+        self._lock = threading.RLock()
+        with self._lock:
+            if path != ':memory:':
+                self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.executescript(SCHEMA)
+
+    def watermark(self, shard):
+        """
+
+        :param shard:
+        :return: The shard's :class:`Watermark`
+        """
+        with self._lock:
+            row = self.connection.execute('SELECT created_at FROM watermarks WHERE shard = ?', (shard,)).fetchone()
+            if row is None:
+                return Watermark(shard, None, frozenset())
+            seen = self.connection.execute('SELECT match_id FROM seen WHERE shard = ? AND created_at = ?',
+                                           (shard, row[0])).fetchall()
+        return Watermark(shard, row[0], frozenset(match_id for match_id, in seen))
+
+    def unseen(self, shard, ids):
+        """
+
+        :param shard:
+        :param ids: An iterable of match ids
+        :return: The ids that have not been committed for the shard, in their order
+        """
+        ids = list(ids)
+        with self._lock:
+            seen = set()
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                rows = self.connection.execute(
+                    'SELECT match_id FROM seen WHERE shard = ? AND match_id IN ({})'.format(','.join('?' * len(chunk))),
+                    [shard] + chunk,
+                ).fetchall()
+                seen.update(match_id for match_id, in rows)
+        return [id for id in ids if id not in seen]
+
+    def commit(self, shard, matches, handler=None):
+        """Records a page of matches and advances the shard's watermark, atomically
+
+        :param shard:
+        :param matches: A list of ``(match_id, created_at)`` pairs
+        :param handler: A callable without arguments run inside the transaction; if it raises, nothing is committed
+        :return: The new :class:`Watermark`
+        """
+        with self._lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                if handler is not None:
+                    handler()
+                self.connection.executemany('INSERT OR IGNORE INTO seen (shard, match_id, created_at) VALUES (?, ?, ?)',
+                                            [(shard, id, created_at) for id, created_at in matches])
+                row = self.connection.execute('SELECT created_at FROM watermarks WHERE shard = ?', (shard,)).fetchone()
+                # The watermark never moves back, even for a page the api returned out of order
+                created_at = max([created_at for _, created_at in matches] + ([row[0]] if row else []), default=None)
+                if created_at is not None:
+                    self.connection.execute('INSERT OR REPLACE INTO watermarks (shard, created_at, updated_at) VALUES (?, ?, ?)',
+                                            (shard, created_at, time.time()))
+                    self.connection.execute('DELETE FROM seen WHERE shard = ? AND created_at < ?', (shard, created_at))
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+            self.connection.execute('COMMIT')
+        return self.watermark(shard)
+
+    def reset(self, shard=None):
+        """Forgets the watermark of a shard, or of every shard
+
+        :param shard:
+        :return:
+        """
+        with self._lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                for table in ('watermarks', 'seen'):
+                    if shard is None:
+                        self.connection.execute('DELETE FROM {}'.format(table))
+                    else:
+                        self.connection.execute('DELETE FROM {} WHERE shard = ?'.format(table), (shard,))
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+            self.connection.execute('COMMIT')
+
+    def close(self):
+        """
+
+        :return:
+        """
+        with self._lock:
+            self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def match_key(match):
+    """The id and ``createdAt`` of a match model (or raw match resource)
+
+    :param match:
+    :return: ``(match_id, created_at)``, with ``created_at`` in the api's timestamp format
+    """
+    if isinstance(match, dict):
+        return match['id'], utc_timestamp((match.get('attributes') or {})['createdAt'])
+    return match.id, utc_timestamp(match.created_at)
+
+
+def utc_timestamp(value):
+    """Formats a timestamp like the api's ``2018-03-12T14:08:16Z``, so watermarks compare in time order as strings
+
+    Fractions of a second are dropped, which moves a watermark back by less than a second: the matches of that
+    second are still recognized as seen by their ids.
+
+    :param value: A datetime, or a timestamp string in any format ``pendulum`` parses
+    :return:
+    """
+    if isinstance(value, str):
+        if _API_TIMESTAMP.match(value):
+            return value
+        value = Timestamp()(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime(TIMESTAMP_FORMAT)
+
+
+class MatchSync:
+    """Syncs the matches of each shard incrementally, resuming from the watermark of the last committed page
+
+    Every run asks ``api.matches`` only for the matches created at or after the shard's watermark, sorted by
+    ``createdAt``, skips the ones already committed and hands the new ones of each page to ``handler`` before
+    committing the page. A crashed or interrupted run starts again from its last committed page, so each run costs
+    the new matches rather than the whole history, and a page is handled at least once.
+
+    .. code-block:: python
+
+        def save(shard, matches):
+            store.connection.executemany('INSERT INTO matches VALUES (?, ?)', ...)
+
+        sync = MatchSync(client, SyncStore('sync.db'), handler=save)
+        for result in sync.run(['pc-na', 'pc-eu']):
+            print(result.shard, result.new, result.watermark.created_at)
+    """
+
+    filter_name = 'createdAt-start'
+    """The filter the watermark is sent as"""
+
+    sort_key = 'createdAt'
+    """The sort order of the pages, oldest first, so the watermark only moves forward"""
+
+    def __init__(self, client, store, handler=None, page_size=None, filters=None, max_pages=None, prefetch=True):
+        """
+
+        :param client:
+        :param store: A :class:`SyncStore`
+        :param handler: A callable taking the shard and the list of its new matches of a page, or None
+        :param page_size: The ``page[limit]`` of the requests, or None for the api's default
+        :param filters: Extra filters for every request, as a dictionary
+        :param max_pages: Stop each shard's run after this many pages
+        :param prefetch: Fetch the next page while the current one is handled and committed
+        """
+        self.client = client
+        self.store = store
+        self.handler = handler
+        self.page_size = page_size
+        self.filters = dict(filters or {})
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+
+    def request(self, shard, watermark):
+        """The request for the first page of matches newer than the watermark
+
+        :param shard:
+        :param watermark:
+        :return: A :class:`PUBGRequest`
+        """
+        request = self.client.for_shard(shard).api.matches.prepare()
+        for name, value in self.filters.items():
+            request.filter(name, value)
+        if watermark.created_at is not None:
+            request.filter(self.filter_name, watermark.created_at)
+        if self.page_size is not None:
+            request.limit(self.page_size)
+        return request.sort(self.sort_key)
+
+    def sync_shard(self, shard):
+        """
+
+        :param shard:
+        :return: A :class:`SyncResult`
+        """
+        watermark = self.store.watermark(shard)
+        pages = fetched = new = 0
+        for items in self.request(shard, watermark).paginate(max_pages=self.max_pages, prefetch=self.prefetch).pages():
+            pages += 1
+            fetched += len(items)
+            keys = [match_key(item) for item in items]
+            unseen = set(self.store.unseen(shard, (id for id, _ in keys)))
+            fresh = [item for item, (id, _) in zip(items, keys) if id in unseen]
+            new += len(fresh)
+
+            handler = None
+            if self.handler is not None and fresh:
+                handler = lambda: self.handler(shard, fresh)  # noqa: E731
+            watermark = self.store.commit(shard, [key for key in keys if key[0] in unseen], handler)
+        return SyncResult(shard, pages, fetched, new, watermark)
+
+    def run(self, shards=None):
+        """Syncs the shards one after the other (see :meth:`Client.fan_out` to sync them concurrently)
+
+        :param shards: An iterable of shards, defaults to the client's shard
+        :return: A list with the :class:`SyncResult` of every shard
+        """
+        shards = list(shards) if shards is not None else [self.client.shard]
+        return [self.sync_shard(shard) for shard in shards]
@@ -0,0 +1,124 @@
+"""Telemetry Module"""
+import codecs
+import re
+import zlib
+
+from . import _json
+from .models.telemetry import load_event
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Everything that is not a bracket, with strings (which may contain brackets) consumed whole
+_SKIP = re.compile(r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*')
+_TYPE = re.compile(r'"_T"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+class EventScanner:
+    """Splits a telemetry document (a json array of event objects) into the text of each event as it arrives
+
+    Only the structure of the document is scanned: runs of strings and scalars are skipped with a regular expression
+    and the brackets are counted, and the top level ``_T`` key of every event is noted on the way, so events can be
+    filtered by type before any of them is decoded.
+    """
+
+    def __init__(self):
+        self.buffer = ''
+        self.pos = 0
+        self.depth = 0
+        self.start = None
+        self.event_type = None
+
+    def feed(self, text):
+        """
+
+        :param text: The next piece of the document
+        :return: A list of ``(event_type, event_text)`` for the events completed by this piece
+        """
+        events = []
+        buffer = self.buffer + text
+        length = len(buffer)
+        pos = self.pos
+
+        while True:
+            end = _SKIP.match(buffer, pos).end()
+            if end == length or buffer[end] == '"':
+                # The run (or a string in it) continues in the next piece, rescan it once that has arrived
+                break
+
+            if self.depth == 2 and self.event_type is None:
+                event_type = _TYPE.search(buffer, pos, end)
+                if event_type is not None:
+                    self.event_type = event_type.group(1)
+
+            char = buffer[end]
+            pos = end + 1
+            if char in '{[':
+                self.depth += 1
+                if self.depth == 2:
+                    self.start = pos - 1
+                    self.event_type = None
+            else:
+                self.depth -= 1
+                if self.depth == 1 and self.start is not None:
+                    events.append((self.event_type, buffer[self.start:pos]))
+                    self.start = None
+
+        # Keep only what is still needed: the unfinished event, or the unscanned tail
+        keep = self.start if self.start is not None else pos
+        self.buffer = buffer[keep:]
+        self.pos = pos - keep
+        if self.start is not None:
+            self.start = 0
+        return events
+
+
+def iter_chunks(stream, chunk_size=64 * 1024):
+    """Reads a binary stream in chunks, transparently decompressing it if it is gzipped
+
+    :param stream: A binary file-like object
+    :param chunk_size:
+    :return: A generator of bytes
+    """
+    chunk = stream.read(chunk_size)
+    if not chunk.startswith(GZIP_MAGIC):
+        while chunk:
+            yield chunk
+            chunk = stream.read(chunk_size)
+        return
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    while chunk:
+        yield decompressor.decompress(chunk)
+        chunk = stream.read(chunk_size)
+    yield decompressor.flush()
+
+
+def iter_events(stream, event_types=None, raw=False, chunk_size=64 * 1024):
+    """Incrementally parses the events of a telemetry document
+
+    Memory use is bounded by the chunk size and the largest single event, however large the document is. Events
+    whose type is not in ``event_types`` are skipped without being decoded.
+
+    .. code-block:: python
+
+        with open('telemetry.json.gz', 'rb') as f:
+            for kill in iter_events(f, event_types={'LogPlayerKill'}):
+                print(kill.attacker['name'], kill.victim['name'])
+
+    :param stream: A binary file-like object, plain or gzipped json
+    :param event_types: A collection of event types (``_T``) to keep, or None for every event
+    :param raw: Yield the decoded dictionaries rather than event models
+    :param chunk_size:
+    :return: A generator of events
+    """
+    event_types = set(event_types) if event_types is not None else None
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    scanner = EventScanner()
+
+    for chunk in iter_chunks(stream, chunk_size=chunk_size):
+        for event_type, text in scanner.feed(decoder.decode(chunk)):
+            if event_types is not None and event_type not in event_types:
+                continue
+
+            payload = _json.loads(text)
+            yield payload if raw else load_event(payload)
@@ -1,2 +1,23 @@
-from .status import Status
-from .match import Match, Matches
+import importlib
+import sys
+
+MODULES = ('status', 'match')
+"""The endpoint modules, which register their endpoints on :class:`API` when imported (see ``load_endpoints``)"""
+
+_modules = {
+    'Status': '.status',
+    'Match': '.match',
+    'Matches': '.match',
+}
+
+
+def __getattr__(name):
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    return getattr(importlib.import_module(_modules[name], __name__), name)
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ needs Python 3.7, so older interpreters import the endpoint modules up front
+    from .status import Status  # noqa: E402,F401
+    from .match import Match, Matches  # noqa: E402,F401
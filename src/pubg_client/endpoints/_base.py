@@ -1,31 +1,59 @@
+import copy
+import time
+
+from .._jsonapi import Document
+from .._response import make_response
 from ..models._base import PassThrough
+from ..models._variants import variant
 
 
 class Endpoint:
     """The endpoint class"""
     requires_shard = False
 
-    def __init__(self, deserializer=None, client=None):
+    immutable = False
+    """Whether the resources never change once created (and so can be kept in the client's ``disk_cache``)"""
+
+    resolve_included = False
+    """Whether relationships are resolved against the ``included`` resources before deserializing"""
+
+    item_deserializer = None
+    """The deserializer of a single item of a collection endpoint's pages"""
+
+    def __init__(self, deserializer=None, client=None, name=None):
         """
 
         :param deserializer:
         :param client:
+        :param name: The name the endpoint is registered under on the api namespace
         """
 
         if deserializer is None:
             deserializer = PassThrough(name=self.__class__.__name__)
 
         self.deserializer = deserializer
+        self.name = name if name is not None else self.__class__.__name__.lower()
         self.client = client
         self.autocall = False
         self.raw = False
+        self.documents = False
 
     def __get__(self, instance, cls):
-        """Allows the endpoint to grab useful information from the API container (and client)"""
-        self.client = instance.client
-        self.raw = instance.raw
-        self.autocall = instance.autocall
-        return self
+        """Allows the endpoint to grab useful information from the API container (and client)
+
+        The registered endpoint is shared by every client and never modified: a copy bound to the accessing api
+        namespace is returned instead, and kept in the namespace's ``__dict__`` so later lookups find it directly.
+        Bound endpoints are not modified either, so any number of threads can use them.
+        """
+        if instance is None:
+            return self
+        endpoint = copy.copy(self)
+        endpoint.client = instance.client
+        endpoint.raw = instance.raw
+        endpoint.autocall = instance.autocall
+        if getattr(cls, self.name, None) is self:
+            instance.__dict__[self.name] = endpoint
+        return endpoint
 
     def url(self):
         """
@@ -43,17 +71,260 @@ class Endpoint:
         :param prepared_request:
         :return:
         """
-        response = self.client.make_request(prepared_request)
+        start = time.perf_counter()
+        trace = {}
+        try:
+            single_flight = self.client.single_flight
+            if single_flight is not None and prepared_request.method == 'GET':
+                result, shared = single_flight.do(self.request_key(prepared_request), lambda: self.dispatch(prepared_request, trace))
+                if shared:
+                    trace['cache'] = 'coalesced'
+            else:
+                result = self.dispatch(prepared_request, trace)
+        except Exception as exc:
+            self.client.fire_request_event('endpoint_request', prepared_request, start, endpoint=self.name, error=exc, **trace)
+            raise
+
+        self.client.fire_request_event('endpoint_request', prepared_request, start, endpoint=self.name, **trace)
+        return result
+
+    def dispatch(self, prepared_request, trace):
+        """Makes the request through the client's caches, if any
+
+        :param prepared_request:
+        :param trace: Collects the fields of the ``endpoint_request`` event
+        :return:
+        """
+        return self.run_steps(self.dispatch_steps(prepared_request, trace), trace)
+
+    def dispatch_steps(self, prepared_request, trace):
+        """The steps of :meth:`dispatch`, without any I/O
+
+        A generator yielding ``('send', prepared_request)`` and ``('process', response)`` and receiving the result of
+        each, and returning the endpoint's result. The blocking client runs it with :meth:`run_steps`, the asyncio
+        client with coroutines, so both share the cache logic.
+
+        :param prepared_request:
+        :param trace: Collects the fields of the ``endpoint_request`` event
+        :return:
+        """
+        if self.immutable and self.client.disk_cache is not None:
+            return (yield from self.cached_steps(prepared_request, self.client.disk_cache, trace))
+        elif not self.immutable and self.client.ttl_cache is not None and prepared_request.method == 'GET':
+            return (yield from self.revalidated_steps(prepared_request, self.client.ttl_cache, trace))
+        response = yield 'send', prepared_request
+        return (yield 'process', response)
+
+    def run_steps(self, steps, trace):
+        """Runs the steps of :meth:`dispatch_steps` with :meth:`send` and :meth:`process`
+
+        :param steps:
+        :param trace: Collects the fields of the ``endpoint_request`` event
+        :return:
+        """
+        result = None
+        while True:
+            try:
+                action, value = steps.send(result)
+            except StopIteration as stop:
+                return stop.value
+            result = self.send(value, trace) if action == 'send' else self.process(value, trace)
+
+    def send(self, prepared_request, trace):
+        """Makes the request, timing the network
+
+        :param prepared_request:
+        :param trace: Collects the fields of the ``endpoint_request`` event
+        :return:
+        """
+        start = time.perf_counter()
+        try:
+            return self.client.make_request(prepared_request, self.client.retry_policy_for(self.name))
+        finally:
+            trace['network'] = trace.get('network', 0.0) + time.perf_counter() - start
+
+    def process(self, response, trace):
+        """Processes the response, timing the deserialization
+
+        :param response:
+        :param trace: Collects the fields of the ``endpoint_request`` event
+        :return:
+        """
+        trace['status_code'] = response.status_code
+        trace['bytes'] = len(response.content)
+        start = time.perf_counter()
+        try:
+            return self.process_response(response)
+        finally:
+            trace['deserialize'] = time.perf_counter() - start
+
+    def request_cached(self, prepared_request, cache, trace=None):
+        """Serves the request from the disk cache, only going to the network on a miss
+
+        :param prepared_request:
+        :param cache: A :class:`DiskCache`
+        :param trace: Collects the fields of the ``endpoint_request`` event
+        :return:
+        """
+        trace = trace if trace is not None else {}
+        return self.run_steps(self.cached_steps(prepared_request, cache, trace), trace)
+
+    def cached_steps(self, prepared_request, cache, trace):
+        """The steps of :meth:`request_cached`, see :meth:`dispatch_steps`
+
+        :param prepared_request:
+        :param cache: A :class:`DiskCache`
+        :param trace:
+        :return:
+        """
+        key = self.cache_key(prepared_request)
+        if key is not None:
+            content = cache.get(key)
+            if content is not None:
+                trace['cache'] = 'hit'
+                return (yield 'process', make_response(content, url=prepared_request.url))
+
+        trace['cache'] = 'miss'
+        response = yield 'send', prepared_request
+
+        if key is not None and response.status_code == 200:
+            cache.set(key, response.content)
+
+        return (yield 'process', response)
+
+    def request_revalidated(self, prepared_request, cache, trace=None):
+        """Serves the request from the ttl cache while it is fresh, then revalidates it with a conditional request
+
+        :param prepared_request:
+        :param cache: A :class:`TTLCache`
+        :param trace: Collects the fields of the ``endpoint_request`` event
+        :return:
+        """
+        trace = trace if trace is not None else {}
+        return self.run_steps(self.revalidated_steps(prepared_request, cache, trace), trace)
+
+    def revalidated_steps(self, prepared_request, cache, trace):
+        """The steps of :meth:`request_revalidated`, see :meth:`dispatch_steps`
+
+        :param prepared_request:
+        :param cache: A :class:`TTLCache`
+        :param trace:
+        :return:
+        """
+        key = self.request_key(prepared_request)
+        ttl = cache.ttl_for(self.name)
+        entry = cache.get(key)
+
+        if entry is not None and entry.fresh:
+            trace['cache'] = 'hit'
+            return entry.value
+
+        if entry is not None:
+            prepared_request = copy.copy(prepared_request)
+            prepared_request.headers = dict(prepared_request.headers)
+            if entry.etag is not None:
+                prepared_request.headers['If-None-Match'] = entry.etag
+            if entry.last_modified is not None:
+                prepared_request.headers['If-Modified-Since'] = entry.last_modified
+
+        response = yield 'send', prepared_request
+
+        if entry is not None and response.status_code == 304:
+            cache.revalidated(key, ttl)
+            trace.update(cache='revalidated', status_code=304, bytes=len(response.content))
+            return entry.value
+
+        trace['cache'] = 'miss'
+        result = yield 'process', response
+        if response.ok:
+            cache.set(key, result, ttl, etag=response.headers.get('ETag'), last_modified=response.headers.get('Last-Modified'))
+        return result
+
+    def cache_key(self, prepared_request):
+        """The key a request's response is cached under in the disk cache, or None if it should not be cached
+
+        :param prepared_request:
+        :return:
+        """
+        return None
+
+    def request_key(self, prepared_request):
+        """Identifies a request (and the form of its result) for in memory caching
+
+        :param prepared_request:
+        :return:
+        """
+        params = tuple(sorted((key, str(value)) for key, value in prepared_request.params.items()))
+        return (self.name, prepared_request.method, prepared_request.url, params, self.raw, self.documents,
+                self.client.model_mode)
 
+    def process_response(self, response):
+        """Turns a response into the endpoint's result (a model, or the raw data)
+
+        :param response:
+        :return:
+        """
         if not response.ok:
             return self.handle_error(response)
 
+        document = response.json()
+        if self.documents:
+            return document
         if not self.raw:
-            resp = self.deserializer.load(response.json().get('data', {}))
+            deserializer = variant(self.deserializer, self.client.model_mode)
+            resp = deserializer.load(self.extract(document))
             resp._response = response
             return resp
         else:
-            return response.json().get('data', {})
+            return document.get('data', {})
+
+    def extract(self, document):
+        """Picks the payload to deserialize out of a response body
+
+        :param document:
+        :return:
+        """
+        if self.resolve_included:
+            return Document(document).resolve()
+        return document.get('data', {})
+
+    def items(self, document):
+        """The deserialized items of a page of a collection endpoint
+
+        :param document: The decoded response body
+        :return: A list of models (or of the raw resources)
+        """
+        if self.raw:
+            return list(document.get('data') or [])
+
+        data = Document(document).resolve() if self.resolve_included else document.get('data') or []
+        deserializer = self.item_deserializer
+        if deserializer is None:
+            deserializer = PassThrough(name=self.__class__.__name__)
+        deserializer = variant(deserializer, self.client.model_mode)
+        return [deserializer.load(item) for item in data]
+
+    def document_endpoint(self):
+        """A copy of the endpoint whose results are the decoded response bodies, such as the pages of a
+        :class:`Paginator`, rather than models
+
+        The copy goes through the same request path: hooks, caches, single-flight and the endpoint's retry policy.
+
+        :return:
+        """
+        endpoint = copy.copy(self)
+        endpoint.documents = True
+        return endpoint
+
+    def follow(self, url):
+        """Requests a page of the endpoint by its url (from the ``links`` of another page)
+
+        :param url:
+        :return:
+        """
+        prepared_request = self.client.prepare_request('GET', url)
+        prepared_request.client_or_endpoint = self
+        return prepared_request()
 
     def __repr__(self):
         return '{0.__class__.__name__}(deserializer={1}, client={2})'.format(
@@ -76,10 +347,35 @@ class Endpoint:
         :param kwargs:
         :return:
         """
-        url = self.url()
-        prepared_request = self.client.prepare_request(self.method, url, **kwargs)
-        prepared_request.client_or_endpoint = self
+        prepared_request = self.prepare(**kwargs)
         if self.autocall:
             return prepared_request()
         else:
             return prepared_request
+
+    def prepare(self, **kwargs):
+        """
+
+        :param kwargs:
+        :return:
+        """
+        url = self.url()
+        prepared_request = self.client.prepare_request(self.method, url, **kwargs)
+        prepared_request.client_or_endpoint = self
+        return prepared_request
+
+    def paginate(self, max_pages=None, max_items=None, prefetch=True, **kwargs):
+        """Iterates over the items of every page, following ``links.next``
+
+        .. code-block:: python
+
+            for match in client.api.matches.paginate(max_pages=10):
+                ...
+
+        :param max_pages: Stop after this many pages
+        :param max_items: Stop after this many items
+        :param prefetch: Fetch the next page in the background while the current one is processed
+        :param kwargs:
+        :return: A :class:`Paginator`
+        """
+        return self.prepare(**kwargs).paginate(max_pages=max_pages, max_items=max_items, prefetch=prefetch)
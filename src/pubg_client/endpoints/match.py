@@ -1,4 +1,5 @@
 from .._api import API
+from .._batch import Batch
 from ..models import match
 from ._base import Endpoint
 
@@ -16,6 +17,20 @@ class Matches(Endpoint):
     requires_shard = True
     """Requires Shard"""
 
+    resolve_included = True
+    """Every match of a page is resolved against the page's ``included`` resources"""
+
+    item_deserializer = match.Match()
+    """Deserializer of the matches of a page"""
+
+    def extract(self, document):
+        """Keeps the page's ``links`` next to its resolved matches
+
+        :param document:
+        :return:
+        """
+        return {'data': super().extract(document), 'links': document.get('links') or {}}
+
 
 @API.register('match', match.Match())
 class Match(Endpoint):
@@ -28,6 +43,12 @@ class Match(Endpoint):
     requires_shard = True
     """Requires Shard"""
 
+    immutable = True
+    """A finished match never changes"""
+
+    resolve_included = True
+    """Rosters, participants and assets are sent as relationships plus ``included`` resources"""
+
     def url(self, id):
         """
 
@@ -43,10 +64,50 @@ class Match(Endpoint):
         :param kwargs:
         :return:
         """
-        url = self.url(id=id)
-        prepared_request = self.client.prepare_request(self.method, url, **kwargs)
-        prepared_request.client_or_endpoint = self
+        prepared_request = self.prepare(id, **kwargs)
         if self.autocall:
             return prepared_request()
         else:
             return prepared_request
+
+    def prepare(self, id, **kwargs):
+        """
+
+        :param id:
+        :param kwargs:
+        :return:
+        """
+        url = self.url(id=id)
+        prepared_request = self.client.prepare_request(self.method, url, **kwargs)
+        prepared_request.client_or_endpoint = self
+        return prepared_request
+
+    def cache_key(self, prepared_request):
+        """Matches are cached by shard and id
+
+        :param prepared_request:
+        :return:
+        """
+        if prepared_request.params:
+            return None
+        shard, _, id = prepared_request.url.partition('/shards/')[2].split('/', 2)
+        return shard, id
+
+    def many(self, ids, max_workers=None, ordered=False):
+        """Fetches many matches concurrently over the client's pooled connections
+
+        .. code-block:: python
+
+            matches = client.api.match.many(ids, max_workers=16)
+            for match in matches:
+                ...
+            print(matches.errors)
+
+        :param ids: An iterable of match ids
+        :param max_workers: The number of concurrent requests, defaults to the client's ``pool_maxsize``
+        :param ordered: Yield the matches in the order of ``ids`` rather than as they complete
+        :return: A :class:`Batch`, whose ``errors`` maps each failed id to its exception
+        """
+        self.client.check_blocking('Match.many')
+        max_workers = max_workers if max_workers is not None else self.client.pool_maxsize
+        return Batch(lambda id: self.prepare(id)(), ids, max_workers=max_workers, ordered=ordered)
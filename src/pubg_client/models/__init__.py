@@ -3,3 +3,12 @@ from .participant import Participant
 from .roster import Roster
 from .status import Status, StatusAttributes
 from .match import Match, MatchCollection
+from .telemetry import (
+    LogMatchEnd,
+    LogMatchStart,
+    LogPlayerKill,
+    LogPlayerPosition,
+    LogPlayerTakeDamage,
+    TelemetryEvent,
+)
+from ._variants import compact, lazy
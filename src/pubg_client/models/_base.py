@@ -1,28 +1,71 @@
+import functools
+import re
 from collections import namedtuple
 from json import JSONEncoder
 
-import pendulum
+from .. import _json
+from .._jsonapi import Reference
+from .._lazy import LazyModule
+
+pendulum = LazyModule('pendulum')
+
+
+def encode(obj):
+    """Turns the objects a json backend cannot encode itself into ones it can
+
+    :param obj:
+    :return:
+    """
+    if isinstance(obj, Model):
+        return obj.export()
+
+    elif isinstance(obj, pendulum.Pendulum):
+        return obj.isoformat()
+
+    elif isinstance(obj, tuple):
+        return list(obj)
+
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
 
 
 class ModelEncoder(JSONEncoder):
     """Helper class for encoding objects as JSON"""
     def default(self, obj):
-        if isinstance(obj, Model):
-            return obj.export()
+        if isinstance(obj, (Model, pendulum.Pendulum)):
+            return encode(obj)
 
-        elif isinstance(obj, pendulum.Pendulum):
-            return obj.isoformat()
+        return super().default(obj)
 
-        return JSONEncoder.default(obj)
+    @staticmethod
+    def dumps(obj):
+        """Encodes models with the package's (fast, when available) json backend
+
+        :param obj:
+        :return: A compact json document
+        """
+        return _json.dumps(obj, default=encode)
 
 
 Mapping = namedtuple('Mapping', ['pubg_key', 'cls'])
 """Mapping container"""
 
 
+def convert(cls, value):
+    """Applies a mapping's converter, leaving None alone
+
+    :param cls:
+    :param value:
+    :return:
+    """
+    return cls(value) if value is not None else None
+
+
 class Model:
     """Model base class"""
 
+    # Empty, so subclasses keep their __dict__ unless they declare slots themselves (see models.compact)
+    __slots__ = ()
+
     key_map = {}
 
     def __init__(self, **kwargs):
@@ -41,17 +84,19 @@ class Model:
         :param payload:
         :return:
         """
+        if isinstance(payload, Reference):
+            return payload
         return self.load(payload)
 
     @classmethod
     def load(cls, payload):
-        """
+        """Missing and null values load as None
 
         :param payload:
         :return:
         """
         return cls(**{
-            key: mapping.cls(payload[mapping.pubg_key])
+            key: convert(mapping.cls, payload.get(mapping.pubg_key))
             for key, mapping in cls.key_map.items()
         })
 
@@ -62,7 +107,9 @@ class Model:
         """
         exported = {}
         for key, mapping in self.key_map.items():
-            if hasattr(mapping.cls, 'export'):
+            if getattr(self, key) is None:
+                exported[key] = None
+            elif hasattr(mapping.cls, 'export'):
                 exported[key] = getattr(self, key).export()
             elif isinstance(getattr(self, key), pendulum.Pendulum):
                 exported[key] = getattr(self, key).isoformat()
@@ -119,3 +166,41 @@ class List:
             self.obj(item)
             for item in payload
         ]
+
+
+class Timestamp:
+    """A converter for the api's UTC timestamps, e.g. ``2018-03-12T14:08:16Z`` or ``2018-03-12T14:08:16.123Z``
+
+    The fixed format is parsed directly, which is several times faster than ``pendulum.parse``; anything else falls
+    back to ``pendulum.parse``.
+    """
+
+    pattern = re.compile(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?Z\Z')
+
+    def __init__(self, maxsize=0):
+        """
+
+        :param maxsize: Memoize this many recently parsed values (0 to disable)
+        """
+        self.maxsize = maxsize
+        self._parse = functools.lru_cache(maxsize=maxsize)(self.parse) if maxsize else self.parse
+
+    def __call__(self, value):
+        return self._parse(value)
+
+    def parse(self, value):
+        """
+
+        :param value:
+        :return: A ``pendulum.Pendulum`` in UTC
+        """
+        match = self.pattern.match(value)
+        if match is None:
+            return pendulum.parse(value)
+
+        year, month, day, hour, minute, second, fraction = match.groups()
+        microsecond = int((fraction + '00000')[:6]) if fraction else 0
+        return pendulum.Pendulum(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond, tzinfo=pendulum.UTC)
+
+    def __repr__(self):
+        return '{0.__class__.__name__}(maxsize={0.maxsize})'.format(self)
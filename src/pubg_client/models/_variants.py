@@ -0,0 +1,139 @@
+"""Alternative in memory representations of the model classes"""
+import threading
+
+from ._base import List, Model, PassThrough, convert
+
+MODES = (None, 'compact', 'lazy')
+"""The model modes a client can use"""
+
+_variants = {}
+_lock = threading.RLock()
+
+
+def variant(deserializer, mode):
+    """The version of a deserializer (a model class or instance) for a model mode
+
+    :param deserializer:
+    :param mode: One of :data:`MODES`
+    :return:
+    """
+    if mode is None:
+        return deserializer
+    if isinstance(deserializer, List):
+        return List(variant(deserializer.obj, mode))
+    if isinstance(deserializer, type) and issubclass(deserializer, Model) and not issubclass(deserializer, PassThrough):
+        return variant_class(deserializer, mode)
+    if isinstance(deserializer, Model) and not isinstance(deserializer, PassThrough):
+        return variant_class(type(deserializer), mode)()
+    return deserializer
+
+
+def variant_class(cls, mode):
+    """
+
+    :param cls: A model class
+    :param mode: One of :data:`MODES`
+    :return: The (cached) variant of the class
+    """
+    if mode not in MODES:
+        raise ValueError('model mode not found! {mode}'.format(mode=mode))
+
+    key = (cls, mode)
+    with _lock:
+        if key not in _variants:
+            variant_cls = _BUILDERS[mode](cls)
+            # Registered before the key map is rewritten, so self referencing models terminate
+            _variants[key] = variant_cls
+            variant_cls.key_map = _rewrite_key_map(cls, mode)
+        return _variants[key]
+
+
+def _namespace(cls):
+    """The attributes a model class defines itself or inherits from other models"""
+    namespace = {}
+    for klass in reversed(cls.__mro__):
+        if klass in (object, Model):
+            continue
+        namespace.update({
+            key: value for key, value in vars(klass).items()
+            if key not in ('__dict__', '__weakref__', '__slots__')
+        })
+    return namespace
+
+
+def _rewrite_key_map(cls, mode):
+    return {
+        key: mapping._replace(cls=variant(mapping.cls, mode))
+        for key, mapping in cls.key_map.items()
+    }
+
+
+def _build_compact(cls):
+    namespace = _namespace(cls)
+    namespace['__slots__'] = tuple(cls.key_map) + ('_resp', '_response')
+    return type(cls.__name__, (Model,), namespace)
+
+
+class LazyField:
+    """Decodes a field from the stored payload on first access, then memoizes it in the instance"""
+
+    def __init__(self, key):
+        self.key = key
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        mapping = owner.key_map[self.key]
+        value = convert(mapping.cls, instance._payload.get(mapping.pubg_key))
+        # The descriptor only defines __get__, so from now on the instance attribute is found first
+        instance.__dict__[self.key] = value
+        return value
+
+
+def _lazy_load(cls, payload):
+    instance = cls.__new__(cls)
+    instance._payload = payload
+    instance._resp = None
+    return instance
+
+
+def _build_lazy(cls):
+    namespace = {key: LazyField(key) for key in cls.key_map}
+    namespace['load'] = classmethod(_lazy_load)
+    namespace['__doc__'] = cls.__doc__
+    namespace['__module__'] = cls.__module__
+    namespace['__qualname__'] = cls.__qualname__
+    return type(cls.__name__, (cls,), namespace)
+
+
+_BUILDERS = {
+    'compact': _build_compact,
+    'lazy': _build_lazy,
+}
+
+
+def compact(cls):
+    """A ``__slots__`` version of a model class, generated from its key map
+
+    The instances have no ``__dict__``, which saves a large share of the memory of big collections of (e.g.)
+    participants and rosters. ``load``, ``export`` and ``repr`` behave as for the original class, and nested models
+    in the key map are compact too. The compact class is not a subclass of the original, and instances cannot be
+    given attributes outside the key map.
+
+    :param cls: A model class
+    :return:
+    """
+    return variant_class(cls, 'compact')
+
+
+def lazy(cls):
+    """A subclass of a model class that keeps the raw payload and decodes each field on first access
+
+    Loading only stores the payload, so workloads that read a few fields of many models skip the cost of every
+    other converter (timestamp parsing, nested models). Decoded fields are memoized; ``export`` and
+    :class:`ModelEncoder` decode whatever they need.
+
+    :param cls: A model class
+    :return:
+    """
+    return variant_class(cls, 'lazy')
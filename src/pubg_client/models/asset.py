@@ -10,12 +10,17 @@ class Asset(Model):
         'shard_id': Mapping('shardId', str),
         'name': Mapping('name', str),
         'description': Mapping('description', str),
-        'createdAt': Mapping('description', str),
+        'created_at': Mapping('createdAt', str),
         'filename': Mapping('filename', str),
         'content_type': Mapping('contentType', str),
         'url': Mapping('URL', str),
     }
 
+    @property
+    def createdAt(self):
+        """Alias of ``created_at``, kept for backwards compatibility"""
+        return self.created_at
+
 
 class AssetCollection(Model):
     """A collection of assets"""
@@ -1,6 +1,4 @@
-import pendulum
-
-from ._base import List, Mapping, Model
+from ._base import List, Mapping, Model, Timestamp
 from .asset import Asset, AssetCollection
 from .roster import Roster
 
@@ -10,12 +8,12 @@ class Match(Model):
 
     key_map = {
         'id': Mapping('id', str),
-        'created_at': Mapping('createdAt', pendulum.parse),
+        'created_at': Mapping('createdAt', Timestamp()),
         'duration': Mapping('duration', int),
-        'rosters': Mapping('rosters', Roster),
-        'rounds': Mapping('rounds', dict),
+        'rosters': Mapping('rosters', List(Roster())),
+        'rounds': Mapping('rounds', list),
         'assets': Mapping('assets', List(Asset())),
-        'spectators': Mapping('spectators', dict),
+        'spectators': Mapping('spectators', list),
         'stats': Mapping('stats', dict),
         'game_mode': Mapping('gameMode', str),
         'patch_version': Mapping('patchVersion', str),
@@ -28,10 +26,29 @@ class Match(Model):
 class MatchCollection(Model):
     """A collection of matches with navigation conveninece methods"""
 
-    @classmethod
-    def load(cls, payload):
-        data = payload['data']
-        return super().load(data)
+    key_map = {
+        'matches': Mapping('data', List(Match())),
+        'links': Mapping('links', dict),
+    }
+
+    def next(self, client):
+        """
+
+        :param client: The client to request the page with
+        :return: The next page, or None on the last page
+        """
+        return self._follow(client, 'next')
+
+    def previous(self, client):
+        """
+
+        :param client: The client to request the page with
+        :return: The previous page, or None on the first page
+        """
+        return self._follow(client, 'prev')
 
-    def next(self):
-        pass
+    def _follow(self, client, link):
+        url = (self.links or {}).get(link)
+        if not url:
+            return None
+        return client.api.matches.follow(url)
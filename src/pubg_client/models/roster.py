@@ -7,7 +7,7 @@ class Roster(Model):
 
     key_map = {
         'id': Mapping('id', str),
-        'team': Mapping('team', str),
+        'team': Mapping('team', dict),
         'participants': Mapping('participants', List(Participant())),
         'stats': Mapping('stats', dict),
         'won': Mapping('won', str),
@@ -1,13 +1,11 @@
-import pendulum
-
-from ._base import Mapping, Model
+from ._base import Mapping, Model, Timestamp
 
 
 class StatusAttributes(Model):
     """A status attributes object. This is so that we can parse the released at string into a Datetime"""
 
     key_map = {
-        'released_at': Mapping('releasedAt', pendulum.parse),
+        'released_at': Mapping('releasedAt', Timestamp(maxsize=16)),
         'version': Mapping('version', str)
     }
 
@@ -0,0 +1,82 @@
+from ._base import Mapping, Model, PassThrough
+
+
+class TelemetryEvent(Model):
+    """Base class of the telemetry events"""
+
+    key_map = {
+        'type': Mapping('_T', str),
+        'timestamp': Mapping('_D', str),
+    }
+
+
+class LogMatchStart(TelemetryEvent):
+    """The match started"""
+
+    key_map = dict(TelemetryEvent.key_map, **{
+        'map_name': Mapping('mapName', str),
+        'characters': Mapping('characters', list),
+    })
+
+
+class LogMatchEnd(TelemetryEvent):
+    """The match ended"""
+
+    key_map = dict(TelemetryEvent.key_map, **{
+        'characters': Mapping('characters', list),
+    })
+
+
+class LogPlayerKill(TelemetryEvent):
+    """A player was killed"""
+
+    key_map = dict(TelemetryEvent.key_map, **{
+        'attacker': Mapping('attacker', dict),
+        'victim': Mapping('victim', dict),
+        'damage_type_category': Mapping('damageTypeCategory', str),
+        'damage_causer_name': Mapping('damageCauserName', str),
+        'distance': Mapping('distance', float),
+    })
+
+
+class LogPlayerTakeDamage(TelemetryEvent):
+    """A player took damage"""
+
+    key_map = dict(TelemetryEvent.key_map, **{
+        'attacker': Mapping('attacker', dict),
+        'victim': Mapping('victim', dict),
+        'damage_type_category': Mapping('damageTypeCategory', str),
+        'damage_reason': Mapping('damageReason', str),
+        'damage': Mapping('damage', float),
+        'damage_causer_name': Mapping('damageCauserName', str),
+    })
+
+
+class LogPlayerPosition(TelemetryEvent):
+    """A periodic player position update"""
+
+    key_map = dict(TelemetryEvent.key_map, **{
+        'character': Mapping('character', dict),
+        'elapsed_time': Mapping('elapsedTime', float),
+        'num_alive_players': Mapping('numAlivePlayers', int),
+    })
+
+
+EVENTS = {
+    event.__name__: event
+    for event in (LogMatchStart, LogMatchEnd, LogPlayerKill, LogPlayerTakeDamage, LogPlayerPosition)
+}
+"""Event classes by telemetry type (``_T``)"""
+
+
+def load_event(payload):
+    """Loads a telemetry event with its typed class, falling back to a :class:`PassThrough` for unknown types
+
+    :param payload:
+    :return:
+    """
+    event_type = payload.get('_T')
+    event = EVENTS.get(event_type)
+    if event is not None:
+        return event.load(payload)
+    return PassThrough(name=event_type or 'TelemetryEvent').load(payload)
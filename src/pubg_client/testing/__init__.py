@@ -0,0 +1,4 @@
+"""Test doubles for load, latency and integration testing: synthetic payloads, a local mock api and a load harness"""
+from .load import LoadReport, run_load
+from .payloads import match_document, matches_document, page_document, status_document, telemetry_events
+from .server import MockServer
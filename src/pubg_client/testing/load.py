@@ -0,0 +1,135 @@
+"""Load generation against a client, reporting throughput and latency percentiles"""
+import itertools
+import math
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from .._client import PUBGRequest
+
+
+def percentile(sorted_values, q):
+    """The nearest-rank percentile of sorted values
+
+    :param sorted_values:
+    :param q: Between 0 and 1
+    :return: The percentile, or None without values
+    """
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(q * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LoadReport:
+    """The outcome of :func:`run_load`: the latency of every call, the errors by type and the wall time"""
+
+    quantiles = (0.5, 0.9, 0.99)
+    """The percentiles of :meth:`summary`"""
+
+    def __init__(self, latencies, errors, elapsed, concurrency):
+        """
+
+        :param latencies: The seconds every successful call took
+        :param errors: The number of failed calls, by exception type name
+        :param elapsed: The wall time of the run
+        :param concurrency:
+        """
+        self.latencies = sorted(latencies)
+        self.errors = Counter(errors)
+        self.elapsed = elapsed
+        self.concurrency = concurrency
+
+    @property
+    def calls(self):
+        """The number of calls made, successful or not"""
+        return len(self.latencies) + sum(self.errors.values())
+
+    @property
+    def throughput(self):
+        """The successful calls per second"""
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q):
+        """
+
+        :param q: Between 0 and 1
+        :return: The latency percentile of the successful calls in seconds, or None
+        """
+        return percentile(self.latencies, q)
+
+    def as_dict(self):
+        """
+
+        :return: The report as json-compatible data
+        """
+        return {
+            'calls': self.calls,
+            'errors': dict(self.errors),
+            'concurrency': self.concurrency,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            'latency': dict(('p{:g}'.format(q * 100), self.percentile(q)) for q in self.quantiles),
+            'max': self.latencies[-1] if self.latencies else None,
+        }
+
+    def summary(self):
+        """
+
+        :return: The report as a line of text
+        """
+        latency = ' '.join('p{:g}={:.1f}ms'.format(q * 100, (self.percentile(q) or 0) * 1000) for q in self.quantiles)
+        return '{} calls, {} errors, {:.1f}/s at concurrency {}, {}'.format(
+            self.calls, sum(self.errors.values()), self.throughput, self.concurrency, latency)
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.summary())
+
+
+def run_load(client, fn, calls=1000, concurrency=10, duration=None):
+    """Calls ``fn`` from ``concurrency`` threads sharing one client, timing every call
+
+    .. code-block:: python
+
+        with MockServer(latency=0.02) as server:
+            client = Client(base_url=server.url, pool_maxsize=16)
+            report = run_load(client, lambda client, i: client.api.status()(), calls=2000, concurrency=16)
+            print(report.summary())
+
+    :param client: The client passed to every call
+    :param fn: A callable taking the client and the call's index; a :class:`PUBGRequest` it returns is sent
+    :param calls: The number of calls to make
+    :param concurrency: The number of threads
+    :param duration: Stop starting calls after this many seconds, even before ``calls`` are made
+    :return: A :class:`LoadReport`
+    """
+    counter = itertools.count()
+    lock = threading.Lock()
+    latencies, errors = [], Counter()
+    deadline = time.perf_counter() + duration if duration is not None else None
+
+    def worker():
+        mine, failed = [], Counter()
+        while True:
+            i = next(counter)
+            if i >= calls or (deadline is not None and time.perf_counter() >= deadline):
+                break
+            start = time.perf_counter()
+            try:
+                result = fn(client, i)
+                if isinstance(result, PUBGRequest):
+                    result()
+            except Exception as e:
+                failed[type(e).__name__] += 1
+                continue
+            mine.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(mine)
+            errors.update(failed)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    return LoadReport(latencies, errors, time.perf_counter() - start, concurrency)
@@ -0,0 +1,191 @@
+"""Synthetic, realistically sized api payloads for tests, benchmarks and the mock server"""
+import random
+
+PARTICIPANT_STATS = [
+    'DBNOs', 'assists', 'boosts', 'damageDealt', 'deathType', 'headshotKills', 'heals', 'killPlace', 'killPoints',
+    'killPointsDelta', 'killStreaks', 'kills', 'lastKillPoints', 'lastWinPoints', 'longestKill', 'mostDamage', 'name',
+    'playerId', 'revives', 'rideDistance', 'roadKills', 'teamKills', 'timeSurvived', 'vehicleDestroys',
+    'walkDistance', 'weaponsAcquired', 'winPlace', 'winPoints', 'winPointsDelta',
+]
+
+
+def participant_stats(rng, index):
+    stats = {key: rng.randint(0, 50) for key in PARTICIPANT_STATS}
+    stats.update({
+        'damageDealt': rng.random() * 500,
+        'deathType': rng.choice(['alive', 'byplayer', 'suicide']),
+        'longestKill': rng.random() * 300,
+        'name': 'player-{}'.format(index),
+        'playerId': 'account.{:032x}'.format(rng.getrandbits(128)),
+        'rideDistance': rng.random() * 3000,
+        'walkDistance': rng.random() * 3000,
+        'timeSurvived': rng.random() * 1800,
+    })
+    return stats
+
+
+def match_document(match_id='match-0', n_rosters=25, participants_per_roster=4, seed=0, shard='pc-na', created_at=None,
+                   telemetry_url=None, missing=()):
+    """A match response (data plus included rosters, participants and telemetry asset)
+
+    :param match_id:
+    :param n_rosters:
+    :param participants_per_roster:
+    :param seed:
+    :param shard:
+    :param created_at: The match's ``createdAt``, random by default
+    :param telemetry_url: The url of the telemetry asset
+    :param missing: The ``(roster, participant)`` indices of the participants left out of ``included``
+    :return:
+    """
+    rng = random.Random(seed)
+    rosters, included = [], []
+    for r in range(n_rosters):
+        participants = []
+        for p in range(participants_per_roster):
+            participant_id = '{:032x}'.format(rng.getrandbits(128))
+            participants.append({'type': 'participant', 'id': participant_id})
+            stats = participant_stats(rng, r * participants_per_roster + p)
+            if (r, p) not in missing:
+                included.append({
+                    'type': 'participant', 'id': participant_id,
+                    'attributes': {'actor': '', 'shardId': shard, 'stats': stats},
+                })
+        roster_id = '{:032x}'.format(rng.getrandbits(128))
+        rosters.append({'type': 'roster', 'id': roster_id})
+        included.append({
+            'type': 'roster', 'id': roster_id,
+            'attributes': {'shardId': shard, 'stats': {'rank': r + 1, 'teamId': r}, 'won': 'true' if r == 0 else 'false'},
+            'relationships': {'participants': {'data': participants}, 'team': {'data': None}},
+        })
+
+    asset_id = '{:032x}'.format(rng.getrandbits(128))
+    if telemetry_url is None:
+        telemetry_url = 'https://telemetry-cdn.playbattlegrounds.com/bluehole-pubg/{}/2018/03/13/{}-telemetry.json'.format(
+            shard, match_id)
+    if created_at is None:
+        created_at = '2018-03-13T17:{:02d}:{:02d}Z'.format(rng.randint(0, 59), rng.randint(0, 59))
+    included.append({
+        'type': 'asset', 'id': asset_id,
+        'attributes': {
+            'URL': telemetry_url,
+            'createdAt': '2018-03-13T17:39:24Z', 'description': '', 'name': 'telemetry',
+        },
+    })
+
+    return {
+        'data': {
+            'type': 'match', 'id': match_id,
+            'attributes': {
+                'createdAt': created_at,
+                'duration': rng.randint(1200, 2000), 'gameMode': 'squad-fpp', 'patchVersion': '', 'shardId': shard,
+                'stats': None, 'tags': None, 'titleId': 'bluehole-pubg',
+            },
+            'relationships': {
+                'rosters': {'data': rosters},
+                'assets': {'data': [{'type': 'asset', 'id': asset_id}]},
+                'rounds': {'data': []},
+                'spectators': {'data': []},
+            },
+        },
+        'included': included,
+        'links': {'self': 'https://api.playbattlegrounds.com/shards/{}/matches/{}'.format(shard, match_id)},
+    }
+
+
+def matches_document(documents, links=None):
+    """A page of matches, merging the data and included resources of match responses
+
+    :param documents: A list of match responses, e.g. from :func:`match_document`
+    :param links: The page's ``links``
+    :return:
+    """
+    data, included, seen = [], [], set()
+    for document in documents:
+        data.append(document['data'])
+        for resource in document.get('included', []):
+            key = resource['type'], resource['id']
+            if key not in seen:
+                seen.add(key)
+                included.append(resource)
+    return {'data': data, 'included': included, 'links': links or {}}
+
+
+def page_document(url, page, pages, per_page=2, n_rosters=1, shard='pc-na'):
+    """A page of ``per_page`` matches (``match-<page>-<index>``) out of ``pages``, linked to the previous and next pages
+    with a ``page`` query parameter
+
+    :param url: The matches url
+    :param page: The page's index
+    :param pages: The number of pages
+    :param per_page:
+    :param n_rosters:
+    :param shard:
+    :return:
+    """
+    documents = [match_document('match-{}-{}'.format(page, i), n_rosters=n_rosters, seed=i, shard=shard)
+                 for i in range(per_page)]
+
+    links = {'self': '{}?page={}'.format(url, page)}
+    if page + 1 < pages:
+        links['next'] = '{}?page={}'.format(url, page + 1)
+    if page > 0:
+        links['prev'] = '{}?page={}'.format(url, page - 1)
+    return matches_document(documents, links)
+
+
+def status_document(version='v8.1.0'):
+    """A status response
+
+    :param version:
+    :return:
+    """
+    return {
+        'data': {
+            'type': 'status', 'id': 'pubg-api',
+            'attributes': {'releasedAt': '2018-03-13T17:00:00Z', 'version': version},
+        },
+    }
+
+
+def telemetry_events(n_events=10000, n_players=100, seed=0):
+    """The decoded events of a telemetry document (positions, damage and kills between a match start and end)
+
+    :param n_events:
+    :param n_players:
+    :param seed:
+    :return:
+    """
+    rng = random.Random(seed)
+
+    def character(index):
+        return {
+            'name': 'player-{}'.format(index), 'teamId': index // 4, 'health': rng.random() * 100, 'ranking': 0,
+            'accountId': 'account.{:032x}'.format(index),
+            'location': {'x': rng.random() * 800000, 'y': rng.random() * 800000, 'z': rng.random() * 2000},
+        }
+
+    def timestamp(i):
+        seconds = i * 1800 // max(n_events, 1)
+        return '2018-03-13T17:{:02d}:{:02d}.{:03d}Z'.format(seconds // 60 % 60, seconds % 60, i % 1000)
+
+    events = [{'_T': 'LogMatchStart', '_D': timestamp(0), 'mapName': 'Desert_Main',
+               'characters': [character(p) for p in range(n_players)]}]
+    for i in range(1, n_events - 1):
+        kind = rng.random()
+        if kind < 0.6:
+            events.append({'_T': 'LogPlayerPosition', '_D': timestamp(i), 'character': character(rng.randrange(n_players)),
+                           'elapsedTime': i * 0.18, 'numAlivePlayers': n_players})
+        elif kind < 0.9:
+            events.append({'_T': 'LogPlayerTakeDamage', '_D': timestamp(i), 'attacker': character(rng.randrange(n_players)),
+                           'victim': character(rng.randrange(n_players)), 'damageTypeCategory': 'Damage_Gun',
+                           'damageReason': 'TorsoShot', 'damage': rng.random() * 50, 'damageCauserName': 'WeapHK416_C'})
+        elif kind < 0.95:
+            events.append({'_T': 'LogPlayerKill', '_D': timestamp(i), 'attacker': character(rng.randrange(n_players)),
+                           'victim': character(rng.randrange(n_players)), 'damageTypeCategory': 'Damage_Gun',
+                           'damageCauserName': 'WeapHK416_C', 'distance': rng.random() * 30000})
+        else:
+            events.append({'_T': 'LogItemPickup', '_D': timestamp(i), 'character': character(rng.randrange(n_players)),
+                           'item': {'itemId': 'Item_Heal_Bandage_C', 'stackCount': 5, 'category': 'Use'}})
+    events.append({'_T': 'LogMatchEnd', '_D': timestamp(n_events - 1), 'characters': [character(p) for p in range(n_players)]})
+    return events
@@ -0,0 +1,291 @@
+"""A local stand-in for the api, for load and latency testing over real sockets"""
+import gzip
+import json
+import random
+import re
+import socketserver
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from .payloads import match_document, matches_document, status_document, telemetry_events
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+_MATCHES = re.compile(r'^/shards/([^/]+)/matches$')
+_MATCH = re.compile(r'^/shards/([^/]+)/matches/([^/]+)$')
+_TELEMETRY = re.compile(r'^/telemetry/([^/]+)\.json$')
+
+
+class _Server(socketserver.ThreadingMixIn, HTTPServer):
+    """Handles every connection in its own thread"""
+
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes a request to its :class:`MockServer`"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.mock.handle(self)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockServer:
+    """Serves synthetic ``status``, ``matches``, ``match`` and telemetry responses on a local port
+
+    Requests go over real keep-alive HTTP/1.1 connections, so connection pooling, concurrency, rate limiting and
+    retries can be exercised and timed, unlike with ``requests_mock``. Every response is delayed by ``latency`` plus
+    up to ``jitter`` seconds; ``error_rate`` of the requests fail with ``error_status``; past ``rate_limit`` requests
+    per ``rate_period`` the server answers 429 with ``Retry-After``, and every response carries the
+    ``X-RateLimit-*`` headers. Bodies are gzipped for clients that accept it.
+
+    .. code-block:: python
+
+        with MockServer(latency=0.05, jitter=0.02, rate_limit=600) as server:
+            client = Client(base_url=server.url)
+            match = client.api.match(server.match_ids[0])()
+
+    The ``matches`` pages are sorted by ``createdAt`` and honour ``page[limit]``, ``page[offset]`` and
+    ``filter[createdAt-start]``; each match's telemetry asset points back at the server.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, error_rate=0.0, error_status=500,
+                 rate_limit=None, rate_period=60.0, gzip=True, n_matches=100, n_rosters=25, telemetry_size=2000, seed=0):
+        """
+
+        :param host:
+        :param port: The port to listen on, 0 for any free port
+        :param latency: The seconds every response is delayed by
+        :param jitter: Up to this many more seconds, uniformly distributed
+        :param error_rate: The share of requests that fail, between 0 and 1
+        :param error_status: The status code of the failed requests
+        :param rate_limit: The number of requests allowed per ``rate_period``, or None for no limit
+        :param rate_period: The seconds after which the rate limit window resets
+        :param gzip: Compress the bodies for clients sending ``Accept-Encoding: gzip``
+        :param n_matches: The number of matches of every shard
+        :param n_rosters: The number of rosters (of 4 participants) of every match
+        :param telemetry_size: The number of events of every telemetry document
+        :param seed: The seed of the payloads, the latencies and the errors
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.rate_period = rate_period
+        self.gzip = gzip
+        self.n_rosters = n_rosters
+        self.telemetry_size = telemetry_size
+        self.seed = seed
+
+        start = datetime(2018, 3, 13, tzinfo=timezone.utc)
+        self.match_ids = ['match-{}'.format(i) for i in range(n_matches)]
+        """The ids of the matches served on every shard, oldest first"""
+        self.created_at = {id: (start + timedelta(minutes=i)).strftime(TIMESTAMP_FORMAT)
+                           for i, id in enumerate(self.match_ids)}
+        self._seeds = {id: seed + i for i, id in enumerate(self.match_ids)}
+
+        self.requests = Counter()
+        """The number of responses sent, by status code"""
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window = (0.0, 0)
+        self._thread = None
+        self._server = _Server((host, port), _Handler)
+        self._server.mock = self
+        # The payloads are generated (and compressed) once, so the server's own cost stays out of the measurements
+        self.body = lru_cache(maxsize=256)(self.body)
+        self.compressed_body = lru_cache(maxsize=256)(self.compressed_body)
+
+    @property
+    def url(self):
+        """The base url to give the client, e.g. ``Client(base_url=server.url)``"""
+        host, port = self._server.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def start(self):
+        """Serves in a background thread
+
+        :return: self
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), name='pubg-mock-server',
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+
+        :return:
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def body(self, path, query):
+        """The encoded body of a successful response, or None for an unknown path
+
+        :param path:
+        :param query: The query string
+        :return:
+        """
+        params = {name: values[0] for name, values in parse_qs(query).items()}
+
+        if path == '/status':
+            return self.encode(status_document())
+
+        match = _MATCH.match(path)
+        if match and match.group(2) in self.created_at:
+            return self.encode(self.match(*match.groups()))
+
+        match = _MATCHES.match(path)
+        if match:
+            return self.encode(self.page(match.group(1), path, params))
+
+        match = _TELEMETRY.match(path)
+        if match and match.group(1) in self.created_at:
+            return self.encode(telemetry_events(self.telemetry_size, seed=self._seeds[match.group(1)]))
+        return None
+
+    def compressed_body(self, path, query):
+        """
+
+        :param path:
+        :param query:
+        :return: The gzipped :meth:`body`, or None for an unknown path
+        """
+        body = self.body(path, query)
+        return gzip.compress(body, compresslevel=1) if body is not None else None
+
+    def match(self, shard, match_id):
+        """
+
+        :param shard:
+        :param match_id:
+        :return: The match response
+        """
+        return match_document(match_id, n_rosters=self.n_rosters, seed=self._seeds[match_id],
+                              shard=shard, created_at=self.created_at[match_id],
+                              telemetry_url='{}/telemetry/{}.json'.format(self.url, match_id))
+
+    def page(self, shard, path, params):
+        """
+
+        :param shard:
+        :param path:
+        :param params: The query parameters
+        :return: The matches response
+        """
+        limit = int(params.get('page[limit]', 5))
+        offset = int(params.get('page[offset]', 0))
+        start = params.get('filter[createdAt-start]', '')
+        ids = [id for id in self.match_ids if self.created_at[id] >= start]
+
+        links = {'self': '{}{}?{}'.format(self.url, path, urlencode(params))}
+        if offset + limit < len(ids):
+            links['next'] = '{}{}?{}'.format(self.url, path, urlencode(dict(params, **{'page[offset]': offset + limit})))
+        return matches_document([self.match(shard, id) for id in ids[offset:offset + limit]], links)
+
+    @staticmethod
+    def encode(document):
+        """
+
+        :param document:
+        :return:
+        """
+        return json.dumps(document, separators=(',', ':')).encode('utf-8')
+
+    def reset_rate_limit(self):
+        """Starts a new rate limit window, so the next request has the full ``rate_limit`` again
+
+        :return:
+        """
+        with self._lock:
+            self._window = (0.0, 0)
+
+    def throttle(self):
+        """Counts a request against the rate limit
+
+        :return: ``(headers, retry_after)``, where ``retry_after`` is None while the request is allowed
+        """
+        if self.rate_limit is None:
+            return {}, None
+
+        now = time.time()
+        with self._lock:
+            reset, count = self._window
+            if now >= reset:
+                reset, count = now + self.rate_period, 0
+            count += 1
+            self._window = reset, count
+
+        headers = {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(max(self.rate_limit - count, 0)),
+            'X-RateLimit-Reset': str(int(reset)),
+        }
+        return headers, (max(int(reset - now + 0.999), 1) if count > self.rate_limit else None)
+
+    def handle(self, handler):
+        """Answers a request
+
+        :param handler: The request's ``BaseHTTPRequestHandler``
+        :return:
+        """
+        with self._lock:
+            delay = self.latency + self._rng.random() * self.jitter
+            failed = self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        url = urlsplit(handler.path)
+        compress = self.gzip and 'gzip' in handler.headers.get('Accept-Encoding', '')
+        headers, retry_after = self.throttle()
+        body = None
+        if retry_after is not None:
+            status = 429
+            headers['Retry-After'] = str(retry_after)
+            error = {'title': 'Too Many Requests'}
+        elif failed:
+            status = self.error_status
+            error = {'title': 'Internal Server Error'}
+        else:
+            body = self.compressed_body(url.path, url.query) if compress else self.body(url.path, url.query)
+            status = 404 if body is None else 200
+            error = {'title': 'Not Found', 'detail': url.path}
+
+        if body is None:
+            body = self.encode({'errors': [error]})
+            compress = False
+        headers['Content-Type'] = 'application/vnd.api+json'
+        if compress:
+            headers['Content-Encoding'] = 'gzip'
+        headers['Content-Length'] = str(len(body))
+
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+        with self._lock:
+            self.requests[status] += 1
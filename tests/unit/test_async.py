@@ -0,0 +1,152 @@
+import asyncio
+import json
+
+import pytest
+import requests
+
+from pubg_client import AsyncClient, DiskCache, TTLCache
+from pubg_client.testing.payloads import status_document
+
+web = pytest.importorskip('aiohttp.web')
+
+
+def serve(handler, test):
+    async def main():
+        app = web.Application()
+        app.router.add_get('/{path:.*}', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            return await test('http://127.0.0.1:{}'.format(port))
+        finally:
+            await runner.cleanup()
+
+    return run(main())
+
+
+def run(coroutine):
+    """Runs a coroutine on a new event loop (``asyncio.run`` needs Python 3.7)"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncClient:
+
+    def test_status(self):
+        async def handler(request):
+            return web.json_response(status_document())
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url) as client:
+                return await client.api.status()
+
+        status = serve(handler, test)
+        assert status.version == 'v8.1.0'
+
+    def test_autocall_raw(self):
+        async def handler(request):
+            assert request.path == '/shards/pc-eu/matches/abc'
+            return web.json_response({'data': {'id': 'abc'}})
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url, shard='pc-eu', raw=True, autocall=True) as client:
+                return await client.api.match('abc')
+
+        assert serve(handler, test) == {'id': 'abc'}
+
+    def test_bounded_concurrency(self):
+        in_flight = []
+        peak = []
+
+        async def handler(request):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            return web.json_response(status_document())
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url, raw=True, max_concurrency=3) as client:
+                return await asyncio.gather(*[client.api.status() for _ in range(12)])
+
+        assert len(serve(handler, test)) == 12
+        assert max(peak) == 3
+
+    def test_large_bodies_are_offloaded(self):
+        async def handler(request):
+            return web.Response(text=json.dumps(status_document()), content_type='application/json')
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url, offload_threshold=0) as client:
+                return await client.api.status()
+
+        assert serve(handler, test).version == 'v8.1.0'
+
+    def test_sync_with_is_rejected(self):
+        client = AsyncClient()
+        with pytest.raises(TypeError, match='async with'):
+            with client:
+                pass
+
+    def test_blocking_helpers_are_rejected(self):
+        client = AsyncClient()
+        helpers = [
+            lambda: client.api.match.many(['1']),
+            lambda: client.api.matches.paginate(),
+            lambda: client.api.matches().paginate(),
+            lambda: client.fan_out(lambda client: client.api.status()),
+            lambda: client.telemetry('https://telemetry-cdn.playbattlegrounds.com/telemetry.json'),
+        ]
+        for helper in helpers:
+            with pytest.raises(TypeError, match='not available on AsyncClient'):
+                helper()
+
+    def test_errors_raise(self):
+        async def handler(request):
+            return web.json_response({}, status=404)
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url) as client:
+                return await client.api.status()
+
+        with pytest.raises(requests.HTTPError):
+            serve(handler, test)
+
+    def test_disk_cache(self, tmpdir):
+        requests_seen = []
+
+        async def handler(request):
+            requests_seen.append(request.path)
+            return web.json_response({'data': {'id': 'abc'}})
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url, raw=True, disk_cache=DiskCache(str(tmpdir))) as client:
+                return [await client.api.match('abc') for _ in range(2)], client.disk_cache.stats()
+
+        matches, stats = serve(handler, test)
+        assert matches == [{'id': 'abc'}] * 2
+        assert requests_seen == ['/shards/pc-na/matches/abc']
+        assert stats['hits'] == 1
+
+    def test_ttl_cache_revalidates(self):
+        conditional = []
+
+        async def handler(request):
+            conditional.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return web.Response(status=304)
+            return web.json_response(status_document(), headers={'ETag': '"v1"'})
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url, ttl_cache=TTLCache(ttl=0)) as client:
+                return [await client.api.status() for _ in range(2)]
+
+        first, second = serve(handler, test)
+        assert first is second
+        assert conditional == [None, '"v1"']
@@ -0,0 +1,72 @@
+import re
+import time
+
+import requests
+import requests_mock
+
+from pubg_client import Client
+from pubg_client._batch import Batch
+
+MATCH_URL = re.compile('https://api.playbattlegrounds.com/shards/pc-na/matches/(.*)')
+
+
+def match_callback(request, context):
+    match_id = request.path.rsplit('/', 1)[1]
+    if match_id == 'missing':
+        context.status_code = 404
+        return {'errors': []}
+    return {'data': {'id': match_id}}
+
+
+class TestBatch:
+
+    def test_ordered(self):
+        def slow_for_small(n):
+            time.sleep(0.01 * (5 - n))
+            return n
+
+        assert list(Batch(slow_for_small, range(5), max_workers=5, ordered=True)) == [0, 1, 2, 3, 4]
+
+    def test_as_completed(self):
+        def slow_for_small(n):
+            time.sleep(0.02 * (3 - n))
+            return n
+
+        assert list(Batch(slow_for_small, range(3), max_workers=3)) == [2, 1, 0]
+
+    def test_errors_do_not_abort(self):
+        def fail_odd(n):
+            if n % 2:
+                raise ValueError(n)
+            return n
+
+        batch = Batch(fail_odd, range(6), max_workers=2, ordered=True)
+        assert list(batch) == [0, 2, 4]
+        assert sorted(batch.errors) == [1, 3, 5]
+
+    def test_stopping_early_drops_queued_calls(self):
+        called = []
+
+        def slow(n):
+            called.append(n)
+            time.sleep(0.02)
+            return n
+
+        results = iter(Batch(slow, range(100), max_workers=1, ordered=True))
+        assert next(results) == 0
+        results.close()
+
+        assert len(called) <= 2
+
+
+class TestMatchMany:
+
+    def test_many(self):
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, json=match_callback)
+            matches = Client(raw=True).api.match.many(['a', 'missing', 'b', 'c'], ordered=True)
+            results = list(matches)
+
+        assert results == [{'id': 'a'}, {'id': 'b'}, {'id': 'c'}]
+        assert list(matches.errors) == ['missing']
+        assert isinstance(matches.errors['missing'], requests.HTTPError)
@@ -0,0 +1,95 @@
+import json
+import random
+import re
+import threading
+
+import requests_mock
+
+from pubg_client import Client, SHARDS
+from pubg_client.models import MatchCollection
+
+MATCHES_URL = re.compile(r'https://api\.playbattlegrounds\.com/shards/([a-z-]+)/matches$')
+
+
+def matches_callback(request, context):
+    shard = MATCHES_URL.match(request.url).group(1)
+    return json.dumps({'data': [{'type': 'match', 'id': shard, 'attributes': {}}], 'links': {}})
+
+
+class TestBinding:
+
+    def test_api_is_cached(self):
+        client = Client()
+
+        assert client.api is client.api
+        assert client.api.matches is client.api.matches
+        assert client.api.matches.client is client
+
+    def test_bound_endpoint_is_kept_on_the_namespace(self):
+        api = Client().api
+        assert 'matches' not in vars(api)
+
+        matches = api.matches
+        assert vars(api)['matches'] is matches
+        assert matches is not vars(type(api))['matches']
+
+    def test_rebuilt_when_settings_change(self):
+        client = Client()
+        api = client.api
+        client.raw = True
+
+        assert client.api is not api
+        assert client.api.matches.raw is True
+
+    def test_registered_endpoint_is_not_modified(self):
+        from pubg_client.endpoints.match import Matches
+
+        registered = vars(type(Client().api))['matches']
+        Client(shard='pc-eu', raw=True).api.matches
+
+        assert isinstance(registered, Matches)
+        assert registered.client is None and registered.raw is False
+
+    def test_clients_are_independent(self):
+        na, eu = Client(shard='pc-na'), Client(shard='pc-eu', raw=True)
+
+        assert na.api.matches.url().endswith('/pc-na/matches')
+        assert eu.api.matches.url().endswith('/pc-eu/matches')
+        assert (na.api.matches.raw, eu.api.matches.raw) == (False, True)
+
+    def test_concurrency_stress(self):
+        clients = [Client(shard=shard, raw=bool(i % 2), autocall=True) for i, shard in enumerate(SHARDS)]
+        failures = []
+        bindings = {client.shard: set() for client in clients}
+        barrier = threading.Barrier(16)
+
+        def worker(seed):
+            rng = random.Random(seed)
+            barrier.wait()
+            for _ in range(50):
+                client = rng.choice(clients)
+                api = client.api
+                endpoint = api.matches
+                bindings[client.shard].add((id(api), id(endpoint), vars(api).get('matches') is endpoint))
+                result = endpoint()
+                if client.raw:
+                    ok = isinstance(result, list) and result[0]['id'] == client.shard
+                else:
+                    ok = isinstance(result, MatchCollection) and result.matches[0].id == client.shard
+                if not ok:
+                    failures.append((client.shard, client.raw, result))
+
+        with requests_mock.mock() as m:
+            m.get(MATCHES_URL, text=matches_callback)
+            threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert m.call_count == 16 * 50
+        assert failures == []
+        # Every thread used the same namespace and the same bound endpoint of a client, found in the namespace
+        used = [client for client in clients if bindings[client.shard]]
+        assert all(len(bindings[client.shard]) == 1 for client in used)
+        assert all(next(iter(bindings[client.shard])) == (id(client.api), id(client.api.matches), True) for client in used)
@@ -0,0 +1,143 @@
+import gzip
+import json
+import os
+import re
+
+import pytest
+import requests_mock
+
+from pubg_client import Client, DiskCache, TTLCache
+from pubg_client.testing.payloads import status_document
+
+MATCH_URL = re.compile('https://api.playbattlegrounds.com/shards/pc-na/matches/.*')
+STATUS_URL = 'https://api.playbattlegrounds.com/status'
+
+
+class TestDiskCache:
+
+    def test_round_trip(self, tmpdir):
+        cache = DiskCache(str(tmpdir))
+        assert cache.get(('pc-na', 'abc')) is None
+
+        cache.set(('pc-na', 'abc'), b'{"data": {}}')
+        assert cache.get(('pc-na', 'abc')) == b'{"data": {}}'
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0}
+
+    @pytest.mark.parametrize('corrupt', [
+        lambda data: data[:10] + b'\xff' * (len(data) - 10),
+        lambda data: data[:len(data) // 2],
+        lambda data: b'not gzip',
+    ], ids=['corrupt', 'truncated', 'not gzip'])
+    def test_corrupt_entries_are_misses(self, tmpdir, corrupt):
+        cache = DiskCache(str(tmpdir))
+        cache.set(('pc-na', 'abc'), b'{"data": {}}' * 10)
+        path = cache.path(('pc-na', 'abc'))
+        with open(path, 'rb') as f:
+            data = f.read()
+        with open(path, 'wb') as f:
+            f.write(corrupt(data))
+
+        assert cache.get(('pc-na', 'abc')) is None
+        assert not os.path.exists(path)
+        assert cache.stats() == {'hits': 0, 'misses': 1, 'evictions': 0}
+
+    def test_keys_are_escaped(self, tmpdir):
+        cache = DiskCache(str(tmpdir))
+        assert cache.path(('pc-na', '../abc')).startswith(str(tmpdir.join('pc-na')))
+
+    def test_lru_eviction(self, tmpdir):
+        entry_size = len(gzip.compress(b'1' * 100, compresslevel=6))
+        cache = DiskCache(str(tmpdir), max_bytes=int(entry_size * 2.5))
+        cache.set(('pc-na', 'old'), b'1' * 100)
+        cache.set(('pc-na', 'new'), b'1' * 100)
+        os.utime(cache.path(('pc-na', 'new')), (1, 1))
+        cache.get(('pc-na', 'old'))
+        cache.set(('pc-na', 'newest'), b'1' * 100)
+
+        assert cache.get(('pc-na', 'new')) is None
+        assert cache.get(('pc-na', 'old')) is not None
+        assert cache.get(('pc-na', 'newest')) is not None
+        assert cache.evictions == 1
+
+    def test_overwrites_are_not_counted_twice(self, tmpdir):
+        entry_size = len(gzip.compress(b'1' * 100, compresslevel=6))
+        cache = DiskCache(str(tmpdir), max_bytes=entry_size * 2)
+        cache.set(('pc-na', 'other'), b'1' * 100)
+        for _ in range(5):
+            cache.set(('pc-na', 'abc'), b'1' * 100)
+
+        assert cache._size == entry_size * 2
+        assert cache.evictions == 0
+        assert cache.get(('pc-na', 'other')) is not None
+
+    def test_evicts_down_to_the_low_water_mark(self, tmpdir):
+        entry_size = len(gzip.compress(b'1' * 100, compresslevel=6))
+        cache = DiskCache(str(tmpdir), max_bytes=entry_size * 10, low_water=0.5)
+        for i in range(11):
+            cache.set(('pc-na', str(i)), b'1' * 100)
+            os.utime(cache.path(('pc-na', str(i))), (i, i))
+
+        assert cache.evictions == 6
+        assert cache._size == entry_size * 5
+        assert cache.get(('pc-na', '10')) is not None
+
+
+class TestMatchCache:
+
+    def test_matches_are_cached(self, tmpdir):
+        client = Client(raw=True, autocall=True, disk_cache=DiskCache(str(tmpdir)))
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, json={'data': {'id': 'abc'}})
+            assert client.api.match('abc') == {'id': 'abc'}
+            assert client.api.match('abc') == {'id': 'abc'}
+
+        assert m.call_count == 1
+        assert client.disk_cache.stats()['hits'] == 1
+
+    def test_errors_are_not_cached(self, tmpdir):
+        client = Client(raw=True, autocall=True, disk_cache=DiskCache(str(tmpdir)))
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, status_code=500)
+            for _ in range(2):
+                try:
+                    client.api.match('abc')
+                except Exception:
+                    pass
+
+        assert m.call_count == 2
+
+
+class TestTTLCache:
+
+    def test_fresh_entries_skip_the_network(self):
+        client = Client(autocall=True, ttl_cache=TTLCache(ttl=60))
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, text=json.dumps(status_document()))
+            first = client.api.status()
+            second = client.api.status()
+
+        assert first is second
+        assert m.call_count == 1
+
+    def test_not_modified_reuses_the_model(self):
+        client = Client(autocall=True, ttl_cache=TTLCache(ttls={'status': 0}))
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, [
+                {'text': json.dumps(status_document()), 'headers': {'ETag': '"v1"', 'Last-Modified': 'Tue, 13 Mar 2018 17:39:24 GMT'}},
+                {'status_code': 304},
+            ])
+            first = client.api.status()
+            second = client.api.status()
+
+        assert first is second
+        assert m.request_history[1].headers['If-None-Match'] == '"v1"'
+        assert m.request_history[1].headers['If-Modified-Since'] == 'Tue, 13 Mar 2018 17:39:24 GMT'
+        assert client.ttl_cache.stats()['revalidations'] == 1
+
+    def test_lru_size(self):
+        cache = TTLCache(maxsize=2)
+        for key in 'abc':
+            cache.set(key, key, ttl=60)
+
+        assert cache.get('a') is None
+        assert cache.get('c').value == 'c'
@@ -0,0 +1,75 @@
+import pytest
+
+from pubg_client import TelemetryStore
+
+np = pytest.importorskip('numpy')
+
+KILLS = [
+    {'attacker': {'name': 'a', 'health': 100}, 'victim': {'name': 'b'}, 'distance': 10.5, 'isGame': True,
+     '_D': '2018-03-13T17:00:02.100Z', '_T': 'LogPlayerKill'},
+    {'attacker': {'name': 'longer name'}, 'victim': {'name': 'c'}, 'distance': 3, 'isGame': True, 'assists': ['x'],
+     '_D': '2018-03-13T17:00:03.200Z', '_T': 'LogPlayerKill'},
+]
+POSITION = {'character': {'name': 'a', 'location': {'x': 1.0, 'y': 2.0}}, 'numAlivePlayers': 99,
+            '_D': '2018-03-13T17:00:01.000Z', '_T': 'LogPlayerPosition'}
+
+
+class TestTelemetryStore:
+
+    def test_write_and_open(self, tmpdir):
+        store = TelemetryStore(str(tmpdir))
+        assert store.write('match-1', [POSITION] + KILLS) == ['LogPlayerKill', 'LogPlayerPosition']
+
+        kills = store.open('match-1', 'LogPlayerKill')
+        assert isinstance(kills, np.memmap)
+        assert list(kills['attacker.name']) == ['a', 'longer name']
+        assert kills['distance'].dtype == np.float64
+        assert kills['isGame'].dtype == np.bool_
+        assert np.isnan(kills['attacker.health'][1])
+        assert kills['_D'][0] == np.datetime64('2018-03-13T17:00:02.100')
+        assert 'assists' not in kills.dtype.names
+
+        positions = store.open('match-1', 'LogPlayerPosition')
+        assert positions['numAlivePlayers'].dtype == np.int64
+        assert positions['character.location.y'][0] == 2.0
+
+    def test_missing_booleans_are_not_false(self):
+        from pubg_client._columnar import to_column
+
+        column = to_column('isGame', [True, None, False])
+
+        assert column.dtype == np.float64
+        assert column[0] == 1.0 and column[2] == 0.0
+        assert np.isnan(column[1])
+        assert to_column('isGame', [True, False]).dtype == np.bool_
+
+    def test_booleans_and_integers_are_integers(self):
+        from pubg_client._columnar import to_column
+
+        column = to_column('value', [True, 2, False])
+
+        assert column.dtype == np.int64
+        assert list(column) == [1, 2, 0]
+        assert to_column('value', [True, None, 2]).dtype == np.float64
+
+    def test_failed_write_leaves_no_temporary_file(self, tmpdir, monkeypatch):
+        def fail(*args):
+            raise ValueError('not serializable')
+
+        store = TelemetryStore(str(tmpdir))
+        monkeypatch.setattr(np, 'save', fail)
+        with pytest.raises(ValueError):
+            store.write('match-1', KILLS)
+
+        assert tmpdir.join('match-1').listdir() == []
+
+    def test_queries_span_matches(self, tmpdir):
+        store = TelemetryStore(str(tmpdir))
+        store.write('match-1', KILLS)
+        store.write('match-2', KILLS[:1])
+        store.write('match-3', [POSITION])
+
+        assert store.match_ids() == ['match-1', 'match-2', 'match-3']
+        assert [match_id for match_id, _ in store.scan('LogPlayerKill')] == ['match-1', 'match-2']
+        assert store.column('LogPlayerKill', 'distance').sum() == 24
+        assert list(store.column('LogPlayerKill', 'victim.name', match_ids=['match-2'])) == ['b']
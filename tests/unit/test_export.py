@@ -0,0 +1,69 @@
+import gzip
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from pubg_client import ModelEncoder, NDJSONWriter, export_ndjson
+from pubg_client._export import iter_encode
+from pubg_client._jsonapi import Document
+from pubg_client.models import Match, lazy
+from pubg_client.models._base import PassThrough
+from pubg_client.testing.payloads import match_document
+
+
+def matches(n, missing=()):
+    payload = Document(match_document('match-1', n_rosters=2, missing=missing)).resolve()
+    for _ in range(n):
+        yield Match.load(payload)
+
+
+class TestIterEncode:
+
+    @pytest.mark.parametrize('cls', [Match, lazy(Match)])
+    def test_same_document_as_model_encoder(self, cls):
+        match = cls.load(Document(match_document('match-1', n_rosters=2, missing={(1, 1)})).resolve())
+
+        assert json.loads(''.join(iter_encode(match))) == json.loads(json.dumps(match, cls=ModelEncoder))
+
+    def test_values(self):
+        value = PassThrough(name='Thing').load({'title': 'é"\n', 'n': 1, 'ok': True, 'ratio': 0.5, 'tags': ['a', None]})
+
+        assert json.loads(''.join(iter_encode([value, None]))) == [{'title': 'é"\n', 'n': 1, 'ok': True, 'ratio': 0.5, 'tags': ['a', None]}, None]
+
+
+class TestNDJSONWriter:
+
+    def test_lines(self):
+        f = io.StringIO()
+        assert export_ndjson(matches(3), f) == 3
+
+        lines = f.getvalue().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])['id'] == 'match-1'
+
+    def test_gzip(self):
+        f = io.BytesIO()
+        with NDJSONWriter(f, compress=True, buffer_size=256) as writer:
+            writer.write_all(matches(5))
+
+        lines = gzip.decompress(f.getvalue()).decode('utf-8').splitlines()
+        assert [json.loads(line)['game_mode'] for line in lines] == ['squad-fpp'] * 5
+        assert writer.count == 5
+
+    def test_gzip_needs_binary(self):
+        with pytest.raises(ValueError):
+            NDJSONWriter(io.StringIO(), compress=True)
+
+    def test_constant_memory(self):
+        def peak(n):
+            f = io.BytesIO()
+            tracemalloc.start()
+            with NDJSONWriter(f, compress=True) as writer:
+                writer.write_all(matches(n))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+        assert peak(1000) < peak(100) * 2
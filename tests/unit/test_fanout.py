@@ -0,0 +1,115 @@
+import json
+import re
+import threading
+from concurrent.futures import TimeoutError
+
+import requests
+import requests_mock
+
+from pubg_client import Client, ShardResult
+from pubg_client.models import MatchCollection
+from pubg_client.testing.payloads import page_document
+
+MATCHES_URL = re.compile(r'https://api\.playbattlegrounds\.com/shards/([a-z-]+)/matches$')
+
+
+def matches_callback(request, context):
+    shard = MATCHES_URL.match(request.url).group(1)
+    if shard == 'pc-eu':
+        context.status_code = 503
+        return ''
+    document = page_document(request.url, 0, 1, shard=shard)
+    for match in document['data']:
+        match['id'] = '{}-{}'.format(shard, match['id'])
+    return json.dumps(document)
+
+
+class TestFanOut:
+
+    def test_for_shard(self):
+        client = Client(shard='pc-na')
+        other = client.for_shard('pc-eu')
+
+        assert other.shard == 'pc-eu' and client.shard == 'pc-na'
+        assert other.sessions is client.sessions
+        assert other.api.matches.url().endswith('/shards/pc-eu/matches')
+
+    def test_results_and_errors(self):
+        client = Client()
+        with requests_mock.mock() as m:
+            m.get(MATCHES_URL, text=matches_callback)
+            fan_out = client.fan_out(lambda client: client.api.matches(), shards=['pc-na', 'pc-eu', 'pc-as'])
+            outcomes = fan_out.collect()
+
+        assert [outcome.shard for outcome in outcomes] == ['pc-na', 'pc-eu', 'pc-as']
+        assert isinstance(outcomes[0].result, MatchCollection)
+        assert outcomes[0].result.matches[0].id == 'pc-na-match-0-0'
+        assert isinstance(fan_out.errors['pc-eu'], requests.HTTPError)
+        assert set(fan_out.results) == {'pc-na', 'pc-as'}
+        assert set(fan_out.latencies) == {'pc-na', 'pc-eu', 'pc-as'}
+
+    def test_merge(self):
+        with requests_mock.mock() as m:
+            m.get(MATCHES_URL, text=matches_callback)
+            merged = Client(autocall=True).fan_out(lambda client: client.api.matches(), shards=['pc-na', 'pc-eu', 'pc-as']).merge()
+
+        assert [(shard, match.id) for shard, match in merged] == [
+            ('pc-na', 'pc-na-match-0-0'), ('pc-na', 'pc-na-match-0-1'),
+            ('pc-as', 'pc-as-match-0-0'), ('pc-as', 'pc-as-match-0-1'),
+        ]
+
+    def test_slow_shard(self):
+        release = threading.Event()
+
+        def call(client):
+            if client.shard == 'pc-sa':
+                release.wait(5)
+            return client.shard
+
+        fan_out = Client().fan_out(call, shards=['pc-na', 'pc-sa', 'pc-eu'], timeout=0.2)
+        outcomes = list(fan_out)
+        release.set()
+
+        assert [outcome.shard for outcome in outcomes[:2]] in (['pc-na', 'pc-eu'], ['pc-eu', 'pc-na'])
+        assert outcomes[2].shard == 'pc-sa'
+        assert isinstance(outcomes[2].error, TimeoutError)
+        assert fan_out.results == {'pc-na': 'pc-na', 'pc-eu': 'pc-eu'}
+
+    def test_queued_shards_are_dropped_after_the_timeout(self):
+        release = threading.Event()
+        called = []
+
+        def call(client):
+            called.append(client.shard)
+            release.wait(5)
+            return client.shard
+
+        outcomes = Client().fan_out(call, shards=['pc-na', 'pc-eu', 'pc-as'], max_workers=1, timeout=0.1).collect()
+        release.set()
+
+        assert called == ['pc-na']
+        assert all(isinstance(outcome.error, TimeoutError) for outcome in outcomes)
+
+    def test_every_shard_by_default(self):
+        outcomes = Client().fan_out(lambda client: client.shard).collect()
+
+        assert len(outcomes) == 12
+        assert all(isinstance(outcome, ShardResult) and outcome.result == outcome.shard for outcome in outcomes)
+
+    def test_thread_pool_is_kept_on_the_client(self):
+        client = Client()
+        threads = set()
+
+        def call(client):
+            threads.add(threading.get_ident())
+            return client.shard
+
+        for _ in range(3):
+            client.fan_out(call, shards=['pc-na', 'pc-eu'], max_workers=2).collect()
+        pool = client.thread_pool(2)
+
+        assert len(threads) <= 2
+        assert client.for_shard('pc-eu').thread_pool(2) is pool
+
+        client.close()
+        assert client.thread_pool(2) is not pool
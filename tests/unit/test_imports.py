@@ -0,0 +1,53 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ['requests', 'pendulum', 'aiohttp', 'numpy', 'asyncio', 'concurrent.futures', 'pubg_client.endpoints.match', 'pubg_client.models']
+
+
+def loaded_after(code):
+    script = '{}\nimport sys, json\nprint(json.dumps([name for name in {!r} if name in sys.modules]))'.format(code, HEAVY)
+    output = subprocess.run([sys.executable, '-c', script], check=True, stdout=subprocess.PIPE,
+                            universal_newlines=True).stdout
+    return set(json.loads(output))
+
+
+class TestLazyImports:
+
+    def test_package(self):
+        assert loaded_after('import pubg_client') == {'requests', 'pubg_client.models'}
+
+    def test_client(self):
+        assert loaded_after('from pubg_client import Client; Client()') == {'requests', 'pubg_client.models'}
+
+    def test_endpoints_register_on_first_api_use(self):
+        loaded = loaded_after('from pubg_client import Client; assert Client().api.match')
+
+        assert 'pubg_client.endpoints.match' in loaded
+        assert 'pendulum' not in loaded
+
+    def test_models_load_pendulum_on_first_timestamp(self):
+        assert 'pendulum' not in loaded_after('from pubg_client.models import Status; Status.load({"attributes": {}})')
+
+        code = 'from pubg_client.models import Status; Status.load({"attributes": {"releasedAt": "2018-03-12T14:08:16Z"}})'
+        assert 'pendulum' in loaded_after(code)
+
+    @pytest.mark.parametrize('name', __import__('pubg_client').__all__)
+    def test_public_names(self, name):
+        import pubg_client
+        assert getattr(pubg_client, name) is not None
+
+    def test_without_module_getattr(self):
+        # Before Python 3.7 (no PEP 562) every name is imported up front
+        code = ('import sys; sys.version_info = (3, 6, 3)\n'
+                'import pubg_client, pubg_client.endpoints as endpoints\n'
+                'assert all(name in vars(pubg_client) for name in pubg_client.__all__)\n'
+                'assert {"Status", "Match", "Matches"} <= set(vars(endpoints))')
+        assert 'pubg_client.endpoints.match' in loaded_after(code)
+
+    def test_unknown_name(self):
+        import pubg_client
+        with pytest.raises(AttributeError):
+            pubg_client.Unknown
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+import requests_mock
+
+from pubg_client import Client, ModelEncoder, _json, set_json_backend
+from pubg_client._jsonapi import Document
+from pubg_client._response import make_response
+from pubg_client.models import Match
+from pubg_client.testing.payloads import match_document
+
+MATCH_URL = 'https://api.playbattlegrounds.com/shards/pc-na/matches/match-1'
+
+
+@pytest.fixture(params=['json', 'orjson'])
+def backend(request):
+    previous = set_json_backend(request.param)
+    yield request.param
+    set_json_backend(previous)
+
+
+class TestBackends:
+
+    def test_loads(self, backend):
+        assert _json.loads(b'{"data": {"id": "\\u00e9"}}') == {'data': {'id': 'é'}}
+        assert _json.backend.name == backend
+
+    def test_model_dumps(self, backend):
+        match = Match.load(Document(match_document('match-1', n_rosters=2)).resolve())
+
+        assert json.loads(ModelEncoder.dumps(match)) == json.loads(json.dumps(match, cls=ModelEncoder))
+
+    def test_unknown_type(self, backend):
+        with pytest.raises(TypeError):
+            ModelEncoder.dumps({'value': object()})
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            set_json_backend('yaml')
+
+
+class TestSingleDecode:
+
+    def test_cached(self):
+        response = make_response(b'{"data": []}')
+
+        assert response.json() is response.json()
+
+    def test_decode_error(self):
+        with pytest.raises(ValueError):
+            make_response(b'not json').json()
+
+    def test_endpoint_and_pages_share_the_decode(self, backend, monkeypatch):
+        calls = []
+        loads = _json.backend.loads
+        monkeypatch.setattr(_json.backend, 'loads', lambda data: calls.append(data) or loads(data))
+
+        document = match_document('match-1', n_rosters=2)
+        client = Client(autocall=True)
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, text=json.dumps(document))
+            match = client.api.match('match-1')
+            match._response.json()
+
+        assert match.duration == document['data']['attributes']['duration']
+        assert len(calls) == 1
@@ -0,0 +1,66 @@
+import json
+
+import requests_mock
+
+from pubg_client import Client
+from pubg_client._jsonapi import Document, Reference
+from pubg_client.models import Asset, Match, Participant, Roster
+from pubg_client.testing.payloads import match_document
+
+MATCH_URL = 'https://api.playbattlegrounds.com/shards/pc-na/matches/match-1'
+
+
+class TestDocument:
+
+    def test_relationships_are_resolved(self):
+        document = match_document('match-1', n_rosters=2)
+        match = Document(document).resolve()
+
+        assert match['gameMode'] == 'squad-fpp'
+        assert [roster['id'] for roster in match['rosters']] == [roster['id'] for roster in document['data']['relationships']['rosters']['data']]
+        assert match['rosters'][1]['participants'][0]['stats']['name'] == 'player-4'
+        assert match['rosters'][0]['team'] is None
+        assert match['assets'][0]['URL'].endswith('match-1-telemetry.json')
+
+    def test_resources_are_flattened_once(self):
+        document = match_document('match-1', n_rosters=2)
+        rosters = document['data']['relationships']['rosters']['data']
+        rosters.append(dict(rosters[0]))
+        match = Document(document).resolve()
+
+        assert match['rosters'][0] is match['rosters'][2]
+
+    def test_missing_resources_stay_references(self):
+        document = match_document('match-1', n_rosters=2, missing={(0, 1)})
+        match = Document(document).resolve()
+
+        participant = match['rosters'][0]['participants'][1]
+        assert isinstance(participant, Reference) and participant.type == 'participant'
+        assert participant.id not in {resource['id'] for resource in document['included']}
+
+    def test_list_data(self):
+        document = match_document('match-1', n_rosters=2)
+        document['data'] = [document['data']]
+
+        assert Document(document).resolve()[0]['id'] == 'match-1'
+
+
+class TestMatchEndpoint:
+
+    def test_models(self):
+        document = match_document('match-1', n_rosters=100, missing={(3, 1)})
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, text=json.dumps(document))
+            match = Client(autocall=True).api.match('match-1')
+
+        assert isinstance(match, Match)
+        assert match.duration == document['data']['attributes']['duration']
+        assert match.stats is None
+        assert len(match.rosters) == 100
+        assert isinstance(match.rosters[0], Roster)
+        assert isinstance(match.rosters[0].participants[0], Participant)
+        assert match.rosters[0].participants[1].stats['name'] == 'player-1'
+        assert isinstance(match.rosters[3].participants[1], Reference)
+        assert isinstance(match.assets[0], Asset)
+        assert match.assets[0].name == 'telemetry'
+        assert match.assets[0].created_at == match.assets[0].createdAt == '2018-03-13T17:39:24Z'
@@ -0,0 +1,137 @@
+import json
+import re
+
+import pytest
+import requests
+import requests_mock
+
+from pubg_client import Client, MetricsCollector, TTLCache
+from pubg_client._metrics import Histogram
+from pubg_client.testing.payloads import match_document, status_document
+
+MATCH_URL = 'https://api.playbattlegrounds.com/shards/pc-na/matches/match-1'
+STATUS_URL = 'https://api.playbattlegrounds.com/status'
+
+
+class TestHooks:
+
+    def test_events(self):
+        client = Client(autocall=True)
+        events = []
+        for event in ('prepare_request', 'make_request', 'endpoint_request'):
+            client.on(event, events.append)
+
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, text=json.dumps(match_document('match-1', n_rosters=2)))
+            client.api.match('match-1')
+
+        assert [event.event for event in events] == ['prepare_request', 'make_request', 'endpoint_request']
+        prepare, make, endpoint = events
+        assert prepare.url == MATCH_URL and prepare.shard == 'pc-na'
+        assert make.status_code == 200 and make.bytes == len(json.dumps(match_document('match-1', n_rosters=2)))
+        assert endpoint.endpoint == 'match' and endpoint.cache is None
+        assert endpoint.deserialize > 0 and endpoint.network > 0
+        assert endpoint.elapsed >= endpoint.network + endpoint.deserialize
+
+    def test_decorator_and_off(self):
+        client = Client(autocall=True)
+        events = []
+
+        @client.on('make_request')
+        def record(event):
+            events.append(event)
+
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, text=json.dumps(status_document()))
+            client.api.status()
+            client.off('make_request', record)
+            client.api.status()
+
+        assert len(events) == 1
+
+    def test_cache(self):
+        client = Client(autocall=True, ttl_cache=TTLCache(ttl=60))
+        events = []
+        client.on('endpoint_request', events.append)
+
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, text=json.dumps(status_document()))
+            client.api.status()
+            client.api.status()
+
+        assert [event.cache for event in events] == ['miss', 'hit']
+        assert events[1].network is None
+
+    def test_errors(self):
+        client = Client(autocall=True)
+        events = []
+        client.on('make_request', events.append)
+        client.on('endpoint_request', events.append)
+
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, status_code=500)
+            with pytest.raises(requests.HTTPError):
+                client.api.status()
+
+        assert events[0].status_code == 500 and events[0].error is None
+        assert isinstance(events[1].error, requests.HTTPError)
+
+    def test_unknown_event(self):
+        with pytest.raises(ValueError):
+            Client().on('send', print)
+
+
+class TestMetricsCollector:
+
+    def test_histogram_quantile(self):
+        histogram = Histogram(buckets=(1, 2, 4))
+        for value in (0.5, 1.5, 1.5, 3):
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 1.5
+        assert histogram.cumulative() == [('1', 1), ('2', 3), ('4', 4), ('+Inf', 4)]
+
+    def test_collects(self):
+        client = Client(autocall=True)
+        metrics = MetricsCollector().attach(client)
+
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, text=json.dumps(match_document('match-1', n_rosters=2)))
+            m.get(STATUS_URL, text=json.dumps(status_document()))
+            for _ in range(3):
+                client.api.match('match-1')
+            client.api.status()
+
+        assert metrics.value('endpoint_requests_total', endpoint='match') == 3
+        assert metrics.value('http_requests_total', status='200') == 4
+        assert metrics.value('http_requests_total', shard='pc-na') == 3
+        assert metrics.histogram('endpoint_deserialize_seconds', endpoint='match').count == 3
+        assert metrics.quantile('endpoint_seconds', 0.99, endpoint='status') > 0
+
+        # histogram() returns a snapshot, which later requests leave alone
+        histogram = metrics.histogram('endpoint_seconds', endpoint='status')
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, text=json.dumps(status_document()))
+            client.api.status()
+        assert histogram.count == 1
+        assert metrics.histogram('endpoint_seconds', endpoint='status').count == 2
+
+        metrics.detach(client)
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, text=json.dumps(status_document()))
+            client.api.status()
+        assert metrics.value('http_requests_total') == 5
+
+    def test_prometheus(self):
+        client = Client(autocall=True)
+        metrics = MetricsCollector().attach(client)
+
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, text=json.dumps(status_document()))
+            client.api.status()
+
+        text = metrics.prometheus()
+        assert '# TYPE pubg_client_endpoint_seconds histogram' in text
+        assert 'pubg_client_endpoint_requests_total{endpoint="status",shard="",cache="none",status="200"} 1' in text
+        assert re.search(r'^pubg_client_endpoint_seconds_bucket\{endpoint="status",le="\+Inf"\} 1$', text, re.M)
+        assert 'pubg_client_endpoint_seconds_count{endpoint="status"} 1' in text
@@ -0,0 +1,124 @@
+import pytest
+import requests
+
+from pubg_client import Client, RateLimiter, RetryPolicy
+from pubg_client.models import Match
+from pubg_client.testing import LoadReport, MockServer, run_load
+from pubg_client.testing.load import percentile
+
+
+@pytest.fixture
+def server():
+    with MockServer(n_matches=12, n_rosters=2, telemetry_size=50) as server:
+        yield server
+
+
+class TestMockServer:
+
+    def test_endpoints(self, server):
+        client = Client(base_url=server.url)
+
+        assert client.api.status()().version == 'v8.1.0'
+
+        match = client.api.match('match-3')()
+        assert isinstance(match, Match)
+        assert match.created_at.minute == 3
+        assert len(match.rosters[0].participants) == 4
+
+        matches = list(client.api.matches.paginate(max_items=7))
+        assert [match.id for match in matches] == ['match-{}'.format(i) for i in range(7)]
+
+        events = list(client.telemetry(match.assets[0], raw=True))
+        assert len(events) == 50
+        assert events[0]['_T'] == 'LogMatchStart'
+
+    def test_filters_and_pages(self, server):
+        client = Client(base_url=server.url, shard='pc-eu')
+        request = client.api.matches.prepare().filter('createdAt-start', server.created_at['match-10']).limit(1)
+        pages = list(request.paginate().pages())
+
+        assert [[match.id for match in page] for page in pages] == [['match-10'], ['match-11']]
+        assert pages[0][0].shard_id == 'pc-eu'
+
+    def test_gzip(self, server):
+        compressed = requests.get(server.url + '/status', headers={'Accept-Encoding': 'gzip'})
+        plain = requests.get(server.url + '/status', headers={'Accept-Encoding': 'identity'})
+
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+        assert 'Content-Encoding' not in plain.headers
+        assert compressed.json() == plain.json()
+
+    def test_client_accepts_gzip(self, server):
+        status = Client(base_url=server.url).api.status()()
+
+        assert status._response.headers['Content-Encoding'] == 'gzip'
+        assert status.version == 'v8.1.0'
+
+    def test_not_found(self, server):
+        with pytest.raises(requests.HTTPError):
+            Client(base_url=server.url).api.match('missing')()
+        assert server.requests[404] == 1
+
+    def test_errors_are_retried(self):
+        with MockServer(error_rate=0.5, seed=1) as server:
+            client = Client(base_url=server.url, retry_policy=RetryPolicy(max_attempts=10, backoff=0.001))
+            for _ in range(5):
+                client.api.status()()
+
+        assert server.requests[200] == 5
+        assert server.requests[500] > 0
+
+    def test_rate_limit(self):
+        with MockServer(rate_limit=2, rate_period=30) as server:
+            responses = [requests.get(server.url + '/status') for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200, 200, 429]
+        assert responses[1].headers['X-RateLimit-Remaining'] == '0'
+        assert 1 <= int(responses[2].headers['Retry-After']) <= 30
+
+        limiter = RateLimiter(limit=10)
+        limiter.update(responses[1].headers)
+        assert limiter.try_acquire() > 0
+
+    def test_reset_rate_limit(self):
+        with MockServer(rate_limit=1, rate_period=30) as server:
+            requests.get(server.url + '/status')
+            server.reset_rate_limit()
+            response = requests.get(server.url + '/status')
+
+        assert response.status_code == 200
+        assert response.headers['X-RateLimit-Remaining'] == '0'
+
+    def test_latency(self):
+        with MockServer(latency=0.05, jitter=0.01) as server:
+            report = run_load(Client(base_url=server.url), lambda client, i: client.api.status(), calls=4, concurrency=2)
+
+        assert report.percentile(0) >= 0.05
+
+
+class TestLoad:
+
+    def test_report(self, server):
+        client = Client(base_url=server.url, pool_maxsize=4)
+        report = run_load(client, lambda client, i: client.api.match('match-{}'.format(i % 15)), calls=30, concurrency=4)
+
+        assert report.calls == 30
+        assert report.errors == {'HTTPError': 6}
+        assert report.throughput > 0
+        assert report.percentile(0.5) <= report.percentile(0.99)
+        assert set(report.as_dict()['latency']) == {'p50', 'p90', 'p99'}
+        assert '30 calls, 6 errors' in report.summary()
+
+    def test_duration(self):
+        report = run_load(None, lambda client, i: None, calls=10 ** 9, concurrency=2, duration=0.05)
+
+        assert 0 < report.calls < 10 ** 9
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile(values, 1) == 100
+        assert percentile([], 0.5) is None
+        assert LoadReport([0.2, 0.1], {}, 1.0, 1).percentile(0) == 0.1
@@ -0,0 +1,98 @@
+import json
+
+import pendulum
+import pytest
+import requests_mock
+
+from pubg_client import Client, ModelEncoder
+from pubg_client._jsonapi import Document
+from pubg_client.models import Match, Participant, Roster, Status, compact, lazy
+from pubg_client.models._base import Timestamp
+from pubg_client.testing.payloads import match_document, status_document
+
+
+class TestCompact:
+
+    def test_slots(self):
+        participant = compact(Participant).load({'id': 'p', 'stats': {}, 'actor': '', 'shardId': 'pc-na'})
+
+        assert not hasattr(participant, '__dict__')
+        assert participant.id == 'p'
+        with pytest.raises(AttributeError):
+            participant.unknown = 1
+
+    def test_same_behaviour(self):
+        payload = Document(match_document('match-1', n_rosters=2)).resolve()
+        plain, small = Match.load(payload), compact(Match).load(payload)
+
+        assert small.export().keys() == plain.export().keys()
+        assert repr(small) == repr(plain)
+        assert json.dumps(small, cls=ModelEncoder) == json.dumps(plain, cls=ModelEncoder)
+        assert type(small.rosters[0].participants[0]) is compact(Participant)
+
+    def test_properties_are_kept(self):
+        assert compact(Status).load(status_document()['data']).version == 'v8.1.0'
+
+    def test_client_mode(self):
+        with requests_mock.mock() as m:
+            m.get('https://api.playbattlegrounds.com/status', json=status_document())
+            status = Client(autocall=True, model_mode='compact').api.status()
+
+        assert type(status) is compact(Status)
+        assert status._response.ok
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            Client(model_mode='tiny')
+
+
+class TestLazy:
+
+    def test_fields_decode_on_access(self):
+        payload = Document(match_document('match-1', n_rosters=2)).resolve()
+        match = lazy(Match).load(payload)
+
+        assert isinstance(match, Match)
+        assert 'rosters' not in vars(match)
+        assert match.game_mode == 'squad-fpp'
+        assert 'rosters' not in vars(match)
+
+        rosters = match.rosters
+        assert match.rosters is rosters
+        assert type(rosters[0]) is lazy(Roster)
+
+    def test_same_behaviour(self):
+        payload = Document(match_document('match-1', n_rosters=2)).resolve()
+        plain, deferred = Match.load(payload), lazy(Match).load(payload)
+
+        assert repr(deferred) == repr(plain)
+        assert json.dumps(deferred, cls=ModelEncoder) == json.dumps(plain, cls=ModelEncoder)
+
+    def test_client_mode(self):
+        with requests_mock.mock() as m:
+            m.get('https://api.playbattlegrounds.com/status', json=status_document())
+            status = Client(autocall=True, model_mode='lazy').api.status()
+
+        assert isinstance(status, Status)
+        assert status.released_at.year == 2018
+
+
+class TestTimestamp:
+
+    @pytest.mark.parametrize('value', [
+        '2018-03-12T14:08:16Z',
+        '2018-03-12T14:08:16.1Z',
+        '2018-03-12T14:08:16.123456789Z',
+        '2018-03-12T14:08:16+02:00',
+        '2018-03-12',
+    ])
+    def test_matches_pendulum(self, value):
+        parsed = Timestamp()(value)
+
+        assert isinstance(parsed, pendulum.Pendulum)
+        assert parsed == pendulum.parse(value)
+        assert parsed.isoformat() == pendulum.parse(value).isoformat()
+
+    def test_memoize(self):
+        timestamp = Timestamp(maxsize=4)
+        assert timestamp('2018-03-12T14:08:16Z') is timestamp('2018-03-12T14:08:16Z')
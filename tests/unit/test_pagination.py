@@ -0,0 +1,128 @@
+import json
+import threading
+
+import pytest
+import requests_mock
+
+from pubg_client import Client, RetryPolicy, TTLCache
+from pubg_client.models import Match, MatchCollection
+from pubg_client.testing.payloads import page_document
+
+MATCHES_URL = 'https://api.playbattlegrounds.com/shards/pc-na/matches'
+
+
+def mock_pages(m, pages, per_page=2):
+    m.get(MATCHES_URL, text=json.dumps(page_document(MATCHES_URL, 0, pages, per_page)))
+    for page in range(1, pages):
+        m.get('{}?page={}'.format(MATCHES_URL, page), text=json.dumps(page_document(MATCHES_URL, page, pages, per_page)))
+
+
+class TestPaginator:
+
+    def test_follows_next(self):
+        with requests_mock.mock() as m:
+            mock_pages(m, 3)
+            matches = list(Client().api.matches.paginate())
+
+        assert [match.id for match in matches] == ['match-0-0', 'match-0-1', 'match-1-0', 'match-1-1', 'match-2-0', 'match-2-1']
+        assert all(isinstance(match, Match) for match in matches)
+        assert matches[0].rosters[0].participants[0].stats['name'] == 'player-0'
+        assert m.call_count == 3
+
+    @pytest.mark.parametrize('prefetch', [True, False])
+    def test_max_pages(self, prefetch):
+        with requests_mock.mock() as m:
+            mock_pages(m, 5)
+            pages = list(Client().api.matches.paginate(max_pages=2, prefetch=prefetch).pages())
+
+        assert len(pages) == 2
+        assert m.call_count == 2
+
+    @pytest.mark.parametrize('prefetch', [True, False])
+    def test_max_items(self, prefetch):
+        with requests_mock.mock() as m:
+            mock_pages(m, 5)
+            matches = list(Client().api.matches.paginate(max_items=3, prefetch=prefetch))
+
+        assert [match.id for match in matches] == ['match-0-0', 'match-0-1', 'match-1-0']
+        assert m.call_count == 2
+
+    def test_max_items_on_a_page_boundary_does_not_prefetch(self):
+        with requests_mock.mock() as m:
+            mock_pages(m, 5)
+            matches = list(Client().api.matches.paginate(max_items=4))
+
+        assert len(matches) == 4
+        assert m.call_count == 2
+
+    def test_prefetches_next_page(self):
+        fetched = threading.Event()
+
+        def callback(request, context):
+            fetched.set()
+            return json.dumps(page_document(MATCHES_URL, 1, 2))
+
+        with requests_mock.mock() as m:
+            m.get(MATCHES_URL, text=json.dumps(page_document(MATCHES_URL, 0, 2)))
+            m.get('{}?page=1'.format(MATCHES_URL), text=callback)
+            pages = Client().api.matches.paginate().pages()
+
+            next(pages)
+            assert fetched.wait(5)
+            assert len(next(pages)) == 2
+
+    def test_raw(self):
+        with requests_mock.mock() as m:
+            mock_pages(m, 2)
+            matches = list(Client(raw=True).api.matches.paginate())
+
+        assert [match['id'] for match in matches] == ['match-0-0', 'match-0-1', 'match-1-0', 'match-1-1']
+
+    def test_errors(self):
+        with requests_mock.mock() as m:
+            m.get(MATCHES_URL, text=json.dumps(page_document(MATCHES_URL, 0, 2)))
+            m.get('{}?page=1'.format(MATCHES_URL), status_code=500)
+            pages = Client().api.matches.paginate().pages()
+
+            next(pages)
+            with pytest.raises(Exception):
+                next(pages)
+
+    def test_pages_go_through_the_endpoint(self):
+        client = Client(ttl_cache=TTLCache(), retry_policies={'matches': RetryPolicy(backoff=0, jitter=False)})
+        events = []
+        client.on('endpoint_request', events.append)
+
+        with requests_mock.mock() as m:
+            m.get(MATCHES_URL, text=json.dumps(page_document(MATCHES_URL, 0, 2)))
+            m.get('{}?page=1'.format(MATCHES_URL), [{'status_code': 503}, {'text': json.dumps(page_document(MATCHES_URL, 1, 2))}])
+            first = [match.id for match in client.api.matches.paginate(prefetch=False)]
+            second = [match.id for match in client.api.matches.paginate(prefetch=False)]
+
+        assert first == second == ['match-0-0', 'match-0-1', 'match-1-0', 'match-1-1']
+        assert m.call_count == 3
+        assert [(event.endpoint, event.cache) for event in events] == [('matches', 'miss')] * 2 + [('matches', 'hit')] * 2
+
+
+class TestMatchCollection:
+
+    def test_navigation(self):
+        client = Client(autocall=True)
+        with requests_mock.mock() as m:
+            mock_pages(m, 2)
+            first = client.api.matches()
+            second = first.next(client)
+
+            assert isinstance(first, MatchCollection)
+            assert [match.id for match in second.matches] == ['match-1-0', 'match-1-1']
+            assert second.next(client) is None
+            assert second.previous(client).matches[0].id == 'match-0-0'
+
+    def test_client_pages(self):
+        client = Client()
+        with requests_mock.mock() as m:
+            mock_pages(m, 3)
+            response = client.next_page(client.request('GET', MATCHES_URL))
+
+            assert response.json()['data'][0]['id'] == 'match-1-0'
+            assert client.previous_page(response).json()['data'][0]['id'] == 'match-0-0'
@@ -0,0 +1,46 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from pubg_client import ModelEncoder, load_many
+from pubg_client._jsonapi import Document
+from pubg_client.models import Match, Status
+from pubg_client.testing.payloads import match_document
+
+
+def bodies(n):
+    for i in range(n):
+        document = match_document('match-1', n_rosters=2)
+        document['data']['id'] = 'match-{}'.format(i)
+        yield json.dumps(document).encode('utf-8')
+
+
+class TestLoadMany:
+
+    @pytest.mark.parametrize('max_workers', [0, 2])
+    def test_models_in_order(self, max_workers):
+        matches = list(load_many(bodies(25), Match, chunksize=4, max_workers=max_workers))
+
+        assert [match.id for match in matches] == ['match-{}'.format(i) for i in range(25)]
+        assert isinstance(matches[0], Match)
+        assert matches[0].rosters[1].participants[0].stats['name'] == 'player-4'
+        assert matches[0].created_at.year == 2018
+
+    def test_export(self):
+        exported = list(load_many(bodies(3), Match, max_workers=1, export=True))
+        expected = json.loads(json.dumps(Match.load(Document(match_document('match-1', n_rosters=2)).resolve()), cls=ModelEncoder))
+
+        assert exported[0] == dict(expected, id='match-0')
+
+    def test_shared_executor(self):
+        status = b'{"data": {"type": "status", "id": "pubg-api", "attributes": {"version": "master"}}}'
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            first = list(load_many([status] * 3, Status, resolve_included=False, executor=executor))
+            second = list(load_many([status], Status, resolve_included=False, executor=executor))
+
+        assert [status.version for status in first + second] == ['master'] * 4
+
+    def test_errors_are_raised(self):
+        with pytest.raises(ValueError):
+            list(load_many([b'not json'], Match, max_workers=1))
@@ -0,0 +1,61 @@
+import requests_mock
+
+from pubg_client import Client, RateLimiter, SharedRateLimiter
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+
+    def test_bucket_refills(self):
+        clock = FakeClock()
+        limiter = RateLimiter(limit=2, period=60, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 30
+        assert clock.sleeps == [30]
+
+    def test_headers_hold_until_reset(self):
+        clock = FakeClock()
+        limiter = RateLimiter(limit=10, period=60, clock=clock, sleep=clock.sleep)
+        limiter.update({'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '1045'})
+
+        assert limiter.acquire() == 45
+        for _ in range(9):
+            assert limiter.acquire() == 0
+
+    def test_missing_headers_are_ignored(self):
+        limiter = RateLimiter(limit=1)
+        limiter.update({})
+        assert limiter.try_acquire() == 0
+
+    def test_shared_state(self, tmpdir):
+        clock = FakeClock()
+        path = str(tmpdir.join('bucket.json'))
+        first = SharedRateLimiter(path, limit=1, clock=clock, sleep=clock.sleep)
+        second = SharedRateLimiter(path, limit=1, clock=clock, sleep=clock.sleep)
+
+        assert first.try_acquire() == 0
+        assert second.try_acquire() == 60
+
+    def test_client_reads_headers(self):
+        limiter = RateLimiter(limit=10)
+        headers = {'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '3', 'X-RateLimit-Reset': '9999999999'}
+        with requests_mock.mock() as m:
+            m.get('https://api.playbattlegrounds.com/status', json={'data': {}}, headers=headers)
+            Client(raw=True, autocall=True, rate_limiter=limiter).api.status()
+
+        assert limiter.load_state()['tokens'] == 3
@@ -0,0 +1,240 @@
+import asyncio
+
+import pytest
+import requests
+import requests_mock
+
+from pubg_client import AsyncClient, CircuitBreakers, CircuitOpenError, Client, RetryPolicy
+from pubg_client._retry import CircuitBreaker
+from pubg_client.testing.payloads import status_document
+
+STATUS_URL = 'https://api.playbattlegrounds.com/status'
+MATCH_URL = 'https://api.playbattlegrounds.com/shards/pc-na/matches/match-1'
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def policy(**kwargs):
+    sleeps = []
+    return RetryPolicy(sleep=sleeps.append, random=lambda: 1.0, **kwargs), sleeps
+
+
+class TestRetryPolicy:
+
+    def test_retries_transient_errors(self):
+        retry, sleeps = policy(backoff=1)
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, [{'status_code': 503}, {'exc': requests.exceptions.ConnectTimeout}, {'json': status_document()}])
+            status = Client(autocall=True, retry_policy=retry).api.status()
+
+        assert status.id == 'pubg-api'
+        assert sleeps == [1, 2]
+        assert retry.stats() == {'retries': 2, 'gave_up': 0}
+
+    def test_gives_up(self):
+        retry, sleeps = policy(max_attempts=3)
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, status_code=500)
+            with pytest.raises(requests.HTTPError):
+                Client(autocall=True, retry_policy=retry).api.status()
+
+        assert m.call_count == 3
+        assert retry.stats() == {'retries': 2, 'gave_up': 1}
+
+    def test_retry_after(self):
+        retry, sleeps = policy()
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, [{'status_code': 429, 'headers': {'Retry-After': '7'}}, {'json': status_document()}])
+            Client(autocall=True, retry_policy=retry).api.status()
+
+        assert sleeps == [7]
+
+    def test_retry_after_date(self):
+        response = requests.Response()
+        response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+        assert RetryPolicy.retry_after(response) == 0
+
+    def test_client_errors_and_posts_are_not_retried(self):
+        retry, sleeps = policy()
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, status_code=404)
+            m.post(STATUS_URL, status_code=503)
+            client = Client(retry_policy=retry)
+            assert client.request('GET', STATUS_URL).status_code == 404
+            assert client.request('POST', STATUS_URL).status_code == 503
+
+        assert sleeps == []
+
+    def test_per_endpoint(self):
+        retry, sleeps = policy()
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, [{'status_code': 503}, {'json': status_document()}])
+            m.get(MATCH_URL, [{'status_code': 503}, {'json': status_document()}])
+            client = Client(autocall=True, retry_policy=retry, retry_policies={'match': None})
+            client.api.status()
+            with pytest.raises(requests.HTTPError):
+                client.api.match('match-1')
+
+        assert len(sleeps) == 1
+
+
+class TestCircuitBreaker:
+
+    def test_opens_and_recovers(self):
+        clock = Clock()
+        breaker = CircuitBreaker('pc-na', failure_threshold=2, recovery_timeout=10, clock=clock)
+        failure = requests.Response()
+        failure.status_code = 500
+
+        breaker.record(breaker.allow(), response=failure)
+        breaker.record(breaker.allow(), error=requests.ConnectionError())
+        assert breaker.state == 'open'
+        with pytest.raises(CircuitOpenError) as info:
+            breaker.allow()
+        assert info.value.retry_in == 10
+
+        clock.now = 10
+        assert breaker.state == 'half-open'
+        trial = breaker.allow()
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+        breaker.record(trial, response=failure)
+        assert breaker.state == 'open'
+
+        clock.now = 20
+        breaker.record(breaker.allow())
+        assert breaker.state == 'closed'
+        assert breaker.stats() == {'state': 'closed', 'failures': 0, 'opened': 2, 'rejected': 2}
+
+    def test_only_the_trial_ends_the_half_open_state(self):
+        clock = Clock()
+        breaker = CircuitBreaker('pc-na', failure_threshold=1, recovery_timeout=10, clock=clock)
+        slow = breaker.allow()
+        breaker.record(breaker.allow(), error=requests.ConnectionError())
+
+        clock.now = 10
+        trial = breaker.allow()
+        breaker.record(slow)
+        assert breaker.state == 'half-open'
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+
+        breaker.record(trial)
+        assert breaker.state == 'closed'
+
+    def test_stale_failures_do_not_extend_the_cool_down(self):
+        clock = Clock()
+        breaker = CircuitBreaker('pc-na', failure_threshold=1, recovery_timeout=10, clock=clock)
+        slow = breaker.allow()
+        breaker.record(breaker.allow(), error=requests.ConnectionError())
+
+        clock.now = 5
+        breaker.record(slow, error=requests.ConnectionError())
+        clock.now = 10
+        assert breaker.state == 'half-open'
+        breaker.record(breaker.allow())
+
+        breaker.record(slow, error=requests.ConnectionError())
+        assert breaker.state == 'closed' and breaker.failures == 0
+        assert breaker.stats()['opened'] == 1
+
+    def test_per_shard(self):
+        breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=60)
+        client = Client(autocall=True, circuit_breakers=breakers)
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, status_code=502)
+            m.get(STATUS_URL, json=status_document())
+            with pytest.raises(requests.HTTPError):
+                client.api.match('match-1')
+            with pytest.raises(CircuitOpenError):
+                client.api.match('match-1')
+            client.api.status()
+
+        assert m.call_count == 2
+        assert breakers.stats()['pc-na']['state'] == 'open'
+        assert breakers.stats()[None]['state'] == 'closed'
+
+    def test_trial_ending_in_any_exception_is_released(self):
+        clock = Clock()
+        breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=10, clock=clock)
+        client = Client(autocall=True, circuit_breakers=breakers)
+
+        def hook(event):
+            raise RuntimeError('hook failed')
+
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL, status_code=502)
+            with pytest.raises(requests.HTTPError):
+                client.api.match('match-1')
+
+            clock.now = 10
+            client.on('make_request', hook)
+            with pytest.raises(RuntimeError):
+                client.api.match('match-1')
+            assert breakers.get('pc-na').state == 'open'
+
+            clock.now = 20
+            client.off('make_request', hook)
+            m.get(MATCH_URL, status_code=404)
+            with pytest.raises(requests.HTTPError):
+                client.api.match('match-1')
+            assert breakers.get('pc-na').state == 'closed'
+
+
+class TestAsyncRetry:
+
+    def test_cancelled_trial_is_released(self):
+        pytest.importorskip('aiohttp')
+        clock = Clock()
+        breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker = breakers.get('pc-na')
+        breaker.record(breaker.allow(), error=requests.ConnectionError())
+
+        async def hang(request):
+            await asyncio.sleep(60)
+
+        async def test():
+            client = AsyncClient(circuit_breakers=breakers)
+            client.send_request = hang
+            request = client.prepare_request('GET', MATCH_URL).prepared_request
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.make_request(request), 0.01)
+
+        clock.now = 10
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(test())
+        finally:
+            loop.close()
+
+        assert breaker.state == 'open'
+        clock.now = 20
+        breaker.allow()
+        assert breaker.state == 'half-open'
+
+    def test_retries(self):
+        web = pytest.importorskip('aiohttp.web')
+        from .test_async import serve
+
+        attempts = []
+
+        async def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                return web.Response(status=503, headers={'Retry-After': '0'})
+            return web.json_response(status_document())
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url, retry_policy=RetryPolicy()) as client:
+                return await client.api.status()
+
+        assert serve(handler, test).id == 'pubg-api'
+        assert len(attempts) == 2
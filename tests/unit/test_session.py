@@ -0,0 +1,83 @@
+import json
+import threading
+
+import requests_mock
+
+from pubg_client import Client
+from pubg_client.testing.payloads import match_document, status_document
+
+MATCH_URL = 'https://api.playbattlegrounds.com/shards/pc-na/matches/{}'
+STATUS_URL = 'https://api.playbattlegrounds.com/status'
+
+
+class TestSession:
+
+    def test_session_is_reused(self):
+        client = Client()
+        with client.sessions.session() as session:
+            pass
+        with client.sessions.session() as other:
+            pass
+
+        assert other is session
+        assert len(client.sessions) == 1
+
+    def test_session_is_shared_across_threads(self):
+        client = Client()
+        with client.sessions.session() as session:
+            pass
+
+        sessions = []
+
+        def use():
+            with client.sessions.session() as other:
+                sessions.append(other)
+
+        thread = threading.Thread(target=use)
+        thread.start()
+        thread.join()
+
+        assert sessions == [session]
+
+    def test_concurrent_requests_get_their_own_session(self):
+        client = Client()
+        with client.sessions.session() as session:
+            with client.sessions.session() as other:
+                assert other is not session
+        assert len(client.sessions) == 2
+
+    def test_idle_sessions_are_bounded(self):
+        client = Client(pool_maxsize=2)
+        sessions = [client.sessions.acquire() for _ in range(4)]
+        for session in sessions:
+            client.sessions.release(session)
+
+        assert len(client.sessions) == 2
+
+    def test_thread_pools_reuse_sessions(self):
+        client = Client(autocall=True, pool_maxsize=4)
+        with requests_mock.mock() as m:
+            m.get(MATCH_URL.format('1'), text=json.dumps(match_document('1', n_rosters=1)))
+            m.get(STATUS_URL, text=json.dumps(status_document()))
+            for _ in range(5):
+                batch = client.api.match.many(['1'] * 8, max_workers=4)
+                assert len(list(batch)) == 8
+                fan_out = client.fan_out(lambda client: client.api.status(), shards=['pc-na', 'pc-eu', 'pc-as'])
+                assert not fan_out.collect()[0].error
+
+        assert len(client.sessions) <= 4
+
+    def test_pool_size(self):
+        client = Client(pool_maxsize=32)
+        with client.sessions.session() as session:
+            adapter = session.get_adapter('https://api.playbattlegrounds.com')
+        assert adapter._pool_maxsize == 32
+
+    def test_close(self):
+        with Client() as client:
+            with client.sessions.session() as session:
+                pass
+
+        assert len(client.sessions) == 0
+        with client.sessions.session() as other:
+            assert other is not session
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+import requests_mock
+
+from pubg_client import AsyncClient, Client, SingleFlight
+from pubg_client._singleflight import AsyncSingleFlight
+from pubg_client.testing.payloads import status_document
+
+STATUS_URL = 'https://api.playbattlegrounds.com/status'
+
+
+def concurrently(fn, n):
+    barrier = threading.Barrier(n)
+    results = [None] * n
+
+    def run(i):
+        barrier.wait()
+        results[i] = fn()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+
+    def test_coalesces(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = concurrently(lambda: single_flight.do('key', slow), 8)
+
+        assert len(calls) == 1
+        assert len({id(result) for result, _ in results}) == 1
+        assert sorted(shared for _, shared in results) == [False] + [True] * 7
+        assert single_flight.stats() == {'calls': 1, 'coalesced': 7, 'in_flight': 0}
+
+    def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.1)
+            raise KeyError('x')
+
+        def call():
+            with pytest.raises(KeyError):
+                single_flight.do('key', fail)
+
+        concurrently(call, 4)
+        assert single_flight.stats()['calls'] == 1
+
+    def test_not_a_cache(self):
+        single_flight = SingleFlight()
+
+        assert single_flight.do('key', lambda: 1) == (1, False)
+        assert single_flight.do('key', lambda: 2) == (2, False)
+
+
+class TestClient:
+
+    def test_identical_calls_share_a_request(self):
+        client = Client(autocall=True, coalesce=True)
+        events = []
+        client.on('endpoint_request', events.append)
+
+        def callback(request, context):
+            time.sleep(0.2)
+            return json.dumps(status_document())
+
+        with requests_mock.mock() as m:
+            m.get(STATUS_URL, text=callback)
+            statuses = concurrently(client.api.status, 6)
+
+        assert m.call_count == 1
+        assert all(status is statuses[0] for status in statuses)
+        assert client.single_flight.stats()['coalesced'] == 5
+        assert sorted(event.cache or '' for event in events) == [''] + ['coalesced'] * 5
+
+    def test_wrong_single_flight_is_rejected(self):
+        shared = SingleFlight()
+        assert Client(coalesce=shared).single_flight is shared
+
+        with pytest.raises(TypeError):
+            Client(coalesce=AsyncSingleFlight())
+        with pytest.raises(TypeError):
+            Client(coalesce='yes')
+
+    def test_disabled_by_default(self):
+        assert Client().single_flight is None
+
+
+class TestAsync:
+
+    def test_coalesces(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 'status'
+
+        async def main():
+            return await asyncio.gather(*[single_flight.do('key', slow) for _ in range(5)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(main())
+        finally:
+            loop.close()
+        assert [result for result, _ in results] == ['status'] * 5
+        assert len(calls) == 1
+        assert single_flight.stats() == {'calls': 1, 'coalesced': 4, 'in_flight': 0}
+
+    def test_wrong_single_flight_is_rejected(self):
+        shared = AsyncSingleFlight()
+        assert AsyncClient(coalesce=shared).single_flight is shared
+
+        with pytest.raises(TypeError, match='AsyncSingleFlight'):
+            AsyncClient(coalesce=SingleFlight())
+
+    def test_client(self):
+        web = pytest.importorskip('aiohttp.web')
+        from .test_async import serve
+
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(0.05)
+            return web.Response(text=json.dumps(status_document()), content_type='application/json')
+
+        async def test(base_url):
+            async with AsyncClient(base_url=base_url, coalesce=True) as client:
+                statuses = await asyncio.gather(*[client.api.status() for _ in range(5)])
+                return client, statuses
+
+        client, statuses = serve(handler, test)
+        assert len(requests) == 1
+        assert all(status is statuses[0] for status in statuses)
+        assert isinstance(client.single_flight, AsyncSingleFlight)
@@ -0,0 +1,168 @@
+import json
+import sqlite3
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests_mock
+
+from pubg_client import Client, MatchSync, SyncStore
+from pubg_client._jsonapi import Document
+from pubg_client._sync import match_key
+from pubg_client.models import Match
+from pubg_client.testing.payloads import match_document, matches_document
+
+MATCHES_URL = 'https://api.playbattlegrounds.com/shards/{}/matches'
+
+
+class MatchServer:
+    """Serves ``matches`` pages of 2, honouring ``filter[createdAt-start]`` and ``page[offset]``"""
+
+    def __init__(self):
+        self.matches = []
+        self.requests = []
+
+    def add(self, *created_at):
+        for timestamp in created_at:
+            self.matches.append(('match-{}'.format(len(self.matches)), timestamp))
+
+    def __call__(self, request, context):
+        query = {name: values[0] for name, values in parse_qs(urlsplit(request.url).query).items()}
+        self.requests.append(query)
+        shard = urlsplit(request.url).path.split('/')[2]
+        start = query.get('filter[createdAt-start]', '')
+        offset = int(query.get('page[offset]', 0))
+        matches = sorted((m for m in self.matches if m[1] >= start), key=lambda m: m[1])
+
+        documents = [match_document(id, n_rosters=1, seed=int(id.split('-')[1]), shard=shard, created_at=created_at)
+                     for id, created_at in matches[offset:offset + 2]]
+
+        links = {}
+        if offset + 2 < len(matches):
+            next_query = dict(query, **{'page[offset]': offset + 2})
+            links['next'] = '{}?{}'.format(request.url.split('?')[0], '&'.join('{}={}'.format(*i) for i in next_query.items()))
+        return json.dumps(matches_document(documents, links))
+
+
+@pytest.fixture
+def server():
+    server = MatchServer()
+    with requests_mock.mock() as m:
+        for shard in ('pc-na', 'pc-eu'):
+            m.get(MATCHES_URL.format(shard), text=server)
+        yield server
+
+
+class TestMatchSync:
+
+    def test_fetches_only_new_matches(self, server):
+        handled = []
+        store = SyncStore()
+        sync = MatchSync(Client(), store, handler=lambda shard, matches: handled.extend(m.id for m in matches))
+        server.add('2018-03-13T17:00:00Z', '2018-03-13T17:01:00Z', '2018-03-13T17:02:00Z')
+
+        first, = sync.run()
+        assert (first.pages, first.fetched, first.new) == (2, 3, 3)
+        assert first.watermark.created_at == '2018-03-13T17:02:00Z'
+        assert first.watermark.seen == {'match-2'}
+        assert handled == ['match-0', 'match-1', 'match-2']
+        assert isinstance(first.watermark, tuple)
+
+        server.add('2018-03-13T17:02:00Z', '2018-03-13T17:05:00Z')
+        second, = sync.run()
+        assert server.requests[-1]['filter[createdAt-start]'] == '2018-03-13T17:02:00Z'
+        assert server.requests[-1]['sort'] == 'createdAt'
+        assert (second.fetched, second.new) == (3, 2)
+        assert handled[3:] == ['match-3', 'match-4']
+
+        third, = sync.run()
+        assert (third.fetched, third.new) == (1, 0)
+
+    def test_resumes_after_a_failed_page(self, server, tmpdir):
+        path = str(tmpdir.join('sync.db'))
+        server.add('2018-03-13T17:00:00Z', '2018-03-13T17:01:00Z', '2018-03-13T17:02:00Z', '2018-03-13T17:03:00Z')
+
+        def fail_on_second_page(shard, matches):
+            if matches[0].id == 'match-2':
+                raise RuntimeError('crash')
+
+        with SyncStore(path) as store:
+            with pytest.raises(RuntimeError):
+                MatchSync(Client(), store, handler=fail_on_second_page).run()
+            assert store.watermark('pc-na').created_at == '2018-03-13T17:01:00Z'
+
+        handled = []
+        with SyncStore(path) as store:
+            result, = MatchSync(Client(), store, handler=lambda shard, matches: handled.extend(matches)).run()
+
+        assert [match.id for match in handled] == ['match-2', 'match-3']
+        assert all(isinstance(match, Match) for match in handled)
+        assert result.watermark.created_at == '2018-03-13T17:03:00Z'
+
+    def test_shards_are_independent(self, server):
+        server.add('2018-03-13T17:00:00Z')
+        store = SyncStore()
+        results = MatchSync(Client(raw=True), store, page_size=2).run(['pc-na', 'pc-eu'])
+
+        assert [(result.shard, result.new) for result in results] == [('pc-na', 1), ('pc-eu', 1)]
+        assert server.requests[0]['page[limit]'] == '2'
+
+        store.reset('pc-na')
+        assert store.watermark('pc-na').created_at is None
+        assert store.watermark('pc-eu').created_at == '2018-03-13T17:00:00Z'
+
+
+class TestSyncStore:
+
+    def test_prunes_ids_behind_the_watermark(self):
+        store = SyncStore()
+        store.commit('pc-na', [('a', '2018-01-01T00:00:00Z'), ('b', '2018-01-02T00:00:00Z'), ('c', '2018-01-02T00:00:00Z')])
+
+        assert store.watermark('pc-na').seen == {'b', 'c'}
+        assert store.unseen('pc-na', ['a', 'b', 'd']) == ['a', 'd']
+
+    def test_watermark_does_not_move_back(self):
+        store = SyncStore()
+        store.commit('pc-na', [('b', '2018-01-02T00:00:00Z')])
+        watermark = store.commit('pc-na', [('a', '2018-01-01T00:00:00Z')])
+
+        assert watermark.created_at == '2018-01-02T00:00:00Z'
+
+    def test_rolls_back_when_the_handler_fails(self):
+        store = SyncStore()
+
+        def handler():
+            store.connection.execute('CREATE TABLE matches (id TEXT)')
+            store.connection.execute("INSERT INTO matches VALUES ('a')")
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            store.commit('pc-na', [('a', '2018-01-01T00:00:00Z')], handler)
+
+        assert store.watermark('pc-na').created_at is None
+        assert store.connection.execute("SELECT name FROM sqlite_master WHERE name = 'matches'").fetchone() is None
+
+    def test_reset_rolls_back_when_it_fails(self):
+        store = SyncStore()
+        store.commit('pc-na', [('a', '2018-01-01T00:00:00Z')])
+        store.connection.execute('DROP TABLE seen')
+
+        with pytest.raises(sqlite3.OperationalError):
+            store.reset()
+
+        assert store.connection.execute('SELECT created_at FROM watermarks').fetchall() == [('2018-01-01T00:00:00Z',)]
+        store.connection.execute('BEGIN IMMEDIATE')
+        store.connection.execute('ROLLBACK')
+
+
+class TestMatchKey:
+
+    def test_models_and_resources_share_one_format(self):
+        document = match_document('match-0', n_rosters=1, created_at='2018-03-13T17:39:24.512Z')
+        model = Match.load(Document(document).resolve())
+
+        assert match_key(document['data']) == match_key(model) == ('match-0', '2018-03-13T17:39:24Z')
+
+    def test_offsets_are_converted_to_utc(self):
+        resource = {'id': 'match-0', 'attributes': {'createdAt': '2018-03-13T19:39:24+02:00'}}
+
+        assert match_key(resource) == ('match-0', '2018-03-13T17:39:24Z')
@@ -0,0 +1,64 @@
+import gzip
+import io
+import json
+
+import requests_mock
+
+from pubg_client import Client, iter_events
+from pubg_client.models import LogPlayerKill, LogPlayerPosition
+
+TELEMETRY_URL = 'https://telemetry-cdn.playbattlegrounds.com/bluehole-pubg/pc-na/2018/03/13/match.json'
+
+EVENTS = [
+    {'MatchId': 'match', 'PingQuality': 'low', '_D': '2018-03-13T17:00:00.1Z', '_T': 'LogMatchDefinition'},
+    {'character': {'name': 'a "quoted" [name]', 'teamId': 1, 'location': {'x': 1.5, 'y': 2, 'z': 3}},
+     'elapsedTime': 10, 'numAlivePlayers': 99, '_D': '2018-03-13T17:00:01.1Z', '_T': 'LogPlayerPosition'},
+    {'attacker': {'name': 'Ünïcode \\ attacker'}, 'victim': {'name': 'victim', '_T': 'Character'},
+     'damageTypeCategory': 'Damage_Gun', 'damageCauserName': 'WeapHK416_C', 'distance': 1234.5,
+     '_D': '2018-03-13T17:00:02.1Z', '_T': 'LogPlayerKill'},
+    {'character': {'name': 'b'}, 'elapsedTime': 11, 'numAlivePlayers': 98, '_D': '2018-03-13T17:00:03.1Z', '_T': 'LogPlayerPosition'},
+]
+
+
+class TestIterEvents:
+
+    def test_all_events(self):
+        stream = io.BytesIO(json.dumps(EVENTS).encode('utf-8'))
+        assert list(iter_events(stream, raw=True)) == EVENTS
+
+    def test_small_chunks(self):
+        document = json.dumps(EVENTS, ensure_ascii=False, indent=2).encode('utf-8')
+        for chunk_size in range(1, 40):
+            assert list(iter_events(io.BytesIO(document), raw=True, chunk_size=chunk_size)) == EVENTS
+
+    def test_gzip(self):
+        stream = io.BytesIO(gzip.compress(json.dumps(EVENTS).encode('utf-8')))
+        assert list(iter_events(stream, raw=True, chunk_size=16)) == EVENTS
+
+    def test_filtering_uses_the_top_level_type(self):
+        stream = io.BytesIO(json.dumps(EVENTS).encode('utf-8'))
+        kills = list(iter_events(stream, event_types={'LogPlayerKill'}))
+
+        assert len(kills) == 1
+        assert isinstance(kills[0], LogPlayerKill)
+        assert kills[0].distance == 1234.5
+        assert kills[0].victim == {'name': 'victim', '_T': 'Character'}
+
+    def test_typed_events(self):
+        events = list(iter_events(io.BytesIO(json.dumps(EVENTS).encode('utf-8'))))
+
+        assert isinstance(events[1], LogPlayerPosition)
+        assert events[1].num_alive_players == 99
+        assert events[0].MatchId == 'match'
+
+
+class TestClientTelemetry:
+
+    def test_streams_gzip_responses(self):
+        body = gzip.compress(json.dumps(EVENTS).encode('utf-8'))
+        with requests_mock.mock() as m:
+            m.get(TELEMETRY_URL, body=io.BytesIO(body), headers={'Content-Encoding': 'gzip'})
+            positions = list(Client().telemetry(TELEMETRY_URL, event_types=['LogPlayerPosition'], raw=True))
+
+        assert positions == [EVENTS[1], EVENTS[3]]
+        assert m.last_request.headers['Accept-Encoding'] == 'gzip'